@@ -13,22 +13,111 @@ Categories:
 - general_purpose_and_other_tasks: General purpose metrics (5 evaluators)
 
 Total: 29 evaluators across 6 categories
+
+Every evaluator inherits from BaseEvaluator, which adds batch evaluation
+(aevaluate_many / evaluate_batch) on top of the per-sample evaluate().
+
+Infrastructure:
+- runner: EvaluationRunner runs several evaluators over one dataset concurrently
+- parallel: CPUExecutor moves CPU-bound (non-LLM) evaluators onto a worker pool
+- pipeline: Streaming JSONL evaluation with incremental result writing
+- cache / llm_cache: Persistent SQLite cache and LLM judge response caching
+- embedding_cache: Memory-mapped embedding store shared across processes
+- claims: ClaimStore shares claim decompositions between claim-based evaluators
+- rate_limiter: Process-wide token-bucket limiter with AIMD concurrency for judge LLMs
+- fake_backend: Deterministic offline stand-in for Azure OpenAI chat and embeddings
+- bench: Per-evaluator throughput/latency benchmarks (python -m evaluators.bench)
+- checkpoint: Journaled evaluation runs that resume(run_id) after a crash
+- incremental: Re-evaluates only the cells whose sample fields or evaluator config changed
+- natural_language_comparison.bleu: Batch sentence and corpus BLEU, streamable over chunks
+- natural_language_comparison.rouge: Batch ROUGE-1/2/L with bit-parallel LCS
+- natural_language_comparison.string_similarity: String similarity matrices (rapidfuzz cdist)
+- natural_language_comparison.phrase_matcher: Aho-Corasick multi-phrase presence checks
+- natural_language_comparison.exact_match: Dataset-level exact match as an interned hash join
+- agents_and_tools.tool_calls: Tool call interning, batch multiset F1 and ordered sequence alignment
+- agents_and_tools.topic_filter: Embedding pre-filter that sends only ambiguous turns to the topic judge
+- agents_and_tools.trajectory: Token-budgeted compaction of agent traces for judge prompts
+- retrieval_augmented_generation.ranking: Vectorized precision@k, AP, recall, MRR and nDCG, and per-cutoff curves
+- retrieval_augmented_generation.chunk_verdicts: Per-(question, chunk) LLM verdict cache for context precision
+
+Everything is loaded lazily: importing this package does not import any
+category or evaluator module until it is first used. Use get() to create an
+evaluator by name:
+
+    import evaluators
+    evaluator = evaluators.get("faithfulness", llm=llm)
 """
 
-from . import (
-    retrieval_augmented_generation,
-    nvidia_metrics,
-    agents_and_tools,
-    natural_language_comparison,
-    sql_metrics,
-    general_purpose_and_other_tasks,
-)
-
-__all__ = [
-    "retrieval_augmented_generation",
-    "nvidia_metrics",
-    "agents_and_tools",
-    "natural_language_comparison",
-    "sql_metrics",
-    "general_purpose_and_other_tasks",
-]
+from .registry import available, get, lazy_exports, register
+
+# Attribute name -> module providing it, imported on first access
+_EXPORTS = {
+    "BaseEvaluator": ".base",
+    "EvaluationResult": ".base",
+    "EvaluationRunner": ".runner",
+    "run_evaluators": ".runner",
+    "CPUExecutor": ".parallel",
+    "evaluate_in_pool": ".parallel",
+    "iter_jsonl": ".pipeline",
+    "stream_evaluate": ".pipeline",
+    "astream_evaluate": ".pipeline",
+    "iter_results": ".pipeline",
+    "DiskCache": ".cache",
+    "make_key": ".cache",
+    "CachedLLM": ".llm_cache",
+    "with_llm_cache": ".llm_cache",
+    "EmbeddingStore": ".embedding_cache",
+    "CachedEmbeddings": ".embedding_cache",
+    "with_embedding_cache": ".embedding_cache",
+    "ClaimStore": ".claims",
+    "get_default_claim_store": ".claims",
+    "set_default_claim_store": ".claims",
+    "AdaptiveRateLimiter": ".rate_limiter",
+    "RateLimitedLLM": ".rate_limiter",
+    "rate_limiting_enabled": ".rate_limiter",
+    "get_rate_limiter": ".rate_limiter",
+    "set_rate_limiter": ".rate_limiter",
+    "with_rate_limit": ".rate_limiter",
+    "CheckpointedRun": ".checkpoint",
+    "resume": ".checkpoint",
+    "list_runs": ".checkpoint",
+    "IncrementalRunner": ".incremental",
+    "evaluator_fingerprint": ".incremental",
+    "sample_fingerprint": ".incremental",
+    "BLEUAccumulator": ".natural_language_comparison.bleu",
+    "sentence_bleu": ".natural_language_comparison.bleu",
+    "corpus_bleu": ".natural_language_comparison.bleu",
+    "rouge_scores": ".natural_language_comparison.rouge",
+    "lcs_length": ".natural_language_comparison.rouge",
+    "similarity_matrix": ".natural_language_comparison.string_similarity",
+    "pairwise_similarity": ".natural_language_comparison.string_similarity",
+    "PhraseMatcher": ".natural_language_comparison.phrase_matcher",
+    "TextNormalizer": ".natural_language_comparison.exact_match",
+    "exact_match": ".natural_language_comparison.exact_match",
+    "match_any": ".natural_language_comparison.exact_match",
+    "tool_call_f1": ".agents_and_tools.tool_calls",
+    "ToolCallEncoder": ".agents_and_tools.tool_calls",
+    "canonical_arguments": ".agents_and_tools.tool_calls",
+    "tool_call_alignment": ".agents_and_tools.tool_calls",
+    "classify_turns": ".agents_and_tools.topic_filter",
+    "conversation_turns": ".agents_and_tools.topic_filter",
+    "adherence_scores": ".agents_and_tools.topic_filter",
+    "TrajectoryCompactor": ".agents_and_tools.trajectory",
+    "render_trajectory": ".agents_and_tools.trajectory",
+    "id_ranking_metrics": ".retrieval_augmented_generation.ranking",
+    "ranking_metrics": ".retrieval_augmented_generation.ranking",
+    "ranking_curves": ".retrieval_augmented_generation.ranking",
+    "ChunkVerdictStore": ".retrieval_augmented_generation.chunk_verdicts",
+    "get_default_verdict_store": ".retrieval_augmented_generation.chunk_verdicts",
+    "set_default_verdict_store": ".retrieval_augmented_generation.chunk_verdicts",
+    "retrieval_augmented_generation": ".retrieval_augmented_generation",
+    "nvidia_metrics": ".nvidia_metrics",
+    "agents_and_tools": ".agents_and_tools",
+    "natural_language_comparison": ".natural_language_comparison",
+    "sql_metrics": ".sql_metrics",
+    "general_purpose_and_other_tasks": ".general_purpose_and_other_tasks",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = ["get", "available", "register", *_EXPORTS]
@@ -8,14 +8,16 @@ Metrics for evaluating agent and tool use quality:
 - Agent Goal Accuracy: Goal achievement evaluation
 """
 
-from .topic_adherence_evaluator import create_topic_adherence_evaluator
-from .tool_call_accuracy_evaluator import create_tool_call_accuracy_evaluator
-from .tool_call_f1_evaluator import create_tool_call_f1_evaluator
-from .agent_goal_accuracy_evaluator import create_agent_goal_accuracy_evaluator
+from ..registry import lazy_exports
 
-__all__ = [
-    "create_topic_adherence_evaluator",
-    "create_tool_call_accuracy_evaluator",
-    "create_tool_call_f1_evaluator",
-    "create_agent_goal_accuracy_evaluator",
-]
+# Factory name -> module defining it, imported on first access
+_EXPORTS = {
+    "create_topic_adherence_evaluator": ".topic_adherence_evaluator",
+    "create_tool_call_accuracy_evaluator": ".tool_call_accuracy_evaluator",
+    "create_tool_call_f1_evaluator": ".tool_call_f1_evaluator",
+    "create_agent_goal_accuracy_evaluator": ".agent_goal_accuracy_evaluator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -3,12 +3,22 @@ Agent Goal Accuracy Evaluator
 
 Measures how accurately the agent achieves the specified goal.
 Evaluates whether the agent's final output/state satisfies the original objective.
+
+The conversation is compacted before the judge call (see ``trajectory``):
+tool outputs are cleaned, deduplicated and truncated, and the trace is held
+to a token budget. Compactions are cached per trace.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from ..base import BaseEvaluator, get_sample_field
+
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    from .trajectory import TrajectoryCompactor
 
 
-class AgentGoalAccuracyEvaluator:
+class AgentGoalAccuracyEvaluator(BaseEvaluator):
     """
     Agent Goal Accuracy metric evaluator.
     
@@ -16,14 +26,55 @@ class AgentGoalAccuracyEvaluator:
     evaluating the correctness of the final outcome.
     """
     
-    def __init__(self, llm=None):
+    metric_name = "agent_goal_accuracy"
+    sample_fields = ("user_input", "reference", "goal", "response")
+    
+    def __init__(self, llm=None, compactor: Optional["TrajectoryCompactor"] = None,
+                 max_tokens: Optional[int] = 4000, max_tool_chars: int = 2000, cache=None):
         """
         Initialize Agent Goal Accuracy Evaluator.
         
         Args:
             llm: Language model for evaluation
+            compactor: Trajectory compactor to use (e.g. shared between evaluators);
+                overrides the settings below
+            max_tokens: Token budget per trace (None: no budget)
+            max_tool_chars: Characters kept per tool output
+            cache: Optional DiskCache for compactions across runs
         """
         self.llm = llm
+        if compactor is None:
+            # Imported here so importing the evaluator stays cheap
+            from .trajectory import TrajectoryCompactor
+
+            compactor = TrajectoryCompactor(max_tokens=max_tokens, max_tool_chars=max_tool_chars, cache=cache)
+        self.compactor = compactor
+        # Mirrored so result fingerprints change with the compaction settings
+        self.compaction = compactor.settings
+
+    def trajectory(self, sample) -> str:
+        """
+        Compacted transcript of a sample, as sent to the judge.
+
+        Args:
+            sample: Agent sample (messages in user_input, or a goal / request
+                string and a response)
+
+        Returns:
+            str: Rendered trajectory
+        """
+        from .trajectory import render_trajectory
+
+        user_input = get_sample_field(sample, "user_input")
+        if isinstance(user_input, (list, tuple)):
+            messages = list(user_input)
+        else:
+            request = user_input or get_sample_field(sample, "goal") or ""
+            messages = [{"role": "human", "content": request}]
+            response = get_sample_field(sample, "response")
+            if response:
+                messages.append({"role": "ai", "content": response})
+        return render_trajectory(self.compactor.compact(messages))
     
     async def evaluate(self, sample):
         """
@@ -32,7 +83,7 @@ class AgentGoalAccuracyEvaluator:
         Args:
             sample: Agent sample with:
                 - goal: The stated goal
-                - user_input: Original task
+                - user_input: Original task, or the whole conversation
                 - final_output: Agent's final result
                 - ground_truth: Expected result
         
@@ -51,18 +102,36 @@ class AgentGoalAccuracyEvaluator:
         3. Verify goal was achieved correctly
         4. Return accuracy score
         """
-        # Implementation for agent goal accuracy
+        return await self._judge_goal(self.trajectory(sample), get_sample_field(sample, "reference"))
+
+    async def _judge_goal(self, trajectory: str, reference: Optional[str]) -> Optional[float]:
+        """
+        Ask the LLM whether the compacted trajectory achieved the goal.
+
+        Process:
+        1. Infer the user's goal and the end state from the trajectory
+        2. Compare the end state with the reference outcome (or the inferred goal)
+        3. Return 1.0 if achieved, 0.0 otherwise
+        """
+        # Implementation would use the ragas goal accuracy prompt
         pass
 
 
-def create_agent_goal_accuracy_evaluator(llm=None):
+def create_agent_goal_accuracy_evaluator(llm=None, compactor=None, max_tokens: Optional[int] = 4000,
+                                         max_tool_chars: int = 2000, cache=None):
     """
     Factory function to create an Agent Goal Accuracy evaluator.
     
     Args:
         llm: Language model instance
+        compactor: Trajectory compactor to use
+        max_tokens: Token budget per trace
+        max_tool_chars: Characters kept per tool output
+        cache: Optional DiskCache for compactions
     
     Returns:
         AgentGoalAccuracyEvaluator: Configured evaluator instance
     """
-    return AgentGoalAccuracyEvaluator(llm=llm)
+    return AgentGoalAccuracyEvaluator(
+        llm=llm, compactor=compactor, max_tokens=max_tokens, max_tool_chars=max_tool_chars, cache=cache,
+    )
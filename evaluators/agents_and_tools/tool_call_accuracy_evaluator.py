@@ -3,12 +3,18 @@ Tool Call Accuracy Evaluator
 
 Measures the accuracy of tool calls made by the agent. Evaluates whether
 the agent selected the correct tools and provided appropriate parameters.
+
+Arguments are canonicalized once per call and calls are compared as integer
+ids. With ``strict_order`` the predicted sequence is aligned to the reference
+by LCS, otherwise as a multiset (see ``tool_calls``).
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
+
+from ..base import BaseEvaluator, get_sample_field
 
 
-class ToolCallAccuracyEvaluator:
+class ToolCallAccuracyEvaluator(BaseEvaluator):
     """
     Tool Call Accuracy metric evaluator for Agents.
     
@@ -16,14 +22,29 @@ class ToolCallAccuracyEvaluator:
     with appropriate parameters for solving tasks.
     """
     
-    def __init__(self, llm=None):
+    metric_name = "tool_call_accuracy"
+    sample_fields = ("user_input", "tool_calls", "reference_tool_calls", "expected_tools")
+    
+    def __init__(self, llm=None, strict_order: bool = True, with_arguments: bool = True):
         """
         Initialize Tool Call Accuracy Evaluator.
         
         Args:
             llm: Language model for evaluation
+            strict_order: Require calls in the reference order
+            with_arguments: Require matching arguments as well as tool names
         """
         self.llm = llm
+        self.strict_order = strict_order
+        self.with_arguments = with_arguments
+
+    @staticmethod
+    def _calls(sample):
+        """Predicted and reference tool calls of a sample."""
+        reference = get_sample_field(sample, "reference_tool_calls")
+        if reference is None:
+            reference = get_sample_field(sample, "expected_tools")
+        return get_sample_field(sample, "tool_calls") or [], reference or []
     
     async def evaluate(self, sample):
         """
@@ -37,7 +58,7 @@ class ToolCallAccuracyEvaluator:
                 - ground_truth: Expected behavior/result
         
         Returns:
-            float: Accuracy score
+            float: Matched calls / length of the longer sequence
         """
         return await self._evaluate_accuracy(sample)
     
@@ -51,18 +72,44 @@ class ToolCallAccuracyEvaluator:
         3. Validate tool call sequence
         4. Calculate accuracy
         """
-        # Implementation for tool call accuracy
-        pass
+        # Imported here so importing the evaluator stays cheap
+        from .tool_calls import tool_call_alignment
+
+        predicted, reference = self._calls(sample)
+        result = tool_call_alignment([predicted], [reference], self.strict_order, self.with_arguments)
+        return float(result["accuracy"][0])
+
+    def evaluate_corpus(self, samples: Iterable) -> Dict[str, Any]:
+        """
+        Score a whole dataset at once.
+
+        Args:
+            samples: Agent samples
+
+        Returns:
+            Dict[str, Any]: Per-sample "matched", "distance" and "accuracy"
+                arrays and "mean_accuracy" (see tool_calls.tool_call_alignment)
+        """
+        from .tool_calls import tool_call_alignment
+
+        predicted, reference = [], []
+        for sample in samples:
+            calls, expected = self._calls(sample)
+            predicted.append(calls)
+            reference.append(expected)
+        return tool_call_alignment(predicted, reference, self.strict_order, self.with_arguments)
 
 
-def create_tool_call_accuracy_evaluator(llm=None):
+def create_tool_call_accuracy_evaluator(llm=None, strict_order: bool = True, with_arguments: bool = True):
     """
     Factory function to create a Tool Call Accuracy evaluator.
     
     Args:
         llm: Language model instance
+        strict_order: Require calls in the reference order
+        with_arguments: Match tool arguments as well as names
     
     Returns:
         ToolCallAccuracyEvaluator: Configured evaluator instance
     """
-    return ToolCallAccuracyEvaluator(llm=llm)
+    return ToolCallAccuracyEvaluator(llm=llm, strict_order=strict_order, with_arguments=with_arguments)
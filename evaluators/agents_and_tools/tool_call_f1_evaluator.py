@@ -10,12 +10,18 @@ Formula:
 Where:
     Precision = # correct tool calls / total tool calls
     Recall = # correct tool calls / expected tool calls
+
+Calls are compared as multisets of tool names (or of name + arguments with
+``with_arguments``). ``evaluate_corpus`` scores a whole dataset at once and
+adds micro- and macro-averaged F1 (see ``tool_calls``).
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
+
+from ..base import BaseEvaluator, get_sample_field
 
 
-class ToolCallF1Evaluator:
+class ToolCallF1Evaluator(BaseEvaluator):
     """
     Tool Call F1 metric evaluator for Agents.
     
@@ -23,14 +29,27 @@ class ToolCallF1Evaluator:
     of tool selection and execution.
     """
     
-    def __init__(self, llm=None):
+    metric_name = "tool_call_f1"
+    sample_fields = ("user_input", "tool_calls", "reference_tool_calls", "expected_tool_calls")
+    
+    def __init__(self, llm=None, with_arguments: bool = False):
         """
         Initialize Tool Call F1 Evaluator.
         
         Args:
             llm: Language model for evaluation
+            with_arguments: Count a call as correct only if its arguments match too
         """
         self.llm = llm
+        self.with_arguments = with_arguments
+
+    @staticmethod
+    def _calls(sample):
+        """Predicted and reference tool calls of a sample."""
+        reference = get_sample_field(sample, "reference_tool_calls")
+        if reference is None:
+            reference = get_sample_field(sample, "expected_tool_calls")
+        return get_sample_field(sample, "tool_calls") or [], reference or []
     
     async def evaluate(self, sample):
         """
@@ -56,18 +75,42 @@ class ToolCallF1Evaluator:
         2. Calculate recall: # correct calls / expected calls
         3. Calculate F1: 2 × (P × R) / (P + R)
         """
-        # Implementation for tool call F1
-        pass
+        # Imported here so importing the evaluator stays cheap
+        from .tool_calls import tool_call_f1
+
+        predicted, reference = self._calls(sample)
+        return float(tool_call_f1([predicted], [reference], self.with_arguments)["f1"][0])
+
+    def evaluate_corpus(self, samples: Iterable) -> Dict[str, Any]:
+        """
+        Score a whole dataset at once.
+
+        Args:
+            samples: Agent samples
+
+        Returns:
+            Dict[str, Any]: Per-sample "precision", "recall", "f1" arrays and
+                dataset-level "micro_f1" / "macro_f1" (see tool_calls.tool_call_f1)
+        """
+        from .tool_calls import tool_call_f1
+
+        predicted, reference = [], []
+        for sample in samples:
+            calls, expected = self._calls(sample)
+            predicted.append(calls)
+            reference.append(expected)
+        return tool_call_f1(predicted, reference, self.with_arguments)
 
 
-def create_tool_call_f1_evaluator(llm=None):
+def create_tool_call_f1_evaluator(llm=None, with_arguments: bool = False):
     """
     Factory function to create a Tool Call F1 evaluator.
     
     Args:
         llm: Language model instance
+        with_arguments: Match tool arguments as well as names
     
     Returns:
         ToolCallF1Evaluator: Configured evaluator instance
     """
-    return ToolCallF1Evaluator(llm=llm)
+    return ToolCallF1Evaluator(llm=llm, with_arguments=with_arguments)
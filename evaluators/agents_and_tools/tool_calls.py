@@ -0,0 +1,277 @@
+"""
+Tool Call Encoding and Batch F1
+
+Tool calls arrive as names ("search_flights"), dictionaries
+({"name": ..., "args": {...}}) or ragas ``ToolCall`` objects. This module
+reduces them to integer ids once, so metrics over millions of traces are
+NumPy array operations:
+
+- canonical_arguments: Sorted-key JSON with normalized numbers (1 == 1.0),
+  so equal arguments get equal ids regardless of key order or formatting
+- ToolCallEncoder: Interns tool names, or (name, arguments) pairs, as ids
+- tool_call_f1: Multiset precision / recall / F1 per trace plus micro- and
+  macro-averaged F1 for the dataset, from ``np.unique`` / ``bincount``
+  counting over ragged (CSR) id arrays
+- tool_call_alignment: Ordered (bit-parallel LCS over call ids) or
+  any-order (multiset) alignment of predicted and reference sequences
+"""
+
+import json
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..natural_language_comparison.rouge import lcs_length
+
+
+def tool_call_parts(call) -> Tuple[str, Any]:
+    """
+    Split a tool call into name and arguments.
+
+    Args:
+        call: Name string, dict with "name" / "tool" and "args" / "arguments" /
+            "params", or an object with ``name`` and ``args`` attributes
+
+    Returns:
+        Tuple[str, Any]: Tool name and arguments (None if absent)
+    """
+    if isinstance(call, str):
+        return call, None
+    if isinstance(call, dict):
+        name = call.get("name", call.get("tool", ""))
+        for field in ("args", "arguments", "params"):
+            if field in call:
+                return name, call[field]
+        return name, None
+    return getattr(call, "name", ""), getattr(call, "args", None)
+
+
+def _normalize_value(value):
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        number = float(value)
+        return int(number) if number.is_integer() else number
+    if isinstance(value, dict):
+        return {str(k): _normalize_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(v) for v in value]
+    return value
+
+
+def canonical_arguments(args) -> str:
+    """
+    Canonical text of tool call arguments.
+
+    JSON-encoded argument strings (as returned by OpenAI tool calls) are
+    decoded first. Keys are sorted and integral floats become integers.
+
+    Args:
+        args: Arguments (dict, JSON string or None)
+
+    Returns:
+        str: Canonical JSON
+    """
+    if isinstance(args, str):
+        try:
+            args = json.loads(args)
+        except ValueError:
+            pass
+    return json.dumps(
+        _normalize_value(args), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+
+
+class ToolCallEncoder:
+    """
+    Interns tool calls as dense integer ids.
+
+    Attributes:
+        with_arguments: Whether arguments are part of a call's identity
+        ids: Key (name, or (name, canonical arguments)) -> id
+    """
+
+    def __init__(self, with_arguments: bool = False):
+        """
+        Initialize Tool Call Encoder.
+
+        Args:
+            with_arguments: Distinguish calls to the same tool with different arguments
+        """
+        self.with_arguments = with_arguments
+        self.ids: Dict[Any, int] = {}
+
+    def key(self, call):
+        """Identity of one call under this encoder."""
+        name, args = tool_call_parts(call)
+        return (name, canonical_arguments(args)) if self.with_arguments else name
+
+    def encode_call(self, call) -> int:
+        """Id of one call (interned on first sight)."""
+        return self.ids.setdefault(self.key(call), len(self.ids))
+
+    def encode(self, traces: Iterable[Optional[Sequence]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode a batch of traces as a ragged array.
+
+        Args:
+            traces: Tool call lists (None counts as empty)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Flat call ids and row offsets
+        """
+        traces = [trace or () for trace in traces]
+        offsets = np.zeros(len(traces) + 1, dtype=np.int64)
+        np.cumsum([len(trace) for trace in traces], out=offsets[1:])
+        calls = list(chain.from_iterable(traces))
+        # Plain tool names are their own keys; skip per-call parsing for them
+        if self.with_arguments or not set(map(type, calls)) <= {str}:
+            calls = list(map(self.key, calls))
+        ids = self.ids
+        for key in dict.fromkeys(calls):
+            ids.setdefault(key, len(ids))
+        return np.fromiter(map(ids.__getitem__, calls), dtype=np.int64, count=len(calls)), offsets
+
+
+def multiset_intersection(
+    left_ids: np.ndarray,
+    left_offsets: np.ndarray,
+    right_ids: np.ndarray,
+    right_offsets: np.ndarray,
+) -> np.ndarray:
+    """
+    Size of the multiset intersection of aligned ragged rows.
+
+    Args:
+        left_ids, left_offsets: First ragged batch
+        right_ids, right_offsets: Second ragged batch (same number of rows)
+
+    Returns:
+        np.ndarray: Matches per row (a call counts at most as often as in both rows)
+    """
+    rows = len(left_offsets) - 1
+    width = int(max(left_ids.max(initial=-1), right_ids.max(initial=-1))) + 1
+    # One key per (row, call id); counting keys gives per-row multiplicities
+    left_keys = np.repeat(np.arange(rows, dtype=np.int64), np.diff(left_offsets)) * width + left_ids
+    right_keys = np.repeat(np.arange(rows, dtype=np.int64), np.diff(right_offsets)) * width + right_ids
+    left_unique, left_counts = np.unique(left_keys, return_counts=True)
+    right_unique, right_counts = np.unique(right_keys, return_counts=True)
+    common, in_left, in_right = np.intersect1d(left_unique, right_unique, assume_unique=True, return_indices=True)
+    return np.bincount(
+        common // max(width, 1),
+        weights=np.minimum(left_counts[in_left], right_counts[in_right]),
+        minlength=rows,
+    ).astype(np.int64)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    numerator = np.asarray(numerator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=np.asarray(denominator) > 0)
+
+
+def tool_call_f1(
+    predicted: Sequence[Optional[Sequence]],
+    reference: Sequence[Optional[Sequence]],
+    with_arguments: bool = False,
+) -> Dict[str, Any]:
+    """
+    Multiset tool call precision, recall and F1 for a dataset.
+
+    Traces with no predicted (or no reference) calls get precision (or
+    recall) 0, as in ragas ``ToolCallF1``.
+
+    Args:
+        predicted: Tool calls made, one list per sample
+        reference: Expected tool calls, one list per sample
+        with_arguments: Count a call as correct only if its arguments match too
+
+    Returns:
+        Dict[str, Any]: Per-sample "precision", "recall", "f1" arrays and
+            dataset-level "micro_precision", "micro_recall", "micro_f1", "macro_f1"
+    """
+    if len(predicted) != len(reference):
+        raise ValueError(f"Got {len(predicted)} predicted traces but {len(reference)} reference traces")
+    encoder = ToolCallEncoder(with_arguments=with_arguments)
+    predicted_ids, predicted_offsets = encoder.encode(predicted)
+    reference_ids, reference_offsets = encoder.encode(reference)
+
+    matches = multiset_intersection(predicted_ids, predicted_offsets, reference_ids, reference_offsets)
+    predicted_total = np.diff(predicted_offsets)
+    reference_total = np.diff(reference_offsets)
+
+    precision = _ratio(matches, predicted_total)
+    recall = _ratio(matches, reference_total)
+    f1 = _ratio(2 * precision * recall, precision + recall)
+
+    micro_precision = float(_ratio(matches.sum(), predicted_total.sum()))
+    micro_recall = float(_ratio(matches.sum(), reference_total.sum()))
+    micro_f1 = float(_ratio(2 * micro_precision * micro_recall, micro_precision + micro_recall))
+    return {
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "micro_precision": micro_precision,
+        "micro_recall": micro_recall,
+        "micro_f1": micro_f1,
+        "macro_f1": float(f1.mean()) if len(f1) else 0.0,
+    }
+
+
+def tool_call_alignment(
+    predicted: Sequence[Optional[Sequence]],
+    reference: Sequence[Optional[Sequence]],
+    strict_order: bool = True,
+    with_arguments: bool = True,
+) -> Dict[str, Any]:
+    """
+    Align predicted and reference tool call sequences for a dataset.
+
+    A predicted call matches a reference call when the names (and canonical
+    arguments) are equal. With ``strict_order`` the matched calls must also
+    appear in the same order, so the match count is the LCS of the two id
+    sequences; otherwise it is their multiset intersection. Accuracy divides
+    by the longer sequence, so both missing and extra calls cost. Two empty
+    sequences agree fully.
+
+    Args:
+        predicted: Tool calls made, one list per sample
+        reference: Expected tool calls, one list per sample
+        strict_order: Require matched calls to keep the reference order
+        with_arguments: Count a call as matching only if its arguments match too
+
+    Returns:
+        Dict[str, Any]: Per-sample "matched" counts, "distance" (insertions +
+            deletions to turn one sequence into the other) and "accuracy"
+            arrays, and the dataset "mean_accuracy"
+    """
+    if len(predicted) != len(reference):
+        raise ValueError(f"Got {len(predicted)} predicted traces but {len(reference)} reference traces")
+    encoder = ToolCallEncoder(with_arguments=with_arguments)
+    predicted_ids, predicted_offsets = encoder.encode(predicted)
+    reference_ids, reference_offsets = encoder.encode(reference)
+    predicted_total = np.diff(predicted_offsets)
+    reference_total = np.diff(reference_offsets)
+
+    if strict_order:
+        left, right = predicted_ids.tolist(), reference_ids.tolist()
+        left_bounds, right_bounds = predicted_offsets.tolist(), reference_offsets.tolist()
+        matched = np.fromiter(
+            (
+                lcs_length(left[left_bounds[row]:left_bounds[row + 1]], right[right_bounds[row]:right_bounds[row + 1]])
+                for row in range(len(predicted_total))
+            ),
+            dtype=np.int64,
+            count=len(predicted_total),
+        )
+    else:
+        matched = multiset_intersection(predicted_ids, predicted_offsets, reference_ids, reference_offsets)
+
+    longest = np.maximum(predicted_total, reference_total)
+    accuracy = np.where(longest > 0, _ratio(matched, longest), 1.0)
+    return {
+        "matched": matched,
+        "distance": predicted_total + reference_total - 2 * matched,
+        "accuracy": accuracy,
+        "mean_accuracy": float(accuracy.mean()) if len(accuracy) else 0.0,
+    }
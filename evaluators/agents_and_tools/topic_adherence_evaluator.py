@@ -3,12 +3,18 @@ Topic Adherence Evaluator
 
 Measures whether the agent/tool stays focused on the given topic during execution.
 Evaluates if the agent diverges from the main topic or maintains topical coherence.
+
+With ``embeddings``, turns are pre-filtered by cosine similarity to the
+reference topics and only the ambiguous band is sent to the LLM (see
+``topic_filter``). Precision, recall and F1 come from the same verdicts.
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..base import BaseEvaluator, get_sample_field
 
 
-class TopicAdherenceEvaluator:
+class TopicAdherenceEvaluator(BaseEvaluator):
     """
     Topic Adherence metric evaluator for Agents.
     
@@ -16,14 +22,53 @@ class TopicAdherenceEvaluator:
     throughout the conversation or task execution.
     """
     
-    def __init__(self, llm=None):
+    metric_name = "topic_adherence"
+    sample_fields = ("user_input", "response", "reference_topics", "topic")
+    
+    def __init__(self, llm=None, embeddings=None, mode: str = "f1", lower: float = 0.25,
+                 upper: float = 0.55, refusal_phrases: Optional[Sequence[str]] = None,
+                 max_concurrency: int = 16):
         """
         Initialize Topic Adherence Evaluator.
         
         Args:
             llm: Language model for analysis
+            embeddings: Embeddings for the pre-filter (None: the LLM judges every turn)
+            mode: Reported score, 'precision', 'recall' or 'f1'
+            lower: Similarity at or below which a turn is off-topic without the LLM
+            upper: Similarity at or above which a turn is on-topic without the LLM
+            refusal_phrases: Phrases marking a reply as a refusal
+                (default: topic_filter.DEFAULT_REFUSAL_PHRASES)
+            max_concurrency: Concurrent LLM classifications
         """
+        if mode not in ("precision", "recall", "f1"):
+            raise ValueError(f"Unknown mode: {mode}")
         self.llm = llm
+        self.embeddings = embeddings
+        self.mode = mode
+        self.lower = lower
+        self.upper = upper
+        self.refusal_phrases = refusal_phrases
+        self.max_concurrency = max_concurrency
+        self._judged = 0
+        self._prefiltered = 0
+        self._refusals = None
+
+    def _turns(self, sample) -> Tuple[List[str], Tuple[str, ...], List[bool]]:
+        """Turn texts, reference topics and answered flags of a sample."""
+        # Imported here so importing the evaluator stays cheap
+        from .topic_filter import DEFAULT_REFUSAL_PHRASES, conversation_turns, refusal_matcher, turn_text
+
+        if self._refusals is None:
+            self._refusals = refusal_matcher(self.refusal_phrases or DEFAULT_REFUSAL_PHRASES)
+        topics = get_sample_field(sample, "reference_topics")
+        if topics is None:
+            topics = get_sample_field(sample, "topic")
+        topics = (topics,) if isinstance(topics, str) else tuple(topics or ())
+        turns = conversation_turns(get_sample_field(sample, "user_input"), get_sample_field(sample, "response"))
+        texts = [turn_text(request, reply) for request, reply in turns]
+        answered = [not self._refusals.matches(reply) for _, reply in turns]
+        return texts, topics, answered
     
     async def evaluate(self, sample):
         """
@@ -31,12 +76,12 @@ class TopicAdherenceEvaluator:
         
         Args:
             sample: Agent sample with:
-                - topic: The specified topic
-                - response: Agent's response
-                - intermediate_steps: Agent's intermediate steps/thoughts
+                - user_input: Conversation messages (or the request)
+                - reference_topics: Allowed topics (or a single topic)
+                - response: Agent's response (single-request samples)
         
         Returns:
-            float: Adherence score
+            float: Adherence precision, recall or F1 (per ``mode``)
         """
         return await self._evaluate_adherence(sample)
     
@@ -50,18 +95,94 @@ class TopicAdherenceEvaluator:
         3. Measure deviation from topic
         4. Return adherence score
         """
-        # Implementation for topic adherence
+        result = await self.aevaluate_corpus([sample])
+        return float(result[self.mode][0])
+
+    async def _classify_turn(self, text: str, topics: Sequence[str]) -> Optional[bool]:
+        """
+        Ask the LLM whether a turn is about one of the reference topics.
+
+        Process:
+        1. Prompt the LLM with the turn and the reference topics
+        2. Parse the yes/no classification
+        3. Return True (on-topic), False, or None if no verdict was given
+           (``classify_turns`` raises rather than guessing a score)
+        """
+        # Implementation would use the ragas topic classification prompt
         pass
 
+    async def aevaluate_corpus(self, samples: Iterable) -> Dict[str, Any]:
+        """
+        Score a whole dataset in one pass.
+
+        Turns and topics of all samples are embedded together, and each
+        distinct ambiguous (turn, topics) pair is classified once.
+
+        Args:
+            samples: Agent samples
+
+        Returns:
+            Dict[str, Any]: Per-sample "precision", "recall" and "f1" arrays,
+                plus "judged" (turns sent to the LLM) and "prefiltered"
+                (turns decided by embeddings)
+
+        Raises:
+            ValueError: If the LLM gives no verdict for an ambiguous turn
+        """
+        import numpy as np
+
+        from .topic_filter import adherence_scores, classify_turns
+
+        texts: List[str] = []
+        topic_sets: List[Tuple[str, ...]] = []
+        answered: List[bool] = []
+        bounds = [0]
+        for sample in samples:
+            sample_texts, topics, sample_answered = self._turns(sample)
+            texts.extend(sample_texts)
+            topic_sets.extend([topics] * len(sample_texts))
+            answered.extend(sample_answered)
+            bounds.append(len(texts))
+
+        on_topic, judged = await classify_turns(
+            texts, topic_sets, self._classify_turn, embeddings=self.embeddings,
+            lower=self.lower, upper=self.upper, max_concurrency=self.max_concurrency,
+        )
+        answered = np.asarray(answered, dtype=bool)
+        scores = [
+            adherence_scores(on_topic[start:end], answered[start:end])
+            for start, end in zip(bounds, bounds[1:])
+        ]
+        judged_count = int(judged.sum())
+        self._judged += judged_count
+        self._prefiltered += len(texts) - judged_count
+        result: Dict[str, Any] = {
+            name: np.array([score[name] for score in scores]) for name in ("precision", "recall", "f1")
+        }
+        result["judged"] = judged_count
+        result["prefiltered"] = len(texts) - judged_count
+        return result
+
 
-def create_topic_adherence_evaluator(llm=None):
+def create_topic_adherence_evaluator(llm=None, embeddings=None, mode: str = "f1", lower: float = 0.25,
+                                     upper: float = 0.55, refusal_phrases: Optional[Sequence[str]] = None,
+                                     max_concurrency: int = 16):
     """
     Factory function to create a Topic Adherence evaluator.
     
     Args:
         llm: Language model instance
+        embeddings: Embeddings for the similarity pre-filter
+        mode: 'precision', 'recall' or 'f1'
+        lower: Off-topic similarity threshold
+        upper: On-topic similarity threshold
+        refusal_phrases: Phrases marking a refusal
+        max_concurrency: Concurrent LLM classifications
     
     Returns:
         TopicAdherenceEvaluator: Configured evaluator instance
     """
-    return TopicAdherenceEvaluator(llm=llm)
+    return TopicAdherenceEvaluator(
+        llm=llm, embeddings=embeddings, mode=mode, lower=lower, upper=upper,
+        refusal_phrases=refusal_phrases, max_concurrency=max_concurrency,
+    )
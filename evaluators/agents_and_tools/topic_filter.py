@@ -0,0 +1,225 @@
+"""
+Topic Pre-Filter
+
+Two-stage on-topic classification of conversation turns for topic adherence:
+
+1. Embed every distinct turn and reference topic once (pass
+   ``with_embedding_cache(...)`` embeddings to reuse vectors across runs)
+   and take each turn's best cosine similarity to its reference topics
+2. Turns at or above ``upper`` are on-topic and turns at or below ``lower``
+   off-topic without asking anyone; only the ambiguous band in between goes
+   to the LLM judge, once per distinct (turn, topics) pair
+
+Refusals ("I'm sorry, I can't help with that") are found with a phrase
+matcher, so precision, recall and F1 all come out of the same verdicts:
+
+- precision: answered turns that are on-topic / answered turns
+- recall: on-topic turns that were answered / on-topic turns
+
+Thresholds depend on the embedding model; calibrate them on a labelled
+sample before relying on the pre-filter.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..natural_language_comparison.phrase_matcher import PhraseMatcher
+from .trajectory import message_parts
+
+
+TurnJudge = Callable[[str, Sequence[str]], Awaitable[Optional[bool]]]
+
+DEFAULT_REFUSAL_PHRASES = (
+    "i can't help",
+    "i cannot help",
+    "i can't assist",
+    "i cannot assist",
+    "i'm unable to",
+    "i am unable to",
+    "i'm not able to",
+    "i am not able to",
+    "i can only help with",
+    "i can only assist with",
+    "outside the scope",
+    "outside my scope",
+    "not something i can help",
+)
+
+
+def conversation_turns(user_input, response: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Split a conversation into (request, reply) turns.
+
+    Args:
+        user_input: List of messages (dicts with "role"/"type" and "content",
+            or ragas message objects), or a single request string
+        response: Reply to a single request
+
+    Returns:
+        List[Tuple[str, str]]: Each human message with the AI replies that
+            follow it (tool messages are skipped)
+    """
+    if not isinstance(user_input, (list, tuple)):
+        if not user_input and not response:
+            return []
+        return [(user_input or "", response or "")]
+
+    turns: List[Tuple[str, List[str]]] = []
+    for message in user_input:
+        role, content = message_parts(message)
+        if role == "human":
+            turns.append((content, []))
+        elif role == "ai" and content:
+            if not turns:
+                turns.append(("", []))
+            turns[-1][1].append(content)
+    return [(request, " ".join(replies)) for request, replies in turns]
+
+
+def turn_text(request: str, reply: str) -> str:
+    """Text whose topic is classified: the request, or the reply if there is none."""
+    return request or reply
+
+
+def refusal_matcher(phrases: Sequence[str] = DEFAULT_REFUSAL_PHRASES) -> PhraseMatcher:
+    """
+    Matcher for replies that decline to answer.
+
+    Args:
+        phrases: Refusal phrases (matched case-insensitively)
+
+    Returns:
+        PhraseMatcher: Matcher whose ``matches(reply)`` is non-empty for refusals
+    """
+    # Curly apostrophes are common in model output
+    return PhraseMatcher(
+        list(phrases) + [phrase.replace("'", "’") for phrase in phrases if "'" in phrase],
+        case_sensitive=False,
+    )
+
+
+async def _embed(embeddings, texts: List[str]) -> np.ndarray:
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    if hasattr(embeddings, "aembed_array"):
+        vectors = await embeddings.aembed_array(texts)
+    else:
+        vectors = await embeddings.aembed_documents(texts)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+async def topic_similarities(
+    embeddings,
+    texts: Sequence[str],
+    topic_sets: Sequence[Sequence[str]],
+) -> np.ndarray:
+    """
+    Best cosine similarity of each text to its reference topics.
+
+    Distinct texts and topics are embedded once each, in two batches.
+
+    Args:
+        embeddings: Embeddings instance (LangChain/ragas interface)
+        texts: Texts to classify
+        topic_sets: Reference topics of each text
+
+    Returns:
+        np.ndarray: Similarity per text (-1.0 for texts without topics)
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    unique_topics = list(dict.fromkeys(topic for topics in topic_sets for topic in topics))
+    text_vectors = await _embed(embeddings, unique_texts)
+    topic_vectors = await _embed(embeddings, unique_topics)
+    text_rows = {text: row for row, text in enumerate(unique_texts)}
+    topic_rows = {topic: row for row, topic in enumerate(unique_topics)}
+
+    similarity = np.full(len(texts), -1.0)
+    if not unique_topics:
+        return similarity
+    matrix = text_vectors @ topic_vectors.T
+    for index, (text, topics) in enumerate(zip(texts, topic_sets)):
+        if topics:
+            similarity[index] = matrix[text_rows[text], [topic_rows[t] for t in topics]].max()
+    return similarity
+
+
+async def classify_turns(
+    texts: Sequence[str],
+    topic_sets: Sequence[Sequence[str]],
+    judge: TurnJudge,
+    embeddings=None,
+    lower: float = 0.25,
+    upper: float = 0.55,
+    max_concurrency: int = 16,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decide which turns are on-topic, calling the judge only when needed.
+
+    Args:
+        texts: Turn texts
+        topic_sets: Reference topics of each turn
+        judge: Async LLM classifier returning True (on-topic) or False
+        embeddings: Embeddings for the pre-filter (None: judge every turn)
+        lower: Similarity at or below which a turn is off-topic
+        upper: Similarity at or above which a turn is on-topic
+        max_concurrency: Concurrent judge calls
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Boolean on-topic verdict and boolean
+            "sent to the judge" per turn
+
+    Raises:
+        ValueError: If the judge gives no verdict for a turn
+    """
+    if lower > upper:
+        raise ValueError(f"lower ({lower}) must not exceed upper ({upper})")
+    if embeddings is None:
+        similarity = np.full(len(texts), (lower + upper) / 2)
+        ambiguous = np.ones(len(texts), dtype=bool)
+    else:
+        similarity = await topic_similarities(embeddings, texts, topic_sets)
+        ambiguous = (similarity > lower) & (similarity < upper)
+    on_topic = similarity >= upper
+
+    pending: Dict[Tuple[str, Tuple[str, ...]], List[int]] = {}
+    for index in np.flatnonzero(ambiguous):
+        pending.setdefault((texts[index], tuple(topic_sets[index])), []).append(int(index))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def ask(text: str, topics: Tuple[str, ...]) -> Optional[bool]:
+        async with semaphore:
+            return await judge(text, topics)
+
+    verdicts = await asyncio.gather(*(ask(text, topics) for text, topics in pending))
+    for (text, _), indices, verdict in zip(pending, pending.values(), verdicts):
+        if verdict is None:
+            raise ValueError(f"Topic judge gave no verdict for turn: {text!r}")
+        on_topic[indices] = bool(verdict)
+    return on_topic, ambiguous
+
+
+def adherence_scores(on_topic: np.ndarray, answered: np.ndarray) -> Dict[str, float]:
+    """
+    Topic adherence precision, recall and F1 of one conversation.
+
+    Args:
+        on_topic: Boolean on-topic verdict per turn
+        answered: Boolean "the agent answered (did not refuse)" per turn
+
+    Returns:
+        Dict[str, float]: "precision", "recall" and "f1" (0.0 when undefined)
+    """
+    on_topic = np.asarray(on_topic, dtype=bool)
+    answered = np.asarray(answered, dtype=bool)
+    true_positive = int(np.sum(on_topic & answered))
+    answered_total = int(answered.sum())
+    on_topic_total = int(on_topic.sum())
+    precision = true_positive / answered_total if answered_total else 0.0
+    recall = true_positive / on_topic_total if on_topic_total else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
@@ -0,0 +1,305 @@
+"""
+Trajectory Compaction
+
+Agent traces sent to a judge are dominated by tool outputs: JSON blobs,
+HTML pages, the same lookup repeated five times. TrajectoryCompactor shrinks
+a trace before the judge call while keeping the turns a goal judgement
+depends on (every human message and the agent's final answer):
+
+1. Tool outputs are cleaned: JSON is re-serialized without whitespace and
+   HTML is reduced to its text
+2. A tool output identical to an earlier one is replaced by a reference to it
+3. Tool outputs longer than ``max_tool_chars`` keep their head and tail
+4. While the trace exceeds ``max_tokens``, the tool output limit is halved
+   (down to ``min_tool_chars``), then tool messages and intermediate agent
+   messages are dropped, oldest first, leaving an "omitted" marker
+
+Results are cached per (trace, settings) hash in memory and, optionally, in
+a DiskCache shared across runs.
+"""
+
+import hashlib
+import html
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..cache import DiskCache, MemoCache, make_key
+from .tool_calls import canonical_arguments, tool_call_parts
+
+
+Message = Dict[str, str]
+
+_ROLES = {"user": "human", "human": "human", "assistant": "ai", "ai": "ai", "tool": "tool", "function": "tool"}
+_LABELS = {"human": "Human", "ai": "AI", "tool": "Tool", "note": "Note"}
+
+_HTML_TAG_RE = re.compile(r"<\s*/?\s*[a-zA-Z][^>]*>")
+_HTML_SKIP_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def approx_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def message_parts(message) -> Tuple[str, str]:
+    """
+    Role and text of a chat message.
+
+    Args:
+        message: Dict with "role"/"type" and "content", or a ragas / LangChain
+            message object; tool calls made by an AI message are appended to
+            its text
+
+    Returns:
+        Tuple[str, str]: Role ('human', 'ai', 'tool', or the original role
+            lowercased) and content
+    """
+    if isinstance(message, dict):
+        role = message.get("role", message.get("type", ""))
+        content = message.get("content")
+        tool_calls = message.get("tool_calls")
+    else:
+        role = getattr(message, "type", "")
+        content = getattr(message, "content", None)
+        tool_calls = getattr(message, "tool_calls", None)
+    role = str(role).lower()
+    role = _ROLES.get(role, role)
+    content = content if isinstance(content, str) else ("" if content is None else json.dumps(content, default=str))
+    if tool_calls:
+        calls = []
+        for call in tool_calls:
+            name, args = tool_call_parts(call)
+            calls.append(f"[call {name}({canonical_arguments(args)})]")
+        content = " ".join(filter(None, [content] + calls))
+    return role, content
+
+
+def clean_tool_output(text: str) -> str:
+    """
+    Remove formatting that costs tokens but carries no content.
+
+    JSON is re-serialized compactly; HTML loses scripts, styles and tags.
+
+    Args:
+        text: Raw tool output
+
+    Returns:
+        str: Cleaned output
+    """
+    stripped = text.strip()
+    if stripped[:1] in ("{", "["):
+        try:
+            return json.dumps(json.loads(stripped), separators=(",", ":"), ensure_ascii=False)
+        except ValueError:
+            pass
+    if "<" in stripped and _HTML_TAG_RE.search(stripped):
+        stripped = _HTML_TAG_RE.sub(" ", _HTML_SKIP_RE.sub(" ", stripped))
+        return " ".join(html.unescape(stripped).split())
+    return stripped
+
+
+def truncate_middle(text: str, max_chars: int) -> str:
+    """
+    Shorten text to about ``max_chars``, keeping its head and tail.
+
+    Args:
+        text: Text to shorten
+        max_chars: Characters kept (two thirds from the start, one third from the end)
+
+    Returns:
+        str: The text, or its head and tail around an omission marker
+    """
+    if len(text) <= max_chars:
+        return text
+    head = max_chars * 2 // 3
+    tail = max_chars - head
+    return f"{text[:head]} … [{len(text) - head - tail} chars omitted] … {text[len(text) - tail:]}"
+
+
+def render_trajectory(messages: Sequence[Message]) -> str:
+    """
+    Render messages as a transcript for a judge prompt.
+
+    Args:
+        messages: Messages with "role" and "content"
+
+    Returns:
+        str: One "Role: content" line per message
+    """
+    return "\n".join(
+        f"{_LABELS.get(m['role'], m['role'].capitalize() or 'Message')}: {m['content']}" for m in messages
+    )
+
+
+class TrajectoryCompactor:
+    """
+    Shrinks agent traces to a token budget for judge prompts.
+
+    Attributes:
+        hits: Traces served from the cache
+        misses: Traces compacted
+        tokens_in: Tokens of the compacted traces before compaction
+        tokens_out: Tokens of the compacted traces after compaction
+    """
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = 4000,
+        max_tool_chars: int = 2000,
+        min_tool_chars: int = 200,
+        deduplicate: bool = True,
+        count_tokens: Callable[[str], int] = approx_tokens,
+        cache: Optional[DiskCache] = None,
+        max_memory_entries: int = 10_000,
+    ):
+        """
+        Initialize Trajectory Compactor.
+
+        Args:
+            max_tokens: Token budget per trace (None: no budget, only cleaning,
+                deduplication and ``max_tool_chars``)
+            max_tool_chars: Characters kept per tool output
+            min_tool_chars: Floor for the tool output limit when enforcing the budget
+            deduplicate: Replace repeated tool outputs by a reference to the first
+            count_tokens: Token counter (e.g. a tiktoken encoder's length)
+            cache: Optional DiskCache for compactions across runs
+            max_memory_entries: Compactions kept in memory (LRU)
+        """
+        self.max_tokens = max_tokens
+        self.max_tool_chars = max_tool_chars
+        self.min_tool_chars = min(min_tool_chars, max_tool_chars)
+        self.deduplicate = deduplicate
+        self.count_tokens = count_tokens
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self._memo = MemoCache(cache, max_memory_entries)
+
+    @property
+    def cache(self) -> Optional[DiskCache]:
+        """DiskCache shared across runs, if any."""
+        return self._memo.cache
+
+    @property
+    def hits(self) -> int:
+        """Traces served from the cache."""
+        return self._memo.hits
+
+    @property
+    def misses(self) -> int:
+        """Traces compacted."""
+        return self._memo.misses
+
+    @property
+    def settings(self) -> Tuple:
+        """Settings that determine a compaction (part of every cache key)."""
+        return (
+            self.max_tokens, self.max_tool_chars, self.min_tool_chars, self.deduplicate,
+            getattr(self.count_tokens, "__qualname__", repr(self.count_tokens)),
+        )
+
+    def key(self, messages: Sequence[Message]) -> str:
+        """
+        Cache key of a trace under this compactor's settings.
+
+        Args:
+            messages: Normalized messages
+
+        Returns:
+            str: Content-addressed key
+        """
+        # Hash contents one by one rather than JSON-encoding megabytes of tool output
+        digests = [
+            [m["role"], hashlib.blake2b(m["content"].encode("utf-8"), digest_size=16).hexdigest()] for m in messages
+        ]
+        return make_key("trajectory", self.settings, digests)
+
+    def _tokens(self, messages: Sequence[Optional[Message]]) -> int:
+        return sum(self.count_tokens(render_trajectory([m])) for m in messages if m is not None)
+
+    def compact(self, messages: Sequence[Any]) -> List[Message]:
+        """
+        Compact a trace, reusing an earlier compaction of the same trace.
+
+        Args:
+            messages: Chat messages (see ``message_parts``)
+
+        Returns:
+            List[Message]: Compacted messages with "role" and "content"
+        """
+        normalized = [dict(zip(("role", "content"), message_parts(m))) for m in messages]
+
+        def create() -> List[Message]:
+            compacted = self._compact(normalized)
+            self.tokens_in += self._tokens(normalized)
+            self.tokens_out += self._tokens(compacted)
+            return compacted
+
+        compacted = self._memo.get_or_create(self.key(normalized), create)
+        return [dict(m) for m in compacted]
+
+    def _compact(self, messages: List[Message]) -> List[Message]:
+        tool_outputs: Dict[int, str] = {}
+        first_seen: Dict[str, int] = {}
+        cleaned: Dict[str, str] = {}
+        for index, message in enumerate(messages):
+            if message["role"] != "tool":
+                continue
+            output = cleaned.get(message["content"])
+            if output is None:
+                output = cleaned[message["content"]] = clean_tool_output(message["content"])
+            if self.deduplicate:
+                first = first_seen.setdefault(output, index)
+                if first != index:
+                    output = f"[same output as message {first + 1}]"
+            tool_outputs[index] = output
+
+        def with_tool_limit(limit: int) -> List[Optional[Message]]:
+            return [
+                {"role": "tool", "content": truncate_middle(tool_outputs[i], limit)} if i in tool_outputs else m
+                for i, m in enumerate(messages)
+            ]
+
+        limit = self.max_tool_chars
+        result = with_tool_limit(limit)
+        if self.max_tokens is not None:
+            while self._tokens(result) > self.max_tokens and limit > self.min_tool_chars:
+                limit = max(limit // 2, self.min_tool_chars)
+                result = with_tool_limit(limit)
+            if self._tokens(result) > self.max_tokens:
+                self._drop_to_budget(result)
+        return self._mark_omitted(result)
+
+    def _drop_to_budget(self, messages: List[Optional[Message]]):
+        """Drop tool, then intermediate agent messages, oldest first, until within budget."""
+        ai_turns = [i for i, m in enumerate(messages) if m["role"] == "ai"]
+        final_answer = ai_turns[-1] if ai_turns else None
+        candidates = [i for i, m in enumerate(messages) if m["role"] == "tool"]
+        candidates += [i for i in ai_turns if i != final_answer]
+        # Each run of dropped messages costs one marker note
+        marker = self.count_tokens(render_trajectory([{"role": "note", "content": "[999 messages omitted]"}]))
+        tokens = self._tokens(messages)
+        for index in candidates:
+            if tokens <= self.max_tokens:
+                break
+            joins_left = index > 0 and messages[index - 1] is None
+            joins_right = index + 1 < len(messages) and messages[index + 1] is None
+            tokens -= self.count_tokens(render_trajectory([messages[index]]))
+            tokens += marker * (1 - joins_left - joins_right)
+            messages[index] = None
+
+    @staticmethod
+    def _mark_omitted(messages: List[Optional[Message]]) -> List[Message]:
+        result: List[Message] = []
+        omitted = 0
+        for message in messages + [{}]:
+            if message is None:
+                omitted += 1
+                continue
+            if omitted:
+                noun = "message" if omitted == 1 else "messages"
+                result.append({"role": "note", "content": f"[{omitted} {noun} omitted]"})
+                omitted = 0
+            if message:
+                result.append(message)
+        return result
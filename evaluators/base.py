@@ -0,0 +1,178 @@
+"""
+Base Evaluator
+
+Shared behaviour inherited by every evaluator in the package.
+
+Each evaluator only implements ``async evaluate(sample)`` for a single sample.
+This base class builds the batch surface on top of it:
+
+- aevaluate_many: Evaluate many samples concurrently with a bounded number
+  of in-flight evaluations (backpressure against LLM quotas)
+- evaluate_batch: Synchronous wrapper around ``aevaluate_many``
+- llm: Judge LLMs are routed through the shared rate limiter
+
+Results are returned in input order. A failure on one sample is captured on
+its result instead of aborting the whole batch.
+"""
+
+import asyncio
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def get_sample_field(sample, name: str, default=None):
+    """
+    Read a field from a sample.
+
+    Samples may be ragas sample objects (attribute access) or plain
+    dictionaries such as rows loaded from the JSONL files under ``data/``.
+
+    Args:
+        sample: Sample object or dictionary
+        name: Field name
+        default: Value returned when the field is missing
+
+    Returns:
+        The field value, or ``default``
+    """
+    if isinstance(sample, dict):
+        return sample.get(name, default)
+    return getattr(sample, name, default)
+
+
+class EvaluationResult:
+    """
+    Outcome of evaluating a single sample.
+
+    Attributes:
+        index: Position of the sample in the input batch
+        score: Value returned by ``evaluate`` (None if it failed)
+        error: Exception raised by ``evaluate`` (None if it succeeded)
+    """
+
+    __slots__ = ("index", "score", "error")
+
+    def __init__(self, index: int, score: Any = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.score = score
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the sample was evaluated without raising."""
+        return self.error is None
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"EvaluationResult(index={self.index}, error={self.error!r})"
+        return f"EvaluationResult(index={self.index}, score={self.score!r})"
+
+
+class BaseEvaluator:
+    """
+    Base class for all evaluators.
+
+    Subclasses implement ``async evaluate(sample)``; batch evaluation is
+    provided here so every evaluator gets the same concurrency control and
+    error handling.
+
+    Attributes:
+        metric_name: Stable identifier used to key results (e.g. "faithfulness")
+        sample_fields: Sample fields the metric reads (ragas names), used to
+            fingerprint samples for incremental evaluation; None: all fields
+        cpu_bound: True for pure-CPU metrics that can run on a worker pool
+            (see evaluators.parallel) instead of the event loop thread
+        llm: Judge LLM; assigned LLMs are routed through the process-wide
+            rate limiter unless EVAL_RATE_LIMIT=0 (see evaluators.rate_limiter)
+    """
+
+    metric_name = ""
+    sample_fields: Optional[Tuple[str, ...]] = None
+    cpu_bound = False
+
+    @property
+    def llm(self):
+        return self.__dict__.get("_llm")
+
+    @llm.setter
+    def llm(self, value):
+        if value is not None:
+            # Imported here so non-LLM evaluators stay cheap to import
+            from .rate_limiter import rate_limiting_enabled, with_rate_limit
+            if rate_limiting_enabled():
+                value = with_rate_limit(value)
+        self.__dict__["_llm"] = value
+
+    async def evaluate(self, sample):
+        """
+        Evaluate a single sample.
+
+        Args:
+            sample: Sample to evaluate
+
+        Returns:
+            Metric score for the sample
+        """
+        raise NotImplementedError
+
+    async def aevaluate_many(
+        self,
+        samples: Iterable,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate many samples concurrently.
+
+        At most ``max_concurrency`` calls to ``evaluate`` are in flight at any
+        time. Exceptions raised for a sample are stored on its result rather
+        than propagated.
+
+        Args:
+            samples: Iterable of samples
+            max_concurrency: Maximum number of concurrent evaluations
+
+        Returns:
+            List[EvaluationResult]: One result per sample, in input order
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        # A fixed pool of workers pulls from one shared iterator, so only
+        # max_concurrency coroutines exist at a time regardless of batch size.
+        pending = enumerate(samples)
+        results: List[EvaluationResult] = []
+
+        async def worker():
+            for index, sample in pending:
+                try:
+                    score = await self.evaluate(sample)
+                except Exception as e:
+                    results.append(EvaluationResult(index, error=e))
+                else:
+                    results.append(EvaluationResult(index, score=score))
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+        results.sort(key=lambda result: result.index)
+        return results
+
+    def evaluate_batch(
+        self,
+        samples: Iterable,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate many samples from synchronous code.
+
+        Runs ``aevaluate_many`` on a fresh event loop, so it must not be called
+        from inside a running loop (use ``await aevaluate_many(...)`` there).
+
+        Args:
+            samples: Iterable of samples
+            max_concurrency: Maximum number of concurrent evaluations
+
+        Returns:
+            List[EvaluationResult]: One result per sample, in input order
+        """
+        return asyncio.run(self.aevaluate_many(samples, max_concurrency=max_concurrency))
@@ -0,0 +1,336 @@
+"""
+Evaluator Benchmarks
+
+Throughput and latency of every registered evaluator over synthetic datasets,
+against the deterministic fake LLM/embeddings backend (no network needed):
+
+    python -m evaluators.bench --sizes 1000,10000,100000 --output bench.json
+    python -m evaluators.bench --evaluators bleu_score,faithfulness --latency 0.2
+
+For each (evaluator, dataset size) the report records:
+- samples_per_sec: Throughput of ``evaluate`` at the configured concurrency
+- latency_ms: p50 / p95 / p99 latency of single ``evaluate`` calls
+- peak_rss_mb: Peak resident memory of the benchmark process (None on Windows)
+- llm_calls_per_sample / embedding_calls_per_sample: Backend requests per sample
+
+By default every case runs in a fresh process, so peak RSS belongs to that
+case alone. Results are written as JSON to compare across versions.
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import multiprocessing
+import os
+import pickle
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from . import registry
+from .fake_backend import FakeBackend, FakeChatModel, FakeEmbeddings
+from .rate_limiter import AdaptiveRateLimiter, set_rate_limiter
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_CONCURRENCY = 64
+
+_SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "ta", "si", "po", "de", "va", "zu", "chi", "ro", "me", "fa", "gi")
+_TOOLS = ("search_flights", "book_flight", "search_hotels", "get_weather", "get_time", "calculate_math", "send_email")
+
+
+@lru_cache(maxsize=1)
+def _vocabulary(size: int = 2_000) -> List[str]:
+    rng = random.Random(0)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words)
+
+
+def synthetic_samples(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate a synthetic evaluation dataset.
+
+    Samples carry the ragas field names used by every evaluator category
+    (RAG, NVIDIA, agents and tools, text comparison, SQL). Words follow a
+    Zipf distribution and responses are perturbed copies of references, so
+    overlap-based metrics see realistic partial matches.
+
+    Args:
+        n: Number of samples
+        seed: Random seed
+
+    Returns:
+        List[Dict[str, Any]]: Samples
+    """
+    rng = random.Random(seed)
+    vocabulary = _vocabulary()
+    cum_weights = list(accumulate(1.0 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def sentence(length: int) -> str:
+        return " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=length)).capitalize() + "."
+
+    def perturb(text: str) -> str:
+        words = text.rstrip(".").split()
+        for i in range(len(words)):
+            if rng.random() < 0.3:
+                words[i] = rng.choices(vocabulary, cum_weights=cum_weights)[0]
+        return " ".join(words) + "."
+
+    samples = []
+    for i in range(n):
+        reference = " ".join(sentence(rng.randint(8, 20)) for _ in range(rng.randint(1, 3)))
+        contexts = [sentence(rng.randint(20, 60)) for _ in range(rng.randint(2, 5))]
+        context_ids = rng.sample(range(1_000), len(contexts))
+        reference_tools = rng.sample(_TOOLS, rng.randint(1, 3))
+        tools = [t if rng.random() < 0.8 else rng.choice(_TOOLS) for t in reference_tools]
+        samples.append({
+            "id": f"sample-{i}",
+            "user_input": sentence(rng.randint(6, 14)).rstrip(".") + "?",
+            "response": perturb(reference),
+            "reference": reference,
+            "retrieved_contexts": contexts,
+            "reference_contexts": [perturb(c) for c in contexts[:2]],
+            "retrieved_context_ids": [str(c) for c in context_ids],
+            "reference_context_ids": [str(c) for c in context_ids[: len(context_ids) // 2 + 1]],
+            "tool_calls": [{"name": t, "args": {"query": rng.choice(vocabulary)}} for t in tools],
+            "reference_tool_calls": [{"name": t, "args": {"query": rng.choice(vocabulary)}} for t in reference_tools],
+            "reference_topics": rng.sample(vocabulary[:50], 2),
+            "rubrics": {f"score{s}_description": sentence(6) for s in range(1, 6)},
+            "sql": "SELECT name FROM users WHERE id = %d" % rng.randint(1, 100),
+            "reference_sql": "SELECT name FROM users WHERE id = %d" % rng.randint(1, 100),
+        })
+    return samples
+
+
+def _percentile_ms(latencies: np.ndarray, q: float) -> Optional[float]:
+    return round(float(np.percentile(latencies, q)) * 1000, 4) if len(latencies) else None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        # POSIX only
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 2)
+
+
+def make_evaluator(name: str, llm, embeddings):
+    """
+    Create an evaluator by name, passing only the backends its factory accepts.
+
+    Args:
+        name: Registered evaluator name
+        llm: Judge LLM
+        embeddings: Embeddings model
+
+    Returns:
+        Evaluator instance
+    """
+    factory = registry.get_factory(name)
+    parameters = inspect.signature(factory).parameters
+    kwargs = {}
+    if "llm" in parameters:
+        kwargs["llm"] = llm
+    if "embeddings" in parameters:
+        kwargs["embeddings"] = embeddings
+    return factory(**kwargs)
+
+
+async def _timed_evaluate(evaluator, samples: Sequence, concurrency: int):
+    """Evaluate samples with a worker pool, recording each call's latency."""
+    latencies = np.zeros(len(samples))
+    errors = 0
+    pending = iter(range(len(samples)))
+
+    async def worker():
+        nonlocal errors
+        for i in pending:
+            started = time.perf_counter()
+            try:
+                await evaluator.evaluate(samples[i])
+            except Exception:
+                errors += 1
+            latencies[i] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, errors
+
+
+def run_case(
+    name: str,
+    samples: Sequence[Dict[str, Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    latency: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Benchmark one evaluator on one dataset.
+
+    Args:
+        name: Registered evaluator name
+        samples: Samples to evaluate (see ``synthetic_samples``)
+        concurrency: Concurrent ``evaluate`` calls
+        latency: Fake backend latency per request in seconds
+        seed: Backend seed
+
+    Returns:
+        Dict[str, Any]: Benchmark record
+    """
+    size = len(samples)
+    llm_backend = FakeBackend(seed=seed, latency=latency)
+    embedding_backend = FakeBackend(seed=seed, latency=latency)
+    # Measure the evaluator, not the limiter's ramp-up from its initial concurrency
+    set_rate_limiter(AdaptiveRateLimiter(initial_concurrency=concurrency, max_concurrency=concurrency))
+    try:
+        evaluator = make_evaluator(name, FakeChatModel(llm_backend), FakeEmbeddings(embedding_backend))
+        seconds, latencies, errors = asyncio.run(_timed_evaluate(evaluator, samples, concurrency))
+    finally:
+        set_rate_limiter(None)
+
+    return {
+        "evaluator": name,
+        "samples": size,
+        "concurrency": concurrency,
+        "seconds": round(seconds, 6),
+        "samples_per_sec": round(size / seconds, 2) if seconds > 0 else None,
+        "latency_ms": {
+            "p50": _percentile_ms(latencies, 50),
+            "p95": _percentile_ms(latencies, 95),
+            "p99": _percentile_ms(latencies, 99),
+        },
+        "peak_rss_mb": _peak_rss_mb(),
+        "llm_calls_per_sample": llm_backend.calls / size if size else 0.0,
+        "embedding_calls_per_sample": embedding_backend.calls / size if size else 0.0,
+        "errors": errors,
+    }
+
+
+def _run_case_from_file(name: str, dataset_path: str, *args) -> Dict[str, Any]:
+    """Entry point of isolated cases: load the pickled dataset, then run."""
+    with open(dataset_path, "rb") as f:
+        samples = pickle.load(f)
+    return run_case(name, samples, *args)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    evaluators: Optional[Sequence[str]] = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    latency: float = 0.0,
+    seed: int = 0,
+    isolate: bool = True,
+) -> Dict[str, Any]:
+    """
+    Benchmark evaluators over synthetic datasets.
+
+    Args:
+        evaluators: Evaluator names (default: every registered evaluator)
+        sizes: Dataset sizes
+        concurrency: Concurrent ``evaluate`` calls
+        latency: Fake backend latency per request in seconds
+        seed: Dataset and backend seed
+        isolate: Run each case in a fresh process (per-case peak RSS)
+
+    Returns:
+        Dict[str, Any]: Report with environment metadata and one record per case
+    """
+    names = list(evaluators or registry.available())
+    for name in names:
+        registry.get_factory(name)  # fail fast on unknown names
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for size in sizes:
+        samples = synthetic_samples(size, seed=seed)
+        if not isolate:
+            results.extend(run_case(name, samples, concurrency, latency, seed) for name in names)
+            continue
+        # Generate each dataset once; every case process loads it from disk
+        with tempfile.TemporaryDirectory() as tmp:
+            dataset_path = os.path.join(tmp, "samples.pickle")
+            with open(dataset_path, "wb") as f:
+                pickle.dump(samples, f, protocol=pickle.HIGHEST_PROTOCOL)
+            del samples
+            for name in names:
+                with context.Pool(1) as pool:
+                    results.append(pool.apply(
+                        _run_case_from_file, (name, dataset_path, concurrency, latency, seed)
+                    ))
+
+    return {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "sizes": list(sizes),
+            "concurrency": concurrency,
+            "latency": latency,
+            "seed": seed,
+            "isolate": isolate,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark evaluator throughput and latency.")
+    parser.add_argument("--evaluators", default=None, help="Comma-separated evaluator names (default: all)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated dataset sizes")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake backend latency in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-isolate", action="store_true", help="Run all cases in this process")
+    parser.add_argument("--output", default=None, help="JSON output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        evaluators=args.evaluators.split(",") if args.evaluators else None,
+        sizes=[int(size) for size in args.sizes.split(",")],
+        concurrency=args.concurrency,
+        latency=args.latency,
+        seed=args.seed,
+        isolate=not args.no_isolate,
+    )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        for record in report["results"]:
+            print(
+                f"{record['evaluator']:<36} n={record['samples']:<7} "
+                f"{record['samples_per_sec']:>12} samples/s  p99={record['latency_ms']['p99']} ms  "
+                f"rss={record['peak_rss_mb']} MB"
+            )
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Disk Cache
+
+Small persistent key-value store backed by SQLite, shared by the caching
+layers of the package (LLM responses, extracted claims, relevance verdicts).
+
+Features:
+- Content-addressed keys: make_key hashes any JSON-like structure
+- Size cap with least-recently-used eviction (max_entries and/or max_bytes)
+- Optional time-to-live for entries
+- Safe to share between threads and between processes (SQLite WAL mode)
+
+Values are stored pickled, so anything picklable can be cached.
+
+MemoCache layers an in-memory LRU and single-flight computation on top of
+an optional DiskCache; the claim, verdict and trajectory stores build on it.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+DEFAULT_CACHE_DIR = ".eval_cache"
+
+# Default for DiskCache.get that cannot be confused with a cached None
+MISSING = object()
+
+
+def _default_json(value):
+    """Fallback for make_key: stable text for non-JSON values."""
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def make_key(*parts) -> str:
+    """
+    Build a content-addressed cache key.
+
+    Args:
+        *parts: JSON-like values (dicts are order-insensitive)
+
+    Returns:
+        str: SHA-256 hex digest of the canonical JSON encoding of ``parts``
+    """
+    encoded = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_default_json)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    SQLite-backed cache with LRU eviction and TTL.
+
+    Attributes:
+        hits: Successful lookups since the cache was opened
+        misses: Failed lookups (absent or expired) since the cache was opened
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Initialize Disk Cache.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            max_entries: Maximum number of entries (None: unbounded)
+            max_bytes: Maximum total size of stored values in bytes (None: unbounded)
+            ttl: Seconds after which an entry expires (None: never)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Returned when the key is absent or expired
+
+        Returns:
+            The cached value, or ``default``
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or self._expired(row[1], now):
+                if row is not None:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.misses += 1
+                return default
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        """
+        Store a value, evicting least recently used entries if over capacity.
+
+        Args:
+            key: Cache key
+            value: Picklable value
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(blob), len(blob), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the least recently used ones over the caps."""
+        if self.ttl is not None:
+            self._conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl,))
+        if self.max_entries is not None:
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+        if self.max_bytes is not None:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                freed = 0
+                victims = []
+                for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+                    victims.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT created_at FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None and not self._expired(row[0], time.time())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __getstate__(self):
+        # Connections cannot be pickled; reopen the same file on unpickle
+        return {
+            "path": self.path,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+class MemoCache:
+    """
+    In-memory LRU over an optional DiskCache, computing each missing key once.
+
+    ``None`` results are returned but not cached, so a failed computation is
+    retried on the next request.
+
+    Attributes:
+        hits: Requests served without computing
+        misses: Requests that computed the value
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, max_memory_entries: int = 100_000):
+        """
+        Initialize Memo Cache.
+
+        Args:
+            cache: Optional DiskCache for persistence across runs
+            max_memory_entries: Values kept in memory (LRU)
+        """
+        self.cache = cache
+        self.max_memory_entries = max_memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests served without computing (0.0 before any request)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Counters of the cache.
+
+        Returns:
+            Dict[str, float]: "hits", "misses", "hit_rate" and "memory_entries"
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "memory_entries": len(self._memory),
+        }
+
+    def _remember(self, key: str, value: Any):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def lookup(self, key: str) -> Any:
+        """
+        Cached value of a key, from memory or disk, without counting a request.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Any: Cached value, or MISSING
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self.cache is not None:
+            value = self.cache.get(key, MISSING)
+            if value is not MISSING:
+                self._remember(key, value)
+                return value
+        return MISSING
+
+    def store(self, key: str, value: Any):
+        """
+        Cache a value in memory and, if configured, on disk.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._remember(key, value)
+        if self.cache is not None:
+            self.cache.set(key, value)
+
+    def get_or_create(self, key: str, create: Callable[[], Any]) -> Any:
+        """
+        Return the value of a key, calling ``create`` only if it is not cached.
+
+        Args:
+            key: Cache key
+            create: Function computing the value
+
+        Returns:
+            Any: Cached or created value
+        """
+        value = self.lookup(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = create()
+        if value is not None:
+            self.store(key, value)
+        return value
+
+    async def aget_or_create(self, key: str, create: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the value of a key, awaiting ``create`` only if it is not cached.
+
+        Concurrent requests for a key being created wait for the same call.
+
+        Args:
+            key: Cache key
+            create: Coroutine function computing the value
+
+        Returns:
+            Any: Cached or created value
+        """
+        value = self.lookup(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        pending = self._pending.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await create()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; avoid "never retrieved" noise
+            raise
+        else:
+            if value is not None:
+                self.store(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+
+def process_default(factory: Callable[[], Any]) -> Tuple[Callable[[], Any], Callable[[Any], None]]:
+    """
+    Build getter/setter functions for a lazily created process-wide instance.
+
+    Args:
+        factory: Creates the default instance on first use
+
+    Returns:
+        Tuple of (get, set) functions; setting None resets to a fresh instance
+    """
+    default = [None]
+
+    def get_default():
+        if default[0] is None:
+            default[0] = factory()
+        return default[0]
+
+    def set_default(instance):
+        default[0] = instance
+
+    return get_default, set_default
@@ -0,0 +1,328 @@
+"""
+Checkpointed Evaluation Runs
+
+Long runs survive crashes, quota exhaustion and preemption:
+
+- Every run has a run ID and a directory ``.eval_cache/runs/<run_id>/``
+- Each completed (sample_id, evaluator) job is appended to a durable JSONL
+  journal (``journal.jsonl``) as soon as it finishes, in the same record
+  format as ``stream_evaluate``
+- ``resume(run_id, evaluators)`` reruns only the jobs that are not in the
+  journal with a score; failed jobs (e.g. on 429s) are retried
+
+    run = CheckpointedRun([faithfulness, bleu], inputs="data/**/*.jsonl")
+    results = run.run()            # killed at hour 5...
+    results = resume(run.run_id, [faithfulness, bleu])   # ...picks up from there
+
+Samples are identified by their "id" field, by "<path>:<line>" when read from
+JSONL files, or by their position in the dataset otherwise, so the dataset
+must be passed in the same order when resuming.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .base import BaseEvaluator, EvaluationResult, get_sample_field
+from .cache import DEFAULT_CACHE_DIR
+from .parallel import ExecutionMode
+from .pipeline import PathSpec, _json_default, _truncate_partial_line, is_path_spec, iter_jsonl, iter_results, result_record
+from .runner import EvaluationRunner
+
+
+DEFAULT_RUNS_DIR = os.path.join(DEFAULT_CACHE_DIR, "runs")
+
+JOURNAL_FILE = "journal.jsonl"
+MANIFEST_FILE = "manifest.json"
+
+
+def new_run_id() -> str:
+    """
+    Generate a sortable, unique run ID.
+
+    Returns:
+        str: ID such as "20250101-120000-1a2b3c"
+    """
+    return time.strftime("%Y%m%d-%H%M%S") + "-" + uuid.uuid4().hex[:6]
+
+
+class RunJournal:
+    """
+    Append-only journal of job results.
+
+    Records are flushed after every write and fsynced at most every
+    ``fsync_interval`` seconds, so a crash loses at most that much work.
+    """
+
+    def __init__(self, path: str, fsync_interval: float = 1.0):
+        """
+        Initialize Run Journal.
+
+        Args:
+            path: Journal JSONL file (created if missing)
+            fsync_interval: Seconds between fsyncs (0: fsync every record)
+        """
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._last_sync = 0.0
+
+    def completed(self) -> Dict[Tuple[str, str], Any]:
+        """
+        Scores of the jobs that finished successfully.
+
+        A trailing partial line from an interrupted run is ignored; the latest
+        record of a job wins.
+
+        Returns:
+            Dict[Tuple[str, str], Any]: (sample_id, evaluator) -> score
+        """
+        done: Dict[Tuple[str, str], Any] = {}
+        if not os.path.exists(self.path):
+            return done
+        for record in iter_results(self.path):
+            key = (record["sample_id"], record["evaluator"])
+            if record.get("error") is None:
+                done[key] = record.get("score")
+            else:
+                done.pop(key, None)
+        return done
+
+    def append(self, record: dict):
+        """
+        Durably append one result record.
+
+        A partial line left by a crash is dropped before the first append.
+
+        Args:
+            record: Record built by ``pipeline.result_record``
+        """
+        if self._file is None:
+            if os.path.exists(self.path):
+                with open(self.path, "rb+") as f:
+                    _truncate_partial_line(f)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, default=_json_default) + "\n")
+        self._file.flush()
+        now = time.monotonic()
+        if now - self._last_sync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = now
+
+    def close(self):
+        """Fsync and close the journal."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+
+def _write_json_atomic(path: str, value: dict):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(value, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _identify(dataset: Iterable) -> Tuple[List[str], List[Any]]:
+    """Split a dataset into sample ids and samples."""
+    ids: List[str] = []
+    samples: List[Any] = []
+    for index, item in enumerate(dataset):
+        if isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], str):
+            sample_id, sample = item
+        else:
+            sample = item
+            sample_id = get_sample_field(sample, "id")
+            sample_id = str(sample_id) if sample_id is not None else str(index)
+        ids.append(sample_id)
+        samples.append(sample)
+    if len(set(ids)) != len(ids):
+        raise ValueError("Sample ids must be unique to checkpoint a run")
+    return ids, samples
+
+
+class CheckpointedRun:
+    """
+    Evaluation run whose results are journaled and can be resumed.
+
+    Attributes:
+        run_id: Identifier of the run
+        run_dir: Directory holding the manifest and journal
+    """
+
+    def __init__(
+        self,
+        evaluators: Union[Iterable[BaseEvaluator], Mapping[str, BaseEvaluator]],
+        run_id: Optional[str] = None,
+        inputs: Optional[PathSpec] = None,
+        root: str = DEFAULT_RUNS_DIR,
+        max_concurrency: int = 64,
+        per_evaluator_concurrency: Union[int, Mapping[str, int], None] = None,
+        cpu_execution: Optional[ExecutionMode] = None,
+        fsync_interval: float = 1.0,
+    ):
+        """
+        Initialize Checkpointed Run.
+
+        Args:
+            evaluators: Evaluator instances, or a mapping of result name to instance
+            run_id: Existing run to continue, or None to start a new one
+            inputs: JSONL path(s) or glob(s) to evaluate, recorded in the
+                manifest so ``resume`` can find them again
+            root: Directory containing all runs
+            max_concurrency: Maximum jobs in flight across all evaluators
+            per_evaluator_concurrency: Maximum jobs in flight per evaluator
+            cpu_execution: Pool used for ``cpu_bound`` evaluators (None: event loop)
+            fsync_interval: Seconds between journal fsyncs
+        """
+        self.runner = EvaluationRunner(
+            evaluators,
+            max_concurrency=max_concurrency,
+            per_evaluator_concurrency=per_evaluator_concurrency,
+            cpu_execution=cpu_execution,
+        )
+        self.run_id = run_id or new_run_id()
+        self.run_dir = os.path.join(root, self.run_id)
+        os.makedirs(self.run_dir, exist_ok=True)
+        self.journal = RunJournal(os.path.join(self.run_dir, JOURNAL_FILE), fsync_interval=fsync_interval)
+
+        manifest = self.manifest()
+        if inputs is not None:
+            manifest["inputs"] = [os.fspath(p) for p in ([inputs] if isinstance(inputs, (str, os.PathLike)) else inputs)]
+        manifest.setdefault("run_id", self.run_id)
+        manifest.setdefault("created_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+        manifest.setdefault("inputs", None)
+        manifest["evaluators"] = sorted(set(manifest.get("evaluators", [])) | set(self.runner.evaluators))
+        manifest.setdefault("status", "created")
+        _write_json_atomic(os.path.join(self.run_dir, MANIFEST_FILE), manifest)
+
+    def manifest(self) -> dict:
+        """
+        Read the run manifest.
+
+        Returns:
+            dict: run_id, created_at, inputs, evaluators and status
+                (empty for a run that has not been written yet)
+        """
+        path = os.path.join(self.run_dir, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _set_status(self, status: str):
+        manifest = self.manifest()
+        manifest["status"] = status
+        manifest["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        _write_json_atomic(os.path.join(self.run_dir, MANIFEST_FILE), manifest)
+
+    async def arun(self, dataset: Optional[Iterable] = None) -> List[Dict[str, EvaluationResult]]:
+        """
+        Evaluate the jobs not yet in the journal.
+
+        Args:
+            dataset: Samples, (sample_id, sample) pairs, or JSONL path(s)
+                (default: the run's recorded inputs)
+
+        Returns:
+            List[Dict[str, EvaluationResult]]: Per-sample results keyed by
+                evaluator name, including scores restored from the journal
+        """
+        if dataset is None:
+            inputs = self.manifest().get("inputs")
+            if not inputs:
+                raise ValueError(f"Run {self.run_id} has no recorded inputs; pass the dataset")
+            dataset = inputs
+        if is_path_spec(dataset):
+            dataset = iter_jsonl(dataset)
+        ids, samples = _identify(dataset)
+
+        completed = self.journal.completed()
+
+        def skip(index: int, name: str) -> bool:
+            return (ids[index], name) in completed
+
+        def on_result(index: int, name: str, result: EvaluationResult):
+            self.journal.append(result_record(ids[index], name, result))
+
+        self._set_status("running")
+        try:
+            results = await self.runner.arun(samples, on_result=on_result, skip=skip)
+        finally:
+            self.journal.close()
+
+        for index, sample_id in enumerate(ids):
+            for name in self.runner.evaluators:
+                if (sample_id, name) in completed:
+                    results[index][name] = EvaluationResult(index, score=completed[(sample_id, name)])
+
+        failed = any(not result.ok for per_sample in results for result in per_sample.values())
+        self._set_status("incomplete" if failed else "completed")
+        return results
+
+    def run(self, dataset: Optional[Iterable] = None) -> List[Dict[str, EvaluationResult]]:
+        """
+        Evaluate the jobs not yet in the journal from synchronous code.
+
+        Args:
+            dataset: Samples, (sample_id, sample) pairs, or JSONL path(s)
+                (default: the run's recorded inputs)
+
+        Returns:
+            List[Dict[str, EvaluationResult]]: Per-sample results keyed by evaluator name
+        """
+        return asyncio.run(self.arun(dataset))
+
+
+def resume(
+    run_id: str,
+    evaluators: Union[Iterable[BaseEvaluator], Mapping[str, BaseEvaluator]],
+    dataset: Optional[Iterable] = None,
+    root: str = DEFAULT_RUNS_DIR,
+    **runner_kwargs,
+) -> List[Dict[str, EvaluationResult]]:
+    """
+    Resume a run, skipping every job already completed.
+
+    Args:
+        run_id: ID of the run to resume
+        evaluators: Evaluator instances (same names as the original run;
+            new evaluators are run over every sample)
+        dataset: Dataset of the original run (default: its recorded inputs)
+        root: Directory containing all runs
+        **runner_kwargs: Concurrency options forwarded to CheckpointedRun
+
+    Returns:
+        List[Dict[str, EvaluationResult]]: Per-sample results keyed by evaluator name
+    """
+    if not os.path.exists(os.path.join(root, run_id, MANIFEST_FILE)):
+        raise ValueError(f"Unknown run: {run_id}")
+    return CheckpointedRun(evaluators, run_id=run_id, root=root, **runner_kwargs).run(dataset)
+
+
+def list_runs(root: str = DEFAULT_RUNS_DIR) -> List[dict]:
+    """
+    List the manifests of all runs, oldest first.
+
+    Args:
+        root: Directory containing all runs
+
+    Returns:
+        List[dict]: Run manifests
+    """
+    if not os.path.isdir(root):
+        return []
+    manifests = []
+    for run_id in sorted(os.listdir(root)):
+        path = os.path.join(root, run_id, MANIFEST_FILE)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                manifests.append(json.load(f))
+    return manifests
@@ -0,0 +1,195 @@
+"""
+Claim Store
+
+Shared claim-decomposition stage for claim-based evaluators.
+
+Faithfulness, Factual Correctness, Noise Sensitivity, Context Recall and
+Response Groundedness all start by asking an LLM to split a response or
+reference into claims. Within one run the same text is usually decomposed
+by several of them. ClaimStore keeps each decomposition, keyed by
+(text, atomicity, coverage, model), and hands it to every evaluator that
+asks for it:
+
+- In-memory LRU for the current process
+- Optional DiskCache to reuse decompositions across runs
+- Concurrent requests for the same key wait for a single LLM call
+
+Evaluators use the process-wide default store unless one is passed to
+their factory.
+"""
+
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from .base import BaseEvaluator
+from .cache import DiskCache, MemoCache, make_key, process_default
+from .llm_proxy import llm_identity
+
+
+ClaimExtractor = Callable[[str], Awaitable[Optional[List[str]]]]
+
+
+class ClaimStore(MemoCache):
+    """
+    Cache of claim decompositions shared across evaluators.
+
+    Attributes:
+        hits: Requests served without calling the extractor
+        misses: Requests that called the extractor
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, max_memory_entries: int = 100_000):
+        """
+        Initialize Claim Store.
+
+        Args:
+            cache: Optional DiskCache for persistence across runs
+            max_memory_entries: Decompositions kept in memory (LRU)
+        """
+        super().__init__(cache, max_memory_entries)
+
+    @staticmethod
+    def key(text: str, atomicity: str, coverage: str, model) -> str:
+        """
+        Compute the key of a decomposition.
+
+        Args:
+            text: Decomposed text
+            atomicity: Claim granularity ('high' or 'low')
+            coverage: Claim comprehensiveness ('high' or 'low')
+            model: Model identity (see llm_proxy.llm_identity)
+
+        Returns:
+            str: Content-addressed key
+        """
+        return make_key("claims", model, atomicity, coverage, text)
+
+    async def get_or_extract(
+        self,
+        text: str,
+        extractor: ClaimExtractor,
+        atomicity: str = "low",
+        coverage: str = "low",
+        model=None,
+    ) -> Optional[List[str]]:
+        """
+        Return the claims of a text, extracting them only if no evaluator has yet.
+
+        Args:
+            text: Text to decompose
+            extractor: Coroutine function performing the LLM decomposition
+            atomicity: Claim granularity
+            coverage: Claim comprehensiveness
+            model: Model identity of the extracting LLM
+
+        Returns:
+            Optional[List[str]]: Claims (None if the extractor returned None,
+                which is not cached)
+        """
+        key = self.key(text, atomicity, coverage, model)
+        return await self.aget_or_create(key, lambda: extractor(text))
+
+
+_get_default_store, _set_default_store = process_default(ClaimStore)
+
+
+def get_default_claim_store() -> ClaimStore:
+    """
+    Process-wide claim store used by evaluators created without one.
+
+    Returns:
+        ClaimStore: Shared in-memory store
+    """
+    return _get_default_store()
+
+
+def set_default_claim_store(store: Optional[ClaimStore]):
+    """
+    Replace the process-wide claim store (e.g. with a persistent one).
+
+    Args:
+        store: New default store, or None to reset to a fresh in-memory store
+    """
+    _set_default_store(store)
+
+
+class ClaimBasedEvaluator(BaseEvaluator):
+    """
+    Base class for evaluators that decompose text into claims.
+
+    Subclasses call ``_extract_claims`` (or ``_supported_claims``) instead
+    of prompting the LLM directly; the decomposition itself lives in
+    ``_decompose_claims`` and the per-claim check in ``_verify_claims``.
+    Claim granularity comes from the instance's ``atomicity``/``coverage``
+    attributes when present, otherwise from the class defaults below.
+    """
+
+    claim_atomicity = "low"
+    claim_coverage = "low"
+    claim_store: Optional[ClaimStore] = None
+
+    async def _extract_claims(self, text: str) -> Optional[List[str]]:
+        """
+        Break text into claims, reusing decompositions from other evaluators.
+
+        Args:
+            text: Response or reference text
+
+        Returns:
+            Optional[List[str]]: Claims
+        """
+        store = self.claim_store or get_default_claim_store()
+        return await store.get_or_extract(
+            text,
+            self._decompose_claims,
+            atomicity=getattr(self, "atomicity", self.claim_atomicity),
+            coverage=getattr(self, "coverage", self.claim_coverage),
+            model=llm_identity(self.llm) if getattr(self, "llm", None) is not None else None,
+        )
+
+    async def _decompose_claims(self, text: str) -> Optional[List[str]]:
+        """
+        Decompose text into claims using the LLM.
+
+        Process:
+        1. Prompt the LLM to split the text into standalone statements
+        2. Apply atomicity (granularity) and coverage (comprehensiveness)
+        3. Return the list of claims
+        """
+        # Implementation would use the ragas claim decomposition prompt
+        pass
+
+    async def _verify_claims(self, claims: List[str], premise: str) -> Optional[List[bool]]:
+        """
+        Judge which claims can be inferred from a premise using the LLM.
+
+        Process:
+        1. Prompt the LLM with the premise and the numbered claims
+        2. Parse one supported/unsupported verdict per claim
+        3. Return the verdicts in claim order
+        """
+        # Implementation would use the ragas NLI statement prompt
+        pass
+
+    async def _supported_claims(self, text: str, premise: str) -> Tuple[int, int]:
+        """
+        Count the claims of a text that a premise supports.
+
+        Args:
+            text: Text to decompose (response or reference)
+            premise: Text the claims are checked against
+
+        Returns:
+            Tuple[int, int]: Supported claims and total claims
+
+        Raises:
+            ValueError: If the LLM gives no decomposition or no verdict per claim
+        """
+        claims = await self._extract_claims(text)
+        if claims is None:
+            raise ValueError("Claim decomposition gave no result")
+        if not claims:
+            return 0, 0
+        verdicts = await self._verify_claims(claims, premise)
+        if verdicts is None or len(verdicts) != len(claims):
+            raise ValueError(f"Expected {len(claims)} claim verdicts, got {verdicts!r}")
+        return sum(bool(verdict) for verdict in verdicts), len(claims)
@@ -0,0 +1,381 @@
+"""
+Embedding Cache
+
+Persistent, memory-mapped store of embedding vectors for embedding-based
+evaluators (semantic similarity, response relevancy, summarization, context
+relevance, multimodal relevance).
+
+Layout on disk for a store at ``<path>``:
+- ``<path>.vectors``: Raw float32/float16 matrix, one row per cached text,
+  appended to and memory-mapped read-only by every process using the store
+- ``<path>.index.sqlite``: Key -> row mapping, keyed by a hash of
+  (embedding model, text)
+
+Writers append under an exclusive file lock, so several processes can fill
+the same store; readers only map the vectors file and never copy it.
+
+Wrap the ``embeddings`` before passing them to the evaluator factories:
+
+    embeddings = with_embedding_cache(LangchainEmbeddingsWrapper(...))
+    evaluator = create_semantic_similarity_evaluator(embeddings=embeddings)
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .cache import DEFAULT_CACHE_DIR, make_key
+
+try:
+    import fcntl
+except ImportError:  # Windows: single writer process only
+    fcntl = None
+
+
+def embedding_model_name(embeddings) -> str:
+    """
+    Best-effort name of the model behind an embeddings object.
+
+    Looks through wrappers (e.g. ragas ``LangchainEmbeddingsWrapper``) for a
+    deployment or model name.
+
+    Args:
+        embeddings: Embeddings instance
+
+    Returns:
+        str: Model name, or the class name if none is found
+    """
+    seen = set()
+    current = embeddings
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        for name in ("deployment", "azure_deployment", "model", "model_name"):
+            value = getattr(current, name, None)
+            if isinstance(value, str) and value:
+                return value
+        current = getattr(current, "embeddings", None)
+    return type(embeddings).__name__
+
+
+class EmbeddingStore:
+    """
+    Memory-mapped embedding vectors with a SQLite index.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dim: Optional[int] = None,
+        dtype: str = "float32",
+        readonly: bool = False,
+    ):
+        """
+        Initialize Embedding Store.
+
+        Args:
+            path: Path prefix of the store files (parent directories are created)
+            dim: Vector dimension (inferred from the first vectors added, or
+                from an existing store)
+            dtype: Storage type, 'float32' or 'float16' (half the disk and page cache)
+            readonly: Open without write access (for worker processes)
+        """
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+
+        self.path = path
+        self.readonly = readonly
+        self.vectors_path = path + ".vectors"
+        self._lock = threading.Lock()
+        self._map: Optional[np.ndarray] = None
+
+        if not readonly:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        index_path = path + ".index.sqlite"
+        if readonly:
+            self._conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._conn = sqlite3.connect(index_path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, row INTEGER NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+        meta = dict(self._conn.execute("SELECT name, value FROM meta").fetchall())
+        if meta:
+            if dim is not None and int(meta["dim"]) != dim:
+                raise ValueError(f"Store has dimension {meta['dim']}, requested {dim}")
+            dim, dtype = int(meta["dim"]), meta["dtype"]
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        if not readonly and dim is not None and os.path.exists(self.vectors_path):
+            with self._lock, self._file_lock() as f:
+                self._truncate_partial_row(f)
+
+    @staticmethod
+    def key(text: str, model: str) -> str:
+        """
+        Compute the store key of a text embedded with a given model.
+
+        Args:
+            text: Embedded text
+            model: Embedding model name
+
+        Returns:
+            str: Content-addressed key
+        """
+        return make_key("embedding", model, text)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    def _vectors(self, min_rows: int) -> np.ndarray:
+        """Memory map of the vectors file, remapped when it has grown."""
+        if self._map is None or len(self._map) < min_rows:
+            row_bytes = self.dim * self.dtype.itemsize
+            rows = os.path.getsize(self.vectors_path) // row_bytes
+            self._map = np.memmap(self.vectors_path, dtype=self.dtype, mode="r", shape=(rows, self.dim))
+        return self._map
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up vectors by key.
+
+        Args:
+            keys: Store keys
+
+        Returns:
+            List[Optional[np.ndarray]]: float32 vector per key, None when absent
+        """
+        if not keys or self.dim is None:
+            return [None] * len(keys)
+
+        rows: Dict[str, int] = {}
+        unique = list(dict.fromkeys(keys))
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows.update(self._conn.execute(
+                f"SELECT key, row FROM vectors WHERE key IN ({placeholders})", batch
+            ).fetchall())
+        if not rows:
+            return [None] * len(keys)
+
+        with self._lock:
+            vectors = self._vectors(max(rows.values()) + 1)
+        return [
+            np.asarray(vectors[rows[k]], dtype=np.float32) if k in rows else None
+            for k in keys
+        ]
+
+    @contextmanager
+    def _file_lock(self):
+        with open(self.vectors_path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _truncate_partial_row(self, f) -> int:
+        """
+        Drop a partial row left at the end of the vectors file by a torn write.
+
+        Called under the file lock. Rows after it would otherwise be written
+        at offsets that do not match their index rows.
+
+        Returns:
+            int: Number of complete rows in the file
+        """
+        row_bytes = self.dim * self.dtype.itemsize
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size % row_bytes:
+            f.truncate(size - size % row_bytes)
+        return size // row_bytes
+
+    def add_many(self, keys: Sequence[str], vectors: Sequence[Sequence[float]]):
+        """
+        Append vectors to the store.
+
+        Keys already present are skipped, so concurrent writers computing the
+        same embedding do not duplicate rows.
+
+        Args:
+            keys: Store keys
+            vectors: One vector per key
+        """
+        if self.readonly:
+            raise PermissionError("EmbeddingStore was opened read-only")
+        if not keys:
+            return
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) != len(keys):
+            raise ValueError("Expected one vector per key")
+
+        with self._lock, self._file_lock() as f:
+            if self.dim is None:
+                # Another process may have created the store since we opened it
+                meta = dict(self._conn.execute("SELECT name, value FROM meta").fetchall())
+                if meta:
+                    self.dim, self.dtype = int(meta["dim"]), np.dtype(meta["dtype"])
+                else:
+                    self.dim = matrix.shape[1]
+                    self._conn.executemany(
+                        "INSERT INTO meta (name, value) VALUES (?, ?)",
+                        [("dim", str(self.dim)), ("dtype", self.dtype.name)],
+                    )
+            if matrix.shape[1] != self.dim:
+                raise ValueError(f"Expected vectors of dimension {self.dim}, got {matrix.shape[1]}")
+
+            # Re-check under the lock: another process may have added some
+            new = {}
+            for key, vector in zip(keys, matrix):
+                new.setdefault(key, vector)
+            present = set()
+            for start in range(0, len(new), 500):
+                batch = list(new)[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                present.update(k for (k,) in self._conn.execute(
+                    f"SELECT key FROM vectors WHERE key IN ({placeholders})", batch
+                ))
+            new = {k: v for k, v in new.items() if k not in present}
+            if not new:
+                return
+
+            first_row = self._truncate_partial_row(f)
+            f.write(np.stack(list(new.values())).astype(self.dtype).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+            self._conn.executemany(
+                "INSERT INTO vectors (key, row) VALUES (?, ?)",
+                [(key, first_row + i) for i, key in enumerate(new)],
+            )
+
+    def close(self):
+        """Close the index and drop the memory map."""
+        self._map = None
+        self._conn.close()
+
+
+class CachedEmbeddings:
+    """
+    Embeddings wrapper serving previously seen texts from an EmbeddingStore.
+
+    Implements the LangChain/ragas embeddings interface (embed_query,
+    embed_documents and their async variants); other attributes are
+    delegated to the wrapped embeddings.
+
+    Attributes:
+        hits: Texts served from the store
+        misses: Texts sent to the wrapped embeddings
+    """
+
+    def __init__(self, embeddings, store: EmbeddingStore, model: Optional[str] = None):
+        """
+        Initialize Cached Embeddings.
+
+        Args:
+            embeddings: Embeddings instance to wrap
+            store: EmbeddingStore holding the vectors
+            model: Model name used in keys (default: inferred from ``embeddings``)
+        """
+        self.embeddings = embeddings
+        self.store = store
+        self.model = model or embedding_model_name(embeddings)
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, texts: Sequence[str]):
+        keys = [self.store.key(text, self.model) for text in texts]
+        found = self.store.get_many(keys)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, found) if v is None))
+        served = sum(v is not None for v in found)
+        self.hits += served
+        self.misses += len(texts) - served
+        return found, missing
+
+    def _complete(self, texts, found, missing, computed) -> np.ndarray:
+        if missing:
+            by_text = dict(zip(missing, np.asarray(computed, dtype=np.float32)))
+            if not self.store.readonly:
+                self.store.add_many([self.store.key(t, self.model) for t in missing], [by_text[t] for t in missing])
+            found = [v if v is not None else by_text[t] for t, v in zip(texts, found)]
+        if not found:
+            return np.zeros((0, self.store.dim or 0), dtype=np.float32)
+        return np.stack(found)
+
+    def embed_array(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts, returning a float32 matrix (one row per text).
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), dim)
+        """
+        found, missing = self._lookup(texts)
+        computed = self.embeddings.embed_documents(missing) if missing else []
+        return self._complete(texts, found, missing, computed)
+
+    async def aembed_array(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts asynchronously, returning a float32 matrix.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), dim)
+        """
+        found, missing = self._lookup(texts)
+        computed = await self.embeddings.aembed_documents(missing) if missing else []
+        return self._complete(texts, found, missing, computed)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_array(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_array([text])[0].tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return (await self.aembed_array(texts)).tolist()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_array([text]))[0].tolist()
+
+    def __getattr__(self, name):
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+
+def with_embedding_cache(
+    embeddings,
+    path: Optional[str] = None,
+    dtype: str = "float32",
+    readonly: bool = False,
+    model: Optional[str] = None,
+) -> CachedEmbeddings:
+    """
+    Wrap embeddings with a persistent memory-mapped cache.
+
+    Args:
+        embeddings: Embeddings instance to wrap
+        path: Store path prefix (default: .eval_cache/embeddings)
+        dtype: Storage type, 'float32' or 'float16'
+        readonly: Only read from the store (texts not found are embedded but not stored)
+        model: Model name used in keys (default: inferred)
+
+    Returns:
+        CachedEmbeddings: Wrapped embeddings to pass to evaluator factories
+    """
+    path = path or os.path.join(DEFAULT_CACHE_DIR, "embeddings")
+    return CachedEmbeddings(embeddings, EmbeddingStore(path, dtype=dtype, readonly=readonly), model=model)
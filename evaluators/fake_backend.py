@@ -0,0 +1,704 @@
+"""
+Fake LLM Backend
+
+Deterministic local stand-in for Azure OpenAI chat and embeddings, for
+benchmarking evaluators and runners without network access or credentials.
+
+- FakeBackend: Response generator with configurable latency, error rate and
+  rate limits (requests/tokens per minute, answered with 429 + Retry-After)
+- FakeChatModel / FakeEmbeddings: In-process LangChain models on a backend
+- FakeAzureOpenAIServer: HTTP endpoint speaking the Azure OpenAI (and plain
+  OpenAI) chat completions and embeddings API, for ``AzureChatOpenAI`` and
+  ``AzureOpenAIEmbeddings`` pointed at ``server.endpoint``
+- use_offline_tokenizer: Stops tiktoken from downloading encodings (ragas
+  counts tokens with it while generating test sets)
+
+Judge outputs are schema-valid: when a prompt carries a ragas output schema
+("... as specified in JSON Schema: {...}"), the reply is a JSON instance of
+it. Replies and embeddings depend only on the seed and the prompt.
+
+Run the server standalone:
+
+    python -m evaluators.fake_backend --port 8000 --latency 0.4 --rpm 600
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import random
+import re
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from .rate_limiter import TokenBucket
+
+
+# Markers ragas PydanticPrompt puts before the output schema and the input
+SCHEMA_MARKER = "as specified in JSON Schema:"
+INPUT_MARKER = "input: "
+
+_WORDS = (
+    "the answer context statement claim retrieved document supports response "
+    "question relevant evidence model value result reference information "
+    "source detail fact system user data"
+).split()
+
+_MAX_DICT_KEYS = 16
+
+_RANGE_PATTERN = re.compile(r"\b(\d+)\s+to\s+(\d+)\b")
+
+_PATH_PATTERN = re.compile(r"^/(?:openai/deployments/(?P<deployment>[^/]+)|v1)/(?P<operation>chat/completions|embeddings)$")
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class ApproximateEncoding:
+    """
+    Offline stand-in for a tiktoken Encoding.
+
+    Text is cut into 4-character pieces, each interned to an id, so token
+    counts are approximate but ``decode(encode(text)) == text``.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._ids: Dict[str, int] = {}
+        self._pieces: List[str] = []
+
+    def encode(self, text: str, **kwargs) -> List[int]:
+        ids = []
+        for start in range(0, len(text), 4):
+            piece = text[start:start + 4]
+            if piece not in self._ids:
+                self._ids[piece] = len(self._pieces)
+                self._pieces.append(piece)
+            ids.append(self._ids[piece])
+        return ids
+
+    def encode_ordinary(self, text: str) -> List[int]:
+        return self.encode(text)
+
+    def decode(self, tokens: Sequence[int], **kwargs) -> str:
+        return "".join(self._pieces[token] for token in tokens)
+
+
+def use_offline_tokenizer():
+    """
+    Make tiktoken return ApproximateEncoding instead of downloading encodings.
+
+    Returns:
+        Callable: Function restoring the real tiktoken loaders
+    """
+    import tiktoken
+
+    originals = (tiktoken.get_encoding, tiktoken.encoding_for_model)
+    tiktoken.get_encoding = ApproximateEncoding
+    tiktoken.encoding_for_model = lambda model_name: ApproximateEncoding(model_name)
+
+    def restore():
+        tiktoken.get_encoding, tiktoken.encoding_for_model = originals
+
+    return restore
+
+
+def extract_schema(prompt: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the JSON output schema embedded in a ragas prompt.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Optional[Dict[str, Any]]: JSON Schema, or None if the prompt has none
+    """
+    position = prompt.find(SCHEMA_MARKER)
+    if position < 0:
+        return None
+    start = prompt.find("{", position)
+    if start < 0:
+        return None
+    try:
+        schema, _ = json.JSONDecoder().raw_decode(prompt, start)
+    except ValueError:
+        return None
+    return schema if isinstance(schema, dict) else None
+
+
+def prompt_identifiers(prompt: str, field: Optional[str] = None, max_words: int = 8) -> List[str]:
+    """
+    Short strings (names, themes, entities) of the input a ragas prompt ends with.
+
+    Args:
+        prompt: Prompt text
+        field: Only take strings stored under this key (e.g. "name")
+        max_words: Longest string, in words, that counts as an identifier
+
+    Returns:
+        List[str]: Distinct identifiers in input order (empty if the prompt
+            has no JSON input)
+    """
+    position = prompt.rfind(INPUT_MARKER)
+    if position < 0:
+        return []
+    try:
+        data, _ = json.JSONDecoder().raw_decode(prompt, position + len(INPUT_MARKER))
+    except ValueError:
+        return []
+
+    found: Dict[str, None] = {}
+
+    def walk(value, key=None):
+        if isinstance(value, str):
+            if field in (None, key) and value.strip() and len(value.split()) <= max_words:
+                found.setdefault(value)
+        elif isinstance(value, dict):
+            for name, item in value.items():
+                walk(item, name)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item, key)
+
+    walk(data)
+    return list(found)
+
+
+def schema_instance(
+    schema: Dict[str, Any],
+    rng: random.Random,
+    root: Optional[Dict[str, Any]] = None,
+    depth: int = 0,
+    identifiers: Sequence[str] = (),
+    grounded: bool = False,
+    names: Sequence[str] = (),
+):
+    """
+    Generate a value valid against a JSON Schema.
+
+    Supports the subset produced by pydantic: objects, arrays, scalars,
+    enums/consts, ``$ref`` into ``$defs`` and ``anyOf``/``oneOf``/``allOf``.
+    Integers default to 0/1 (ragas verdicts) unless bounded by the schema or
+    by an "N to M" range in their description. Free-form dicts (e.g. ragas'
+    persona -> themes mapping) are keyed by the names of the input's
+    entities, and the strings inside them are drawn from its identifiers.
+
+    Args:
+        schema: JSON Schema
+        rng: Random source
+        root: Root schema for resolving references (default: ``schema``)
+        depth: Nesting depth (arrays are kept short deep down)
+        identifiers: Short strings of the prompt input (see ``prompt_identifiers``)
+        grounded: Draw strings from ``identifiers`` (inside free-form dicts)
+        names: Keys of free-form dicts (default: ``identifiers``)
+
+    Returns:
+        Generated value
+    """
+    root = root or schema
+    if "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        definitions = root.get("$defs") or root.get("definitions") or {}
+        return schema_instance(definitions.get(name, {}), rng, root, depth, identifiers, grounded, names)
+    if "const" in schema:
+        return schema["const"]
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            options = [s for s in schema[key] if s.get("type") != "null"] or schema[key]
+            return schema_instance(options[0], rng, root, depth, identifiers, grounded, names)
+
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind is None:
+        kind = "object" if "properties" in schema else "string"
+
+    if kind == "object":
+        values = schema.get("additionalProperties")
+        keys = names or identifiers
+        if "properties" not in schema and isinstance(values, dict) and keys:
+            return {
+                key: schema_instance(values, rng, root, depth + 1, identifiers, True, names)
+                for key in keys[:_MAX_DICT_KEYS]
+            }
+        return {
+            name: schema_instance(prop, rng, root, depth + 1, identifiers, grounded, names)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        low = schema.get("minItems", 1)
+        high = max(low, min(schema.get("maxItems", 3), 3 if depth < 2 or grounded else 1))
+        return [
+            schema_instance(schema.get("items", {}), rng, root, depth + 1, identifiers, grounded, names)
+            for _ in range(rng.randint(low, high))
+        ]
+    if kind == "integer":
+        # Scores ragas only bounds in prose, e.g. "1 to 5 score"
+        described = _RANGE_PATTERN.search(schema.get("description", ""))
+        low, high = (int(described.group(1)), int(described.group(2))) if described else (0, 1)
+        return rng.randint(schema.get("minimum", low), schema.get("maximum", high))
+    if kind == "number":
+        low, high = schema.get("minimum", 0.0), schema.get("maximum", 1.0)
+        return round(low + rng.random() * (high - low), 4)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    if grounded and identifiers:
+        return rng.choice([i for i in identifiers if i not in names] or identifiers)
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 8)))
+
+
+class FakeAPIError(Exception):
+    """
+    Error returned by the fake service.
+
+    Mirrors the OpenAI client's errors: ``status_code`` and a ``response``
+    with ``headers`` (Retry-After on 429), so the rate limiter handles it
+    like the real thing.
+    """
+
+    class _Response:
+        def __init__(self, status_code: int, headers: Dict[str, str]):
+            self.status_code = status_code
+            self.headers = headers
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+        self.message = message
+        self.retry_after = retry_after
+        headers = {}
+        if retry_after is not None:
+            headers = {"retry-after": str(math.ceil(retry_after)), "retry-after-ms": str(int(retry_after * 1000))}
+        self.response = self._Response(status_code, headers)
+
+
+class FakeBackend:
+    """
+    Deterministic judge/embedding generator with simulated service behaviour.
+
+    Attributes:
+        calls: Requests received (including rejected ones)
+        errors: Requests failed with a simulated 500
+        rate_limited: Requests rejected with 429
+        prompt_tokens: Prompt tokens of accepted requests
+        completion_tokens: Completion tokens generated
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        latency: float = 0.0,
+        latency_sigma: float = 0.0,
+        error_rate: float = 0.0,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        embedding_dim: int = 256,
+    ):
+        """
+        Initialize Fake Backend.
+
+        Args:
+            seed: Seed of replies, embeddings and simulated failures
+            latency: Median latency per request in seconds
+            latency_sigma: Log-normal spread of latency (0: constant)
+            error_rate: Fraction of requests failing with HTTP 500
+            requests_per_minute: Request quota (None: unlimited)
+            tokens_per_minute: Token quota (None: unlimited)
+            embedding_dim: Dimension of embedding vectors
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError(f"error_rate must be in [0, 1], got {error_rate}")
+        self.seed = seed
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.embedding_dim = embedding_dim
+        self._request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def admit(self, tokens: int) -> float:
+        """
+        Apply quotas and failure injection to an incoming request.
+
+        Args:
+            tokens: Prompt tokens of the request
+
+        Returns:
+            float: Simulated latency in seconds
+
+        Raises:
+            FakeAPIError: 429 when over quota, 500 for injected failures
+        """
+        with self._lock:
+            self.calls += 1
+            roll = self._rng.random()
+            latency = self.latency * math.exp(self._rng.gauss(0.0, self.latency_sigma)) if self.latency_sigma else self.latency
+
+        for bucket, amount in ((self._request_bucket, 1), (self._token_bucket, tokens)):
+            wait = bucket.try_take(amount) if bucket is not None else 0.0
+            if wait > 0:
+                with self._lock:
+                    self.rate_limited += 1
+                raise FakeAPIError(429, "Rate limit exceeded. Please retry after the time given in the headers.", retry_after=wait)
+        if roll < self.error_rate:
+            with self._lock:
+                self.errors += 1
+            raise FakeAPIError(500, "The server had an error while processing your request.")
+        with self._lock:
+            self.prompt_tokens += tokens
+        return latency
+
+    def complete(self, prompt: str, n: int = 1) -> List[str]:
+        """
+        Generate ``n`` replies to a prompt.
+
+        Args:
+            prompt: Full prompt text
+            n: Number of completions
+
+        Returns:
+            List[str]: Replies (JSON instances of the prompt's schema, if any)
+        """
+        schema = extract_schema(prompt)
+        identifiers = prompt_identifiers(prompt) if schema is not None else []
+        names = prompt_identifiers(prompt, field="name") if schema is not None else []
+        replies = []
+        for index in range(n):
+            rng = random.Random(f"{self.seed}:{index}:{prompt}")
+            if schema is not None:
+                replies.append(json.dumps(schema_instance(schema, rng, identifiers=identifiers, names=names)))
+            else:
+                replies.append(" ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 24))).capitalize() + ".")
+        with self._lock:
+            self.completion_tokens += sum(count_tokens(r) for r in replies)
+        return replies
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """
+        Embed texts as normalized hashed bags of words.
+
+        Texts sharing words get similar vectors, so similarity metrics
+        produce a realistic spread of scores.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List[List[float]]: One unit vector per text
+        """
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.embedding_dim
+            for word in text.lower().split() or [""]:
+                digest = hashlib.blake2b(f"{self.seed}:{word}".encode(), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                vector[value % self.embedding_dim] += 1.0 if value >> 63 else -1.0
+            norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+            vectors.append([v / norm for v in vector])
+        return vectors
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Request counters.
+
+        Returns:
+            Dict[str, int]: calls, errors, rate_limited and token counts
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
+
+
+def _messages_text(messages) -> str:
+    parts = []
+    for message in messages:
+        content = message.content if hasattr(message, "content") else message.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+        parts.append(str(content))
+    return "\n".join(parts)
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    In-process LangChain chat model answering from a FakeBackend.
+
+    Drop-in replacement for ``AzureChatOpenAI`` in evaluator factories and
+    ``ragas.evaluate``.
+    """
+
+    backend: Any = None
+    deployment_name: str = "gpt-4o"
+    temperature: float = 0.0
+    n: int = 1
+
+    def __init__(self, backend: Optional[FakeBackend] = None, **kwargs):
+        super().__init__(backend=backend or FakeBackend(), **kwargs)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-azure-openai-chat"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"deployment_name": self.deployment_name, "temperature": self.temperature, "seed": self.backend.seed}
+
+    def _reply(self, messages, kwargs) -> Tuple[float, ChatResult]:
+        prompt = _messages_text(messages)
+        prompt_tokens = count_tokens(prompt)
+        latency = self.backend.admit(prompt_tokens)
+        replies = self.backend.complete(prompt, n=kwargs.get("n", self.n))
+        generations = []
+        for reply in replies:
+            completion_tokens = count_tokens(reply)
+            message = AIMessage(content=reply, usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            })
+            generations.append(ChatGeneration(message=message))
+        completion_tokens = sum(count_tokens(r) for r in replies)
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                 "total_tokens": prompt_tokens + completion_tokens}
+        return latency, ChatResult(generations=generations, llm_output={"token_usage": usage, "model_name": self.deployment_name})
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        latency, result = self._reply(messages, kwargs)
+        time.sleep(latency)
+        return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        latency, result = self._reply(messages, kwargs)
+        await asyncio.sleep(latency)
+        return result
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    In-process LangChain embeddings answering from a FakeBackend.
+    """
+
+    def __init__(self, backend: Optional[FakeBackend] = None, model: str = "text-embedding-3-small"):
+        """
+        Initialize Fake Embeddings.
+
+        Args:
+            backend: Backend to use (default: a fresh FakeBackend)
+            model: Reported embedding model name
+        """
+        self.backend = backend or FakeBackend()
+        self.model = model
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self.backend.admit(sum(count_tokens(t) for t in texts)))
+        return self.backend.embed(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(self.backend.admit(sum(count_tokens(t) for t in texts)))
+        return self.backend.embed(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Azure OpenAI / OpenAI compatible request handler."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        match = _PATH_PATTERN.match(self.path.split("?", 1)[0])
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, {"error": {"code": "invalid_json", "message": "Request body is not JSON"}})
+            return
+        if match is None:
+            self._send(404, {"error": {"code": "404", "message": f"Resource not found: {self.path}"}})
+            return
+
+        backend: FakeBackend = self.server.backend
+        model = match.group("deployment") or body.get("model", "fake")
+        try:
+            if match.group("operation") == "embeddings":
+                response = self._embeddings(backend, body, model)
+            else:
+                response = self._chat(backend, body, model)
+        except FakeAPIError as e:
+            self._send(e.status_code, {"error": {"code": str(e.status_code), "message": e.message}}, e.response.headers)
+            return
+        self._send(200, response)
+
+    def _chat(self, backend: FakeBackend, body: Dict[str, Any], model: str) -> Dict[str, Any]:
+        prompt = _messages_text(body.get("messages", []))
+        prompt_tokens = count_tokens(prompt)
+        time.sleep(backend.admit(prompt_tokens))
+        replies = backend.complete(prompt, n=body.get("n") or 1)
+        completion_tokens = sum(count_tokens(r) for r in replies)
+        return {
+            "id": "chatcmpl-fake-" + hashlib.sha1(prompt.encode()).hexdigest()[:24],
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {"index": i, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop", "logprobs": None}
+                for i, reply in enumerate(replies)
+            ],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }
+
+    def _embeddings(self, backend: FakeBackend, body: Dict[str, Any], model: str) -> Dict[str, Any]:
+        texts = body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+        # Token-id inputs (as sent by tiktoken-aware clients) are embedded by their ids
+        texts = [t if isinstance(t, str) else " ".join(map(str, t)) for t in texts]
+        tokens = sum(count_tokens(t) for t in texts)
+        time.sleep(backend.admit(tokens))
+        vectors = backend.embed(texts)
+        if body.get("encoding_format") == "base64":
+            vectors = [base64.b64encode(struct.pack(f"<{len(v)}f", *v)).decode() for v in vectors]
+        return {
+            "object": "list",
+            "data": [{"object": "embedding", "index": i, "embedding": v} for i, v in enumerate(vectors)],
+            "model": model,
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+
+class FakeAzureOpenAIServer:
+    """
+    Local HTTP endpoint serving a FakeBackend with the Azure OpenAI API.
+
+    Usage:
+        with FakeAzureOpenAIServer(FakeBackend(latency=0.2)) as server:
+            llm = AzureChatOpenAI(azure_endpoint=server.endpoint, api_key="fake",
+                                  api_version="2024-12-01-preview", azure_deployment="gpt-4o")
+    """
+
+    def __init__(self, backend: Optional[FakeBackend] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize Fake Azure OpenAI Server.
+
+        Args:
+            backend: Backend to serve (default: a fresh FakeBackend)
+            host: Interface to bind
+            port: Port to bind (0: pick a free port)
+        """
+        self.backend = backend or FakeBackend()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.backend = self.backend
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAzureOpenAIServer":
+        """Serve requests on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="fake-azure-openai", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self):
+        """Serve requests on the calling thread."""
+        self._server.serve_forever()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a deterministic fake Azure OpenAI endpoint.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Median latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.0, help="Log-normal latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 500")
+    parser.add_argument("--rpm", type=float, default=None, help="Requests per minute quota")
+    parser.add_argument("--tpm", type=float, default=None, help="Tokens per minute quota")
+    parser.add_argument("--embedding-dim", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    backend = FakeBackend(
+        seed=args.seed,
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        embedding_dim=args.embedding_dim,
+    )
+    server = FakeAzureOpenAIServer(backend, host=args.host, port=args.port)
+    print(f"Fake Azure OpenAI endpoint listening on {server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,16 +9,17 @@ Metrics for general evaluation tasks:
 - Summarization: Task-specific summary quality evaluation
 """
 
-from .aspect_critic_evaluator import create_aspect_critic_evaluator
-from .simple_criteria_scoring_evaluator import create_simple_criteria_scoring_evaluator
-from .rubrics_based_scoring_evaluator import create_rubrics_based_scoring_evaluator
-from .instance_specific_rubrics_scoring_evaluator import create_instance_specific_rubrics_scoring_evaluator
-from .summarization_evaluator import create_summarization_evaluator
+from ..registry import lazy_exports
 
-__all__ = [
-    "create_aspect_critic_evaluator",
-    "create_simple_criteria_scoring_evaluator",
-    "create_rubrics_based_scoring_evaluator",
-    "create_instance_specific_rubrics_scoring_evaluator",
-    "create_summarization_evaluator",
-]
+# Factory name -> module defining it, imported on first access
+_EXPORTS = {
+    "create_aspect_critic_evaluator": ".aspect_critic_evaluator",
+    "create_simple_criteria_scoring_evaluator": ".simple_criteria_scoring_evaluator",
+    "create_rubrics_based_scoring_evaluator": ".rubrics_based_scoring_evaluator",
+    "create_instance_specific_rubrics_scoring_evaluator": ".instance_specific_rubrics_scoring_evaluator",
+    "create_summarization_evaluator": ".summarization_evaluator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -9,8 +9,10 @@ Example aspects: maliciousness, bias, relevance, helpfulness, etc.
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class AspectCriticEvaluator:
+
+class AspectCriticEvaluator(BaseEvaluator):
     """
     Aspect Critic metric evaluator.
     
@@ -18,6 +20,9 @@ class AspectCriticEvaluator:
     Uses majority voting from multiple LLM verdicts for robustness.
     """
     
+    metric_name = "aspect_critic"
+    sample_fields = ("user_input", "response", "retrieved_contexts", "reference")
+    
     def __init__(self, llm=None, name: str = "", definition: str = ""):
         """
         Initialize Aspect Critic Evaluator.
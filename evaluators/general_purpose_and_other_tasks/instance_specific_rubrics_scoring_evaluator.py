@@ -9,8 +9,10 @@ Useful for heterogeneous datasets where different items need different evaluatio
 
 from typing import Optional, Dict
 
+from ..base import BaseEvaluator
 
-class InstanceSpecificRubricsScoringEvaluator:
+
+class InstanceSpecificRubricsScoringEvaluator(BaseEvaluator):
     """
     Instance Specific Rubrics Scoring metric evaluator.
     
@@ -18,6 +20,9 @@ class InstanceSpecificRubricsScoringEvaluator:
     enabling personalized evaluation criteria.
     """
     
+    metric_name = "instance_specific_rubrics_scoring"
+    sample_fields = ("user_input", "response", "retrieved_contexts", "reference", "rubrics")
+    
     def __init__(self, llm=None):
         """
         Initialize Instance Specific Rubrics Scoring Evaluator.
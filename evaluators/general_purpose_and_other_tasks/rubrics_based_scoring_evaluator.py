@@ -9,8 +9,10 @@ Example rubrics: score1_description through score5_description
 
 from typing import Optional, Dict
 
+from ..base import BaseEvaluator
 
-class RubricsBasedScoringEvaluator:
+
+class RubricsBasedScoringEvaluator(BaseEvaluator):
     """
     Rubrics Based Scoring metric evaluator.
     
@@ -18,6 +20,9 @@ class RubricsBasedScoringEvaluator:
     to evaluate responses consistently across a dataset.
     """
     
+    metric_name = "rubrics_based_scoring"
+    sample_fields = ("user_input", "response", "retrieved_contexts", "reference")
+    
     def __init__(self, llm=None, rubrics: Dict[str, str] = None):
         """
         Initialize Rubrics Based Scoring Evaluator.
@@ -9,8 +9,10 @@ Example: Score 0-5 by similarity, Score 1-10 for helpfulness, etc.
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class SimpleCriteriaScoringEvaluator:
+
+class SimpleCriteriaScoringEvaluator(BaseEvaluator):
     """
     Simple Criteria Scoring metric evaluator.
     
@@ -18,6 +20,9 @@ class SimpleCriteriaScoringEvaluator:
     within a user-defined range.
     """
     
+    metric_name = "simple_criteria_scoring"
+    sample_fields = ("user_input", "response", "retrieved_contexts", "reference")
+    
     def __init__(self, llm=None, name: str = "", definition: str = "",
                  score_range: tuple = (0, 5)):
         """
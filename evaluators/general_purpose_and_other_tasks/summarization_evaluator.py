@@ -8,8 +8,10 @@ from the source text while maintaining conciseness.
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class SummarizationEvaluator:
+
+class SummarizationEvaluator(BaseEvaluator):
     """
     Summarization metric evaluator.
     
@@ -17,6 +19,9 @@ class SummarizationEvaluator:
     or source material using multiple evaluation dimensions.
     """
     
+    metric_name = "summarization"
+    sample_fields = ("response", "reference_contexts")
+    
     def __init__(self, llm=None, embeddings=None):
         """
         Initialize Summarization Evaluator.
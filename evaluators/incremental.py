@@ -0,0 +1,252 @@
+"""
+Incremental Evaluation
+
+Re-runs only the (sample, evaluator) cells whose inputs changed since a
+previous run and reuses every other score from a persistent results store.
+
+A cell is identified by two fingerprints:
+- Evaluator: class plus configuration (e.g. ``atomicity="low"``), with the
+  judge LLM and embeddings reduced to their model identity
+- Sample: the fields the evaluator reads (``BaseEvaluator.sample_fields``);
+  samples without any of them are fingerprinted as a whole
+
+Editing one row re-evaluates that row only; changing one evaluator's
+parameters re-evaluates that evaluator only:
+
+    runner = IncrementalRunner([faithfulness, factual_correctness])
+    results = runner.run("data/**/*.jsonl")
+    print(runner.reused, runner.computed)
+
+Only successful scores are stored, so failed cells are retried next time.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .base import BaseEvaluator, EvaluationResult, get_sample_field
+from .cache import DEFAULT_CACHE_DIR, MISSING, DiskCache, make_key
+from .embedding_cache import embedding_model_name
+from .llm_proxy import llm_identity
+from .parallel import ExecutionMode
+from .pipeline import is_path_spec, iter_jsonl
+from .runner import EvaluationRunner
+
+
+# Attributes holding models: fingerprinted by model identity, not by object
+_MODEL_ATTRIBUTES = {
+    "llm": llm_identity,
+    "vision_model": llm_identity,
+    "embeddings": embedding_model_name,
+}
+
+
+def _plain(value) -> bool:
+    """Whether a value is JSON-like configuration."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_plain(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _plain(v) for k, v in value.items())
+    return False
+
+
+def evaluator_fingerprint(evaluator: BaseEvaluator) -> str:
+    """
+    Fingerprint an evaluator's class and configuration.
+
+    Public instance attributes are included by value; models by identity
+    (see ``llm_proxy.llm_identity``); other objects (caches, stores) by type.
+
+    Args:
+        evaluator: Evaluator instance
+
+    Returns:
+        str: Configuration hash
+    """
+    config: Dict[str, Any] = {}
+    for name, value in vars(evaluator).items():
+        if name == "_llm":  # BaseEvaluator.llm storage
+            name = "llm"
+        elif name.startswith("_"):
+            continue
+        if value is None or _plain(value):
+            config[name] = value
+        elif name in _MODEL_ATTRIBUTES:
+            config[name] = _MODEL_ATTRIBUTES[name](value)
+        else:
+            config[name] = type(value).__qualname__
+    cls = type(evaluator)
+    return make_key("evaluator", f"{cls.__module__}.{cls.__qualname__}", config)
+
+
+def sample_fingerprint(sample, fields: Optional[Iterable[str]] = None) -> str:
+    """
+    Fingerprint the fields of a sample that an evaluator reads.
+
+    Args:
+        sample: Sample object or dictionary
+        fields: Relevant field names (None: the whole sample)
+
+    Returns:
+        str: Content hash (the sample's "id" does not contribute)
+    """
+    content = None
+    if fields:
+        present = {}
+        for field in fields:
+            value = get_sample_field(sample, field, MISSING)
+            if value is not MISSING:
+                present[field] = value
+        if present:
+            content = present
+    if content is None:
+        content = sample.model_dump() if hasattr(sample, "model_dump") else sample
+        if isinstance(content, dict):
+            # Only the row's own "id": nested ids (e.g. tool call arguments) are content
+            content = {key: value for key, value in content.items() if key != "id"}
+    return make_key("sample", content)
+
+
+class IncrementalRunner:
+    """
+    Evaluation runner that reuses scores of unchanged cells.
+
+    Attributes:
+        reused: Cells served from the store in the last run
+        computed: Cells evaluated in the last run
+        failed: Cells that raised in the last run
+    """
+
+    def __init__(
+        self,
+        evaluators: Union[Iterable[BaseEvaluator], Mapping[str, BaseEvaluator]],
+        store: Union[DiskCache, str, None] = None,
+        max_concurrency: int = 64,
+        per_evaluator_concurrency: Union[int, Mapping[str, int], None] = None,
+        cpu_execution: Optional[ExecutionMode] = None,
+    ):
+        """
+        Initialize Incremental Runner.
+
+        Args:
+            evaluators: Evaluator instances, or a mapping of result name to instance
+            store: Results store, or path of its SQLite file
+                (default: .eval_cache/results.sqlite)
+            max_concurrency: Maximum jobs in flight across all evaluators
+            per_evaluator_concurrency: Maximum jobs in flight per evaluator
+            cpu_execution: Pool used for ``cpu_bound`` evaluators (None: event loop)
+        """
+        self.runner = EvaluationRunner(
+            evaluators,
+            max_concurrency=max_concurrency,
+            per_evaluator_concurrency=per_evaluator_concurrency,
+            cpu_execution=cpu_execution,
+        )
+        if not isinstance(store, DiskCache):
+            store = DiskCache(store or os.path.join(DEFAULT_CACHE_DIR, "results.sqlite"))
+        self.store = store
+        self.reused = 0
+        self.computed = 0
+        self.failed = 0
+
+    def cell_keys(self, samples: List[Any]) -> List[Dict[str, str]]:
+        """
+        Compute the store key of every (sample, evaluator) cell.
+
+        Args:
+            samples: Samples
+
+        Returns:
+            List[Dict[str, str]]: Per sample, evaluator name -> cell key
+        """
+        configs = {name: evaluator_fingerprint(e) for name, e in self.runner.evaluators.items()}
+        fields = {name: getattr(e, "sample_fields", None) for name, e in self.runner.evaluators.items()}
+        keys = []
+        for sample in samples:
+            # Evaluators reading the same fields share one sample fingerprint
+            by_fields: Dict[Optional[Tuple[str, ...]], str] = {}
+            row = {}
+            for name, config in configs.items():
+                field_set = tuple(fields[name]) if fields[name] else None
+                if field_set not in by_fields:
+                    by_fields[field_set] = sample_fingerprint(sample, field_set)
+                row[name] = make_key("cell", config, by_fields[field_set])
+            keys.append(row)
+        return keys
+
+    @staticmethod
+    def _samples(dataset) -> List[Any]:
+        if is_path_spec(dataset):
+            return [sample for _, sample in iter_jsonl(dataset)]
+        return list(dataset)
+
+    def stale(self, dataset) -> List[Tuple[int, str]]:
+        """
+        List the cells a run would evaluate, without running anything.
+
+        Args:
+            dataset: Samples or JSONL path(s)
+
+        Returns:
+            List[Tuple[int, str]]: (sample index, evaluator name) of stale cells
+        """
+        keys = self.cell_keys(self._samples(dataset))
+        return [
+            (index, name)
+            for index, row in enumerate(keys)
+            for name, key in row.items()
+            if key not in self.store
+        ]
+
+    async def arun(self, dataset) -> List[Dict[str, EvaluationResult]]:
+        """
+        Evaluate stale cells and reuse stored scores for the rest.
+
+        Args:
+            dataset: Samples or JSONL path(s)
+
+        Returns:
+            List[Dict[str, EvaluationResult]]: Per-sample results keyed by evaluator name
+        """
+        samples = self._samples(dataset)
+        keys = self.cell_keys(samples)
+
+        stored: Dict[Tuple[int, str], Any] = {}
+        for index, row in enumerate(keys):
+            for name, key in row.items():
+                score = self.store.get(key, MISSING)
+                if score is not MISSING:
+                    stored[(index, name)] = score
+
+        self.reused = len(stored)
+        self.computed = 0
+        self.failed = 0
+
+        def skip(index: int, name: str) -> bool:
+            return (index, name) in stored
+
+        def on_result(index: int, name: str, result: EvaluationResult):
+            if result.ok:
+                self.computed += 1
+                self.store.set(keys[index][name], result.score)
+            else:
+                self.failed += 1
+
+        results = await self.runner.arun(samples, on_result=on_result, skip=skip)
+        for (index, name), score in stored.items():
+            results[index][name] = EvaluationResult(index, score=score)
+        return results
+
+    def run(self, dataset) -> List[Dict[str, EvaluationResult]]:
+        """
+        Evaluate stale cells from synchronous code.
+
+        Args:
+            dataset: Samples or JSONL path(s)
+
+        Returns:
+            List[Dict[str, EvaluationResult]]: Per-sample results keyed by evaluator name
+        """
+        return asyncio.run(self.arun(dataset))
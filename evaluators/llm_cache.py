@@ -0,0 +1,150 @@
+"""
+LLM Response Cache
+
+Persistent, content-addressed cache for judge calls made by LLM-backed
+evaluators (faithfulness, context precision/recall, aspect critic, rubrics,
+NVIDIA metrics, ...).
+
+Wrap the ``llm`` before passing it to the evaluator factories:
+
+    llm = with_llm_cache(AzureChatOpenAI(..., temperature=0))
+    faithfulness = create_faithfulness_evaluator(llm=llm)
+
+Each call is keyed by a hash of:
+- the model identity (class, deployment/model name, temperature and other
+  sampling parameters)
+- the generation method
+- the prompt/messages and call parameters (callbacks and tracing config
+  are ignored)
+
+Re-running a suite only pays for prompts that actually changed. Caching is
+meant for deterministic judges (temperature=0); sampled responses are cached
+too, keyed by their sampling parameters.
+"""
+
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import DEFAULT_CACHE_DIR, MISSING, DiskCache, make_key
+from .llm_proxy import ASYNC_METHODS, SYNC_METHODS, LLMProxy, llm_identity
+
+
+# Call arguments that do not influence the response
+_IGNORED_KWARGS = frozenset({"callbacks", "config", "run_manager", "run_name", "tags", "metadata", "run_id"})
+
+# ainvoke -> invoke, agenerate -> generate, ...
+_SYNC_EQUIVALENT = dict(zip(ASYNC_METHODS, SYNC_METHODS))
+
+# Message fields that vary between otherwise identical prompts
+_IGNORED_MESSAGE_FIELDS = frozenset({"id", "response_metadata", "usage_metadata"})
+
+
+def canonical_prompt(value: Any) -> Any:
+    """
+    Convert prompts, messages and call parameters to a stable JSON-like form.
+
+    Handles plain strings, LangChain prompt values (``to_messages``), messages
+    and other pydantic models (``model_dump``), and nested containers.
+
+    Args:
+        value: Prompt or argument value
+
+    Returns:
+        JSON-like structure suitable for ``make_key``
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): canonical_prompt(v) for k, v in value.items() if k not in _IGNORED_MESSAGE_FIELDS}
+    if isinstance(value, (list, tuple)):
+        return [canonical_prompt(v) for v in value]
+    if hasattr(value, "to_messages"):
+        return canonical_prompt(value.to_messages())
+    if hasattr(value, "model_dump"):
+        return {"__type__": type(value).__name__, **canonical_prompt(value.model_dump())}
+    return repr(value)
+
+
+class CachedLLM(LLMProxy):
+    """
+    LLM wrapper serving repeated calls from a DiskCache.
+
+    Attributes:
+        cache: Backing DiskCache (exposes hits/misses statistics)
+    """
+
+    def __init__(self, llm, cache: DiskCache):
+        """
+        Initialize Cached LLM.
+
+        Args:
+            llm: LLM instance to wrap
+            cache: DiskCache to store responses in
+        """
+        super().__init__(llm)
+        self.cache = cache
+        self._identity = llm_identity(llm)
+
+    def cache_key(self, method: str, args: Tuple, kwargs: Dict[str, Any]) -> str:
+        """
+        Compute the cache key of a generation call.
+
+        Args:
+            method: Generation method name
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            str: Content-addressed key
+        """
+        params = {k: v for k, v in kwargs.items() if k not in _IGNORED_KWARGS}
+        # The sync and async variants of a method return the same value
+        return make_key(
+            "llm",
+            self._identity,
+            _SYNC_EQUIVALENT.get(method, method),
+            canonical_prompt(list(args)),
+            canonical_prompt(params),
+        )
+
+    def _call(self, method, args, kwargs):
+        key = self.cache_key(method, args, kwargs)
+        cached = self.cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached
+        response = super()._call(method, args, kwargs)
+        self.cache.set(key, response)
+        return response
+
+    async def _acall(self, method, args, kwargs):
+        key = self.cache_key(method, args, kwargs)
+        cached = self.cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached
+        response = await super()._acall(method, args, kwargs)
+        self.cache.set(key, response)
+        return response
+
+
+def with_llm_cache(
+    llm,
+    path: Optional[str] = None,
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = 1024 ** 3,
+    ttl: Optional[float] = None,
+) -> CachedLLM:
+    """
+    Wrap an LLM with a persistent response cache.
+
+    Args:
+        llm: LLM instance to wrap
+        path: SQLite file (default: .eval_cache/llm_responses.sqlite)
+        max_entries: Maximum cached responses (None: unbounded)
+        max_bytes: Maximum total response size in bytes, LRU-evicted (default: 1 GiB)
+        ttl: Seconds before a cached response expires (None: never)
+
+    Returns:
+        CachedLLM: Wrapped LLM to pass to evaluator factories
+    """
+    path = path or os.path.join(DEFAULT_CACHE_DIR, "llm_responses.sqlite")
+    return CachedLLM(llm, DiskCache(path, max_entries=max_entries, max_bytes=max_bytes, ttl=ttl))
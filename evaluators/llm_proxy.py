@@ -0,0 +1,112 @@
+"""
+LLM Proxy
+
+Base class for wrappers around the ``llm`` passed to evaluator factories
+(e.g. a LangChain ``AzureChatOpenAI``).
+
+The proxy forwards every attribute to the wrapped model and routes the
+generation entry points through two hooks that subclasses override:
+- _call(method, args, kwargs) for invoke / generate / generate_prompt
+- _acall(method, args, kwargs) for ainvoke / agenerate / agenerate_prompt
+
+Proxies can be stacked, e.g. a cache in front of a rate limiter.
+"""
+
+from typing import Any, Dict, Tuple
+
+
+SYNC_METHODS = ("invoke", "generate", "generate_prompt")
+ASYNC_METHODS = ("ainvoke", "agenerate", "agenerate_prompt")
+
+# Attributes identifying which model and sampling parameters produce a response
+_IDENTITY_ATTRIBUTES = (
+    "deployment_name",
+    "azure_deployment",
+    "model_name",
+    "model",
+    "temperature",
+    "top_p",
+    "max_tokens",
+    "n",
+    "seed",
+    "stop",
+)
+
+
+def llm_identity(llm) -> Dict[str, Any]:
+    """
+    Describe the model and parameters of an LLM for cache keys.
+
+    Uses LangChain's ``_identifying_params`` when available and falls back to
+    well-known attributes otherwise.
+
+    Args:
+        llm: LLM instance (proxies are unwrapped)
+
+    Returns:
+        Dict[str, Any]: JSON-like description of the model
+    """
+    while isinstance(llm, LLMProxy):
+        llm = llm.llm
+    identity: Dict[str, Any] = {"class": type(llm).__name__}
+    params = getattr(llm, "_identifying_params", None)
+    if isinstance(params, dict):
+        identity.update(params)
+    for name in _IDENTITY_ATTRIBUTES:
+        value = getattr(llm, name, None)
+        if value is not None and isinstance(value, (str, int, float, bool, list, tuple)):
+            identity.setdefault(name, value)
+    return identity
+
+
+class LLMProxy:
+    """
+    Transparent wrapper around an LLM.
+
+    Subclasses override ``_call`` / ``_acall`` to add behaviour around the
+    generation methods; everything else is delegated to the wrapped model.
+    """
+
+    def __init__(self, llm):
+        """
+        Initialize LLM Proxy.
+
+        Args:
+            llm: LLM instance to wrap
+        """
+        self.llm = llm
+
+    def _call(self, method: str, args: Tuple, kwargs: Dict[str, Any]):
+        """Invoke a synchronous generation method on the wrapped LLM."""
+        return getattr(self.llm, method)(*args, **kwargs)
+
+    async def _acall(self, method: str, args: Tuple, kwargs: Dict[str, Any]):
+        """Invoke an asynchronous generation method on the wrapped LLM."""
+        return await getattr(self.llm, method)(*args, **kwargs)
+
+    def invoke(self, *args, **kwargs):
+        return self._call("invoke", args, kwargs)
+
+    def generate(self, *args, **kwargs):
+        return self._call("generate", args, kwargs)
+
+    def generate_prompt(self, *args, **kwargs):
+        return self._call("generate_prompt", args, kwargs)
+
+    async def ainvoke(self, *args, **kwargs):
+        return await self._acall("ainvoke", args, kwargs)
+
+    async def agenerate(self, *args, **kwargs):
+        return await self._acall("agenerate", args, kwargs)
+
+    async def agenerate_prompt(self, *args, **kwargs):
+        return await self._acall("agenerate_prompt", args, kwargs)
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the proxy itself
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.llm!r})"
@@ -11,20 +11,19 @@ Metrics for comparing natural language outputs:
 - Exact Match: Binary exact match comparison
 """
 
-from .factual_correctness_evaluator import create_factual_correctness_evaluator
-from .semantic_similarity_evaluator import create_semantic_similarity_evaluator
-from .nonllm_string_similarity_evaluator import create_nonllm_string_similarity_evaluator
-from .bleu_score_evaluator import create_bleu_score_evaluator
-from .rouge_score_evaluator import create_rouge_score_evaluator
-from .string_presence_evaluator import create_string_presence_evaluator
-from .exact_match_evaluator import create_exact_match_evaluator
+from ..registry import lazy_exports
 
-__all__ = [
-    "create_factual_correctness_evaluator",
-    "create_semantic_similarity_evaluator",
-    "create_nonllm_string_similarity_evaluator",
-    "create_bleu_score_evaluator",
-    "create_rouge_score_evaluator",
-    "create_string_presence_evaluator",
-    "create_exact_match_evaluator",
-]
+# Factory name -> module defining it, imported on first access
+_EXPORTS = {
+    "create_factual_correctness_evaluator": ".factual_correctness_evaluator",
+    "create_semantic_similarity_evaluator": ".semantic_similarity_evaluator",
+    "create_nonllm_string_similarity_evaluator": ".nonllm_string_similarity_evaluator",
+    "create_bleu_score_evaluator": ".bleu_score_evaluator",
+    "create_rouge_score_evaluator": ".rouge_score_evaluator",
+    "create_string_presence_evaluator": ".string_presence_evaluator",
+    "create_exact_match_evaluator": ".exact_match_evaluator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
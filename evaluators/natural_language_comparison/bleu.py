@@ -0,0 +1,225 @@
+"""
+Batch BLEU Engine
+
+Sentence- and corpus-level BLEU for whole datasets in one pass.
+
+Texts are tokenized once per batch and n-grams are counted with hashed
+integer encodings (see ``ngrams``), so a batch costs a few NumPy sorts
+rather than one Counter per sentence and order.
+
+Corpus BLEU follows Papineni et al.: clipped matches, n-gram totals and
+lengths are summed over the corpus before taking precisions and the
+brevity penalty, which is not the mean of sentence scores. Like
+``nltk.translate.bleu_score`` without smoothing, a sentence with no match
+for some weighted order scores 0. Unlike nltk, hypotheses shorter than n
+contribute no order-n n-grams to the corpus totals (nltk counts one).
+
+    accumulator = BLEUAccumulator()
+    for hypotheses, references in chunks:          # larger-than-memory datasets
+        sentence_scores = accumulator.add(hypotheses, references)
+    print(accumulator.score)
+"""
+
+from itertools import islice, zip_longest
+from typing import Iterable, Sequence, Tuple
+
+import numpy as np
+
+from .ngrams import TokenEncoder, ngram_overlap, row_lengths
+
+
+DEFAULT_WEIGHTS = (0.25, 0.25, 0.25, 0.25)
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def bleu_statistics(
+    hypotheses: Sequence[str],
+    references: Sequence[str],
+    max_n: int = 4,
+    lowercase: bool = False,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count the sufficient statistics of BLEU for aligned pairs.
+
+    Args:
+        hypotheses: Generated texts
+        references: Reference texts (one per hypothesis)
+        max_n: Highest n-gram order
+        lowercase: Compare case-insensitively
+
+    Returns:
+        Tuple: Clipped matches (rows x max_n), hypothesis n-gram totals
+            (rows x max_n), hypothesis lengths and reference lengths
+    """
+    if len(hypotheses) != len(references):
+        raise ValueError(f"Got {len(hypotheses)} hypotheses but {len(references)} references")
+    encoder = TokenEncoder(lowercase=lowercase)
+    hyp_ids, hyp_offsets = encoder.encode(hypotheses)
+    ref_ids, ref_offsets = encoder.encode(references)
+
+    rows = len(hypotheses)
+    matches = np.zeros((rows, max_n), dtype=np.int64)
+    totals = np.zeros((rows, max_n), dtype=np.int64)
+    for n in range(1, max_n + 1):
+        matches[:, n - 1], totals[:, n - 1], _ = ngram_overlap(hyp_ids, hyp_offsets, ref_ids, ref_offsets, n)
+    return matches, totals, row_lengths(hyp_offsets), row_lengths(ref_offsets)
+
+
+def bleu_from_statistics(
+    matches: np.ndarray,
+    totals: np.ndarray,
+    hyp_length,
+    ref_length,
+    weights: Sequence[float] = DEFAULT_WEIGHTS,
+) -> np.ndarray:
+    """
+    Compute BLEU from (possibly accumulated) statistics.
+
+    Works row-wise on per-sentence statistics or on a single corpus row.
+
+    Args:
+        matches: Clipped matches per order (..., max_n)
+        totals: Hypothesis n-grams per order (..., max_n)
+        hyp_length: Hypothesis length(s)
+        ref_length: Reference length(s)
+        weights: Weight of each n-gram order
+
+    Returns:
+        np.ndarray: BLEU score(s) in [0, 1]
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    matches = np.asarray(matches, dtype=np.float64)[..., : len(weights)]
+    totals = np.asarray(totals, dtype=np.float64)[..., : len(weights)]
+    hyp_length = np.asarray(hyp_length, dtype=np.float64)
+    ref_length = np.asarray(ref_length, dtype=np.float64)
+
+    used = weights > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_precision = np.log(matches / np.maximum(totals, 1))
+        log_precision = np.where(used, log_precision, 0.0)
+        brevity = np.where(
+            hyp_length > ref_length, 0.0, 1.0 - ref_length / np.maximum(hyp_length, 1)
+        )
+    score = np.exp(brevity + (weights * log_precision).sum(axis=-1))
+    zero = (matches[..., used] == 0).any(axis=-1) | (hyp_length == 0)
+    return np.where(zero, 0.0, score)
+
+
+def sentence_bleu(
+    hypotheses: Sequence[str],
+    references: Sequence[str],
+    weights: Sequence[float] = DEFAULT_WEIGHTS,
+    lowercase: bool = False,
+) -> np.ndarray:
+    """
+    Sentence-level BLEU of every pair in a batch.
+
+    Args:
+        hypotheses: Generated texts
+        references: Reference texts (one per hypothesis)
+        weights: Weight of each n-gram order (its length sets the max order)
+        lowercase: Compare case-insensitively
+
+    Returns:
+        np.ndarray: One score per pair
+    """
+    matches, totals, hyp_length, ref_length = bleu_statistics(
+        hypotheses, references, max_n=len(weights), lowercase=lowercase
+    )
+    return bleu_from_statistics(matches, totals, hyp_length, ref_length, weights)
+
+
+class BLEUAccumulator:
+    """
+    Streaming corpus BLEU.
+
+    Feed the corpus chunk by chunk; only the summed statistics are kept.
+
+    Attributes:
+        sentences: Number of pairs added so far
+    """
+
+    def __init__(self, weights: Sequence[float] = DEFAULT_WEIGHTS, lowercase: bool = False):
+        """
+        Initialize BLEU Accumulator.
+
+        Args:
+            weights: Weight of each n-gram order
+            lowercase: Compare case-insensitively
+        """
+        self.weights = tuple(weights)
+        self.lowercase = lowercase
+        self.sentences = 0
+        self._matches = np.zeros(len(self.weights), dtype=np.int64)
+        self._totals = np.zeros(len(self.weights), dtype=np.int64)
+        self._hyp_length = 0
+        self._ref_length = 0
+
+    def add(self, hypotheses: Sequence[str], references: Sequence[str]) -> np.ndarray:
+        """
+        Add a chunk of pairs to the corpus.
+
+        Args:
+            hypotheses: Generated texts
+            references: Reference texts (one per hypothesis)
+
+        Returns:
+            np.ndarray: Sentence BLEU of each pair in the chunk
+        """
+        matches, totals, hyp_length, ref_length = bleu_statistics(
+            hypotheses, references, max_n=len(self.weights), lowercase=self.lowercase
+        )
+        self._matches += matches.sum(axis=0)
+        self._totals += totals.sum(axis=0)
+        self._hyp_length += int(hyp_length.sum())
+        self._ref_length += int(ref_length.sum())
+        self.sentences += len(hypotheses)
+        return bleu_from_statistics(matches, totals, hyp_length, ref_length, self.weights)
+
+    @property
+    def score(self) -> float:
+        """Corpus BLEU of everything added so far."""
+        return float(bleu_from_statistics(
+            self._matches, self._totals, self._hyp_length, self._ref_length, self.weights
+        ))
+
+
+def corpus_bleu(
+    hypotheses: Iterable[str],
+    references: Iterable[str],
+    weights: Sequence[float] = DEFAULT_WEIGHTS,
+    lowercase: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> float:
+    """
+    Corpus-level BLEU, streaming over the pairs in chunks.
+
+    Args:
+        hypotheses: Generated texts (any iterable, e.g. a file reader)
+        references: Reference texts, aligned with hypotheses
+        weights: Weight of each n-gram order
+        lowercase: Compare case-insensitively
+        chunk_size: Pairs encoded per batch
+
+    Returns:
+        float: Corpus BLEU
+
+    Raises:
+        ValueError: If hypotheses and references differ in length
+    """
+    accumulator = BLEUAccumulator(weights=weights, lowercase=lowercase)
+    missing = object()
+    pairs = zip_longest(hypotheses, references, fillvalue=missing)
+    seen = 0
+    while True:
+        chunk = list(islice(pairs, chunk_size))
+        if not chunk:
+            break
+        hyps, refs = zip(*chunk)
+        if missing in hyps or missing in refs:
+            hyp_count = seen + sum(h is not missing for h in hyps)
+            ref_count = seen + sum(r is not missing for r in refs)
+            raise ValueError(f"Got {hyp_count} hypotheses but {ref_count} references")
+        accumulator.add(hyps, refs)
+        seen += len(chunk)
+    return accumulator.score
@@ -5,12 +5,21 @@ Calculates BLEU (Bilingual Evaluation Understudy) score for text similarity.
 BLEU measures the overlap of n-grams between generated and reference text.
 
 Score range: 0 to 1 (higher is better)
+
+Scoring uses the batch engine in ``bleu``; ``evaluate_corpus`` scores a
+whole dataset at once and also returns true corpus-level BLEU.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Tuple
+
+from ..base import BaseEvaluator, get_sample_field
 
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    import numpy as np
 
-class BLEUScoreEvaluator:
+
+class BLEUScoreEvaluator(BaseEvaluator):
     """
     BLEU Score metric evaluator.
     
@@ -18,6 +27,10 @@ class BLEUScoreEvaluator:
     generated and reference text.
     """
     
+    metric_name = "bleu_score"
+    sample_fields = ("response", "reference")
+    cpu_bound = True
+    
     def __init__(self, weights: tuple = (0.25, 0.25, 0.25, 0.25)):
         """
         Initialize BLEU Score Evaluator.
@@ -52,8 +65,43 @@ class BLEUScoreEvaluator:
         3. Apply brevity penalty
         4. Compute weighted BLEU score
         """
-        # Implementation using nltk.translate.bleu_score
-        pass
+        # Imported here so importing the evaluator stays cheap
+        from .bleu import sentence_bleu
+
+        response = get_sample_field(sample, "response") or ""
+        reference = get_sample_field(sample, "reference") or ""
+        return float(sentence_bleu([response], [reference], weights=self.weights)[0])
+
+    def evaluate_corpus(
+        self, samples: Iterable, chunk_size: int = 10_000
+    ) -> Tuple["np.ndarray", float]:
+        """
+        Score a whole dataset in batches.
+
+        Args:
+            samples: Samples with response and reference
+            chunk_size: Samples encoded per batch
+
+        Returns:
+            Tuple[np.ndarray, float]: Sentence BLEU per sample and corpus BLEU
+                (accumulated n-gram statistics, not the mean of sentence scores)
+        """
+        import numpy as np
+        from .bleu import BLEUAccumulator
+
+        accumulator = BLEUAccumulator(weights=self.weights)
+        scores = []
+        responses, references = [], []
+        for sample in samples:
+            responses.append(get_sample_field(sample, "response") or "")
+            references.append(get_sample_field(sample, "reference") or "")
+            if len(responses) == chunk_size:
+                scores.append(accumulator.add(responses, references))
+                responses, references = [], []
+        if responses:
+            scores.append(accumulator.add(responses, references))
+        sentence_scores = np.concatenate(scores) if scores else np.zeros(0)
+        return sentence_scores, accumulator.score
 
 
 def create_bleu_score_evaluator(weights: tuple = (0.25, 0.25, 0.25, 0.25)):
@@ -0,0 +1,178 @@
+"""
+Dataset-Level Exact Match
+
+Exact match over whole columns as a hash join:
+
+1. Normalize every distinct string once (Unicode NFKC, case folding,
+   whitespace collapse, optional punctuation stripping)
+2. Intern normalized strings as integer ids in one shared table, so both
+   columns become compact int64 arrays
+3. Compare the arrays vectorized
+
+Two questions are answered this way:
+- exact_match: Does response i match reference i?
+- match_any: Which reference in a set (if any) does each response match?
+
+Interning is exact, so there are no hash collisions to worry about.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]|_")
+
+
+class TextNormalizer:
+    """
+    Normalization applied to both sides before comparing.
+
+    Attributes:
+        case_sensitive: Keep case (otherwise Unicode case folding)
+        unicode_form: Unicode normalization form (None: none)
+        collapse_whitespace: Trim and collapse runs of whitespace to one space
+        strip_punctuation: Remove punctuation characters
+    """
+
+    def __init__(
+        self,
+        case_sensitive: bool = False,
+        unicode_form: Optional[str] = "NFKC",
+        collapse_whitespace: bool = True,
+        strip_punctuation: bool = False,
+    ):
+        """
+        Initialize Text Normalizer.
+
+        Args:
+            case_sensitive: Keep case
+            unicode_form: 'NFC', 'NFKC', 'NFD', 'NFKD' or None
+            collapse_whitespace: Trim and collapse whitespace
+            strip_punctuation: Remove punctuation
+        """
+        self.case_sensitive = case_sensitive
+        self.unicode_form = unicode_form
+        self.collapse_whitespace = collapse_whitespace
+        self.strip_punctuation = strip_punctuation
+
+    def __call__(self, text: Optional[str]) -> str:
+        """
+        Normalize one string.
+
+        Args:
+            text: String (None counts as empty)
+
+        Returns:
+            str: Normalized string
+        """
+        if not text:
+            return ""
+        if self.unicode_form and not text.isascii():
+            text = unicodedata.normalize(self.unicode_form, text)
+        if not self.case_sensitive:
+            text = text.casefold()
+        if self.strip_punctuation:
+            text = _PUNCTUATION_RE.sub("", text)
+        if self.collapse_whitespace:
+            text = " ".join(text.split())
+        return text
+
+
+class StringInterner:
+    """
+    Maps normalized strings to dense integer ids.
+
+    Raw strings are normalized once each; repeated values (common in logs)
+    cost a dictionary lookup.
+    """
+
+    def __init__(self, normalizer: Optional[TextNormalizer] = None):
+        """
+        Initialize String Interner.
+
+        Args:
+            normalizer: Normalization applied before interning (default: TextNormalizer())
+        """
+        self.normalizer = normalizer or TextNormalizer()
+        self.ids: Dict[str, int] = {}
+        self._raw: Dict[Optional[str], str] = {}
+
+    def _normalized(self, text: Optional[str]) -> str:
+        normalized = self._raw.get(text)
+        if normalized is None:
+            normalized = self.normalizer(text)
+            self._raw[text] = normalized
+        return normalized
+
+    def encode(self, texts: Iterable[Optional[str]], add: bool = True) -> np.ndarray:
+        """
+        Encode a column of strings.
+
+        Args:
+            texts: Strings
+            add: Intern unseen strings (False: unseen strings get -1)
+
+        Returns:
+            np.ndarray: int64 ids
+        """
+        ids = self.ids
+        normalized = map(self._normalized, texts)
+        if add:
+            values = (ids.setdefault(text, len(ids)) for text in normalized)
+        else:
+            values = (ids.get(text, -1) for text in normalized)
+        return np.fromiter(values, dtype=np.int64)
+
+
+def exact_match(
+    responses: Sequence[Optional[str]],
+    references: Sequence[Optional[str]],
+    normalizer: Optional[TextNormalizer] = None,
+) -> np.ndarray:
+    """
+    Row-wise exact match of two aligned columns.
+
+    Args:
+        responses: Response column
+        references: Reference column (same length)
+        normalizer: Normalization (default: TextNormalizer())
+
+    Returns:
+        np.ndarray: Boolean match per row
+    """
+    if len(responses) != len(references):
+        raise ValueError(f"Columns differ in length: {len(responses)} != {len(references)}")
+    interner = StringInterner(normalizer)
+    return interner.encode(references) == interner.encode(responses)
+
+
+def match_any(
+    responses: Iterable[Optional[str]],
+    references: Iterable[Optional[str]],
+    normalizer: Optional[TextNormalizer] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Match each response against a whole set of references.
+
+    Args:
+        responses: Response column
+        references: Reference set (any order; duplicates allowed)
+        normalizer: Normalization (default: TextNormalizer())
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Boolean "matches some reference" per
+            response, and the index of the first matching reference (-1: none)
+    """
+    interner = StringInterner(normalizer)
+    reference_ids = interner.encode(references)
+    # Interning assigns ids in order of first appearance, so a reference id
+    # indexes its first occurrence directly
+    _, first = np.unique(reference_ids, return_index=True)
+    response_ids = interner.encode(responses, add=False)
+    found = response_ids >= 0
+    index = np.full(len(response_ids), -1, dtype=np.int64)
+    index[found] = first[response_ids[found]]
+    return found, index
@@ -3,26 +3,64 @@ Exact Match Evaluator
 
 Checks if the generated response exactly matches the reference.
 Returns 1 if exact match, 0 otherwise. Can be case-sensitive or insensitive.
+
+Both sides are normalized (Unicode NFKC, whitespace collapse, optional
+punctuation stripping) before comparing. ``evaluate_corpus`` and
+``match_any`` compare whole datasets as a hash join (see ``exact_match``).
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+from ..base import BaseEvaluator, get_sample_field
 
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    import numpy as np
 
-class ExactMatchEvaluator:
+
+class ExactMatchEvaluator(BaseEvaluator):
     """
     Exact Match metric evaluator.
     
     Binary metric: returns 1 for exact match, 0 for no match.
     """
     
-    def __init__(self, case_sensitive: bool = False):
+    metric_name = "exact_match"
+    sample_fields = ("response", "reference")
+    cpu_bound = True
+    
+    def __init__(self, case_sensitive: bool = False, unicode_form: Optional[str] = "NFKC",
+                 collapse_whitespace: bool = True, strip_punctuation: bool = False):
         """
         Initialize Exact Match Evaluator.
         
         Args:
             case_sensitive: Whether to perform case-sensitive matching
+            unicode_form: Unicode normalization form (None: compare code points as is)
+            collapse_whitespace: Trim and collapse whitespace before comparing
+            strip_punctuation: Ignore punctuation
         """
         self.case_sensitive = case_sensitive
+        self.unicode_form = unicode_form
+        self.collapse_whitespace = collapse_whitespace
+        self.strip_punctuation = strip_punctuation
+
+    def normalizer(self) -> "TextNormalizer":
+        """
+        Normalization configured on this evaluator.
+
+        Returns:
+            TextNormalizer: Normalizer applied to responses and references
+        """
+        # Imported here so importing the evaluator stays cheap
+        from .exact_match import TextNormalizer
+
+        return TextNormalizer(
+            case_sensitive=self.case_sensitive,
+            unicode_form=self.unicode_form,
+            collapse_whitespace=self.collapse_whitespace,
+            strip_punctuation=self.strip_punctuation,
+        )
     
     async def evaluate(self, sample):
         """
@@ -47,17 +85,65 @@ class ExactMatchEvaluator:
         2. Compare for exact equality
         3. Return 1.0 or 0.0
         """
-        pass
+        normalize = self.normalizer()
+        response = normalize(get_sample_field(sample, "response"))
+        reference = normalize(get_sample_field(sample, "reference"))
+        return 1.0 if response == reference else 0.0
+
+    def evaluate_corpus(self, samples: Iterable) -> "np.ndarray":
+        """
+        Score a whole dataset at once.
+
+        Args:
+            samples: Samples with response and reference
+
+        Returns:
+            np.ndarray: 1.0 / 0.0 per sample
+        """
+        from .exact_match import exact_match
+
+        responses, references = [], []
+        for sample in samples:
+            responses.append(get_sample_field(sample, "response"))
+            references.append(get_sample_field(sample, "reference"))
+        return exact_match(responses, references, self.normalizer()).astype(float)
+
+    def match_any(self, samples: Iterable, references: Optional[Iterable[str]] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Find which responses exactly match any reference in a set.
+
+        Args:
+            samples: Samples with response (and reference, if no set is given)
+            references: Reference set (default: every sample's reference)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Boolean match per sample and the
+                index of the first matching reference (-1: none)
+        """
+        from .exact_match import match_any
+
+        samples = list(samples)
+        if references is None:
+            references = [get_sample_field(sample, "reference") for sample in samples]
+        responses = [get_sample_field(sample, "response") for sample in samples]
+        return match_any(responses, references, self.normalizer())
 
 
-def create_exact_match_evaluator(case_sensitive: bool = False):
+def create_exact_match_evaluator(case_sensitive: bool = False, unicode_form: Optional[str] = "NFKC",
+                                 collapse_whitespace: bool = True, strip_punctuation: bool = False):
     """
     Factory function to create an Exact Match evaluator.
     
     Args:
         case_sensitive: Whether to be case-sensitive
+        unicode_form: Unicode normalization form
+        collapse_whitespace: Trim and collapse whitespace
+        strip_punctuation: Ignore punctuation
     
     Returns:
         ExactMatchEvaluator: Configured evaluator instance
     """
-    return ExactMatchEvaluator(case_sensitive=case_sensitive)
+    return ExactMatchEvaluator(
+        case_sensitive=case_sensitive, unicode_form=unicode_form,
+        collapse_whitespace=collapse_whitespace, strip_punctuation=strip_punctuation,
+    )
@@ -19,8 +19,11 @@ Modes: 'F1' (default), 'precision', 'recall'
 
 from typing import Optional, Literal
 
+from ..base import get_sample_field
+from ..claims import ClaimBasedEvaluator, ClaimStore
 
-class FactualCorrectnessEvaluator:
+
+class FactualCorrectnessEvaluator(ClaimBasedEvaluator):
     """
     Factual Correctness metric evaluator.
     
@@ -28,9 +31,13 @@ class FactualCorrectnessEvaluator:
     with claims in the reference using LLM-based analysis.
     """
     
+    metric_name = "factual_correctness"
+    sample_fields = ("response", "reference")
+    
     def __init__(self, llm=None, mode: Literal["F1", "precision", "recall"] = "F1",
                  atomicity: Literal["high", "low"] = "high",
-                 coverage: Literal["high", "low"] = "high"):
+                 coverage: Literal["high", "low"] = "high",
+                 claim_store: Optional[ClaimStore] = None):
         """
         Initialize Factual Correctness Evaluator.
         
@@ -39,11 +46,13 @@ class FactualCorrectnessEvaluator:
             mode: Metric mode ('F1', 'precision', or 'recall')
             atomicity: Granularity of claims ('high' or 'low')
             coverage: Comprehensiveness of claims ('high' or 'low')
+            claim_store: Shared claim decomposition store (default: process-wide store)
         """
         self.llm = llm
         self.mode = mode
         self.atomicity = atomicity
         self.coverage = coverage
+        self.claim_store = claim_store
     
     async def evaluate(self, sample):
         """
@@ -64,22 +73,37 @@ class FactualCorrectnessEvaluator:
         Evaluate factual correctness.
         
         Process:
-        1. Decompose response into claims
-        2. Decompose reference into claims
+        1. Decompose response into claims (shared via _extract_claims)
+        2. Decompose reference into claims (shared via _extract_claims)
         3. Compare claims using NLI
         4. Calculate TP, FP, FN
         5. Compute precision, recall, and F1
         6. Return requested metric (F1, precision, or recall)
         """
-        # Implementation would use ragas.metrics.FactualCorrectness
-        pass
+        response = get_sample_field(sample, "response") or ""
+        reference = get_sample_field(sample, "reference") or ""
+        tp, response_total = await self._supported_claims(response, reference)
+        fp = response_total - tp
+        fn = 0
+        if self.mode != "precision":
+            covered, reference_total = await self._supported_claims(reference, response)
+            fn = reference_total - covered
+
+        precision = tp / (tp + fp) if tp + fp else float("nan")
+        recall = tp / (tp + fn) if tp + fn else float("nan")
+        if self.mode == "precision":
+            return precision
+        if self.mode == "recall":
+            return recall
+        return 2 * precision * recall / (precision + recall) if precision + recall else 0.0
 
 
 def create_factual_correctness_evaluator(
     llm=None,
     mode: Literal["F1", "precision", "recall"] = "F1",
     atomicity: Literal["high", "low"] = "high",
-    coverage: Literal["high", "low"] = "high"
+    coverage: Literal["high", "low"] = "high",
+    claim_store: Optional[ClaimStore] = None
 ):
     """
     Factory function to create a Factual Correctness evaluator.
@@ -89,8 +113,11 @@ def create_factual_correctness_evaluator(
         mode: Metric mode
         atomicity: Claims granularity
         coverage: Claims comprehensiveness
+        claim_store: Shared claim decomposition store
     
     Returns:
         FactualCorrectnessEvaluator: Configured evaluator instance
     """
-    return FactualCorrectnessEvaluator(llm=llm, mode=mode, atomicity=atomicity, coverage=coverage)
+    return FactualCorrectnessEvaluator(
+        llm=llm, mode=mode, atomicity=atomicity, coverage=coverage, claim_store=claim_store
+    )
@@ -0,0 +1,160 @@
+"""
+N-gram Kernels
+
+Shared tokenization and n-gram counting for the overlap metrics (BLEU, ROUGE).
+
+Texts are tokenized once and interned as integer ids. A batch of texts is
+stored flat: one ``ids`` array plus ``offsets`` where text ``i`` spans
+``ids[offsets[i]:offsets[i + 1]]``. N-grams are reduced to 64-bit hashes
+that also mix in the row they belong to, so clipped overlap counts for a
+whole batch come out of a few sorts instead of per-sample Counters.
+
+Hash collisions between distinct n-grams are possible in principle but at
+64 bits do not affect scores in practice.
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+# ASCII letters and digits only, like rouge_score's tokenizer
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+
+# FNV-1a style mixing constants (uint64 arithmetic wraps around)
+_ROW_SEED = np.uint64(0xCBF29CE484222325)
+_PRIME = np.uint64(0x100000001B3)
+
+
+def tokenize(text: str, lowercase: bool = False, words_only: bool = False) -> List[str]:
+    """
+    Split text into word and punctuation tokens.
+
+    Args:
+        text: Text to tokenize
+        lowercase: Lowercase before splitting
+        words_only: Keep ASCII alphanumeric runs only; everything else
+            (punctuation, accented letters, other scripts) separates tokens
+
+    Returns:
+        List[str]: Tokens
+    """
+    if not text:
+        return []
+    pattern = _WORD_RE if words_only else _TOKEN_RE
+    return pattern.findall(text.lower() if lowercase else text)
+
+
+class TokenEncoder:
+    """
+    Interns tokens as integer ids.
+
+    Hypotheses and references must be encoded with the same encoder so equal
+    tokens get equal ids.
+    """
+
+    def __init__(self, lowercase: bool = False, words_only: bool = False):
+        """
+        Initialize Token Encoder.
+
+        Args:
+            lowercase: Lowercase texts before tokenizing
+            words_only: Drop punctuation tokens
+        """
+        self.lowercase = lowercase
+        self.words_only = words_only
+        self.vocabulary: Dict[str, int] = {}
+
+    def encode(self, texts: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode a batch of texts.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Flat token ids (int64) and row
+                offsets (length ``len(texts) + 1``)
+        """
+        vocabulary = self.vocabulary
+        ids: List[int] = []
+        lengths: List[int] = []
+        for text in texts:
+            tokens = tokenize(text, self.lowercase, self.words_only)
+            ids.extend([vocabulary.setdefault(token, len(vocabulary)) for token in tokens])
+            lengths.append(len(tokens))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return np.asarray(ids, dtype=np.int64), offsets
+
+
+def row_lengths(offsets: np.ndarray) -> np.ndarray:
+    """Number of tokens in each row of a flat batch."""
+    return np.diff(offsets)
+
+
+def ngram_keys(ids: np.ndarray, offsets: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hash every n-gram of a flat batch, keyed by its row.
+
+    Args:
+        ids: Flat token ids
+        offsets: Row offsets
+        n: N-gram order
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: N-gram hashes (uint64) and the row of each
+    """
+    lengths = row_lengths(offsets)
+    counts = np.maximum(lengths - n + 1, 0)
+    rows = np.repeat(np.arange(len(lengths)), counts)
+    # Start positions: offsets[row] + 0..count-1 for every row
+    starts = np.arange(int(counts.sum()), dtype=np.int64)
+    starts += np.repeat(offsets[:-1] - (np.cumsum(counts) - counts), counts)
+
+    keys = rows.astype(np.uint64) * _PRIME ^ _ROW_SEED
+    for k in range(n):
+        keys = (keys ^ (ids[starts + k].astype(np.uint64) + np.uint64(1))) * _PRIME
+    return keys, rows
+
+
+def ngram_overlap(
+    hyp_ids: np.ndarray,
+    hyp_offsets: np.ndarray,
+    ref_ids: np.ndarray,
+    ref_offsets: np.ndarray,
+    n: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Clipped n-gram overlap of aligned hypothesis/reference rows.
+
+    Each hypothesis n-gram counts at most as often as it occurs in the
+    reference of the same row.
+
+    Args:
+        hyp_ids, hyp_offsets: Flat hypothesis batch
+        ref_ids, ref_offsets: Flat reference batch (same number of rows)
+        n: N-gram order
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Per row, the clipped
+            matches, hypothesis n-gram count and reference n-gram count
+    """
+    rows = len(hyp_offsets) - 1
+    hyp_keys, hyp_rows = ngram_keys(hyp_ids, hyp_offsets, n)
+    ref_keys, _ = ngram_keys(ref_ids, ref_offsets, n)
+
+    hyp_unique, hyp_first, hyp_counts = np.unique(hyp_keys, return_index=True, return_counts=True)
+    ref_unique, ref_counts = np.unique(ref_keys, return_counts=True)
+    _, in_hyp, in_ref = np.intersect1d(hyp_unique, ref_unique, assume_unique=True, return_indices=True)
+
+    matches = np.bincount(
+        hyp_rows[hyp_first[in_hyp]],
+        weights=np.minimum(hyp_counts[in_hyp], ref_counts[in_ref]),
+        minlength=rows,
+    ).astype(np.int64)
+    hyp_total = np.maximum(row_lengths(hyp_offsets) - n + 1, 0)
+    ref_total = np.maximum(row_lengths(ref_offsets) - n + 1, 0)
+    return matches, hyp_total, ref_total
@@ -4,13 +4,24 @@ Non-LLM String Similarity Evaluator
 Measures string similarity using traditional NLP metrics like Levenshtein distance,
 without requiring an LLM. Fast and efficient for simple string comparisons.
 
-Requires: rapidfuzz package
+Requires: rapidfuzz package (a slower pure Python fallback is used without it)
+
+``evaluate_corpus`` scores whole response/reference columns in one batched
+call (see ``string_similarity``).
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable
+
+from ..base import BaseEvaluator, get_sample_field
+
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    import numpy as np
 
+    from .string_similarity import DistanceMeasure
 
-class NonLLMStringSimilarityEvaluator:
+
+class NonLLMStringSimilarityEvaluator(BaseEvaluator):
     """
     Non-LLM String Similarity metric evaluator.
     
@@ -18,12 +29,19 @@ class NonLLMStringSimilarityEvaluator:
     for similarity calculation without LLM calls.
     """
     
-    def __init__(self):
+    metric_name = "nonllm_string_similarity"
+    sample_fields = ("response", "reference")
+    cpu_bound = True
+    
+    def __init__(self, distance_measure: "DistanceMeasure" = "levenshtein"):
         """
         Initialize Non-LLM String Similarity Evaluator.
         Requires: pip install rapidfuzz
+
+        Args:
+            distance_measure: 'levenshtein', 'indel', 'hamming', 'jaro' or 'jaro_winkler'
         """
-        pass
+        self.distance_measure = distance_measure
     
     async def evaluate(self, sample):
         """
@@ -48,15 +66,41 @@ class NonLLMStringSimilarityEvaluator:
         2. Normalize to 0-1 range
         3. Return similarity score
         """
-        # Implementation using rapidfuzz
-        pass
+        # Imported here so importing the evaluator stays cheap
+        from .string_similarity import pairwise_similarity
 
+        response = get_sample_field(sample, "response") or ""
+        reference = get_sample_field(sample, "reference") or ""
+        return float(pairwise_similarity([response], [reference], self.distance_measure)[0])
+
+    def evaluate_corpus(self, samples: Iterable, workers: int = -1) -> "np.ndarray":
+        """
+        Score a whole dataset in one batched call.
 
-def create_nonllm_string_similarity_evaluator():
+        Args:
+            samples: Samples with response and reference
+            workers: Threads used by rapidfuzz (-1: all cores)
+
+        Returns:
+            np.ndarray: Similarity per sample
+        """
+        from .string_similarity import pairwise_similarity
+
+        responses, references = [], []
+        for sample in samples:
+            responses.append(get_sample_field(sample, "response") or "")
+            references.append(get_sample_field(sample, "reference") or "")
+        return pairwise_similarity(responses, references, self.distance_measure, workers=workers)
+
+
+def create_nonllm_string_similarity_evaluator(distance_measure: "DistanceMeasure" = "levenshtein"):
     """
     Factory function to create a Non-LLM String Similarity evaluator.
     
+    Args:
+        distance_measure: String distance measure
+    
     Returns:
         NonLLMStringSimilarityEvaluator: Configured evaluator instance
     """
-    return NonLLMStringSimilarityEvaluator()
+    return NonLLMStringSimilarityEvaluator(distance_measure=distance_measure)
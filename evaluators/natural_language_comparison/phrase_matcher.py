@@ -0,0 +1,164 @@
+"""
+Multi-Pattern Phrase Matcher
+
+Aho-Corasick automaton that finds which of many phrases occur in a text in
+a single left-to-right scan, independent of the number of phrases:
+
+    matcher = PhraseMatcher(required_phrases, case_sensitive=False, normalization="NFKC")
+    matcher.hits(response)          # bool per phrase
+    matcher.coverage(response)      # fraction of phrases present
+    matcher.hit_matrix(responses)   # (responses x phrases) for a batch
+
+Build the matcher once per phrase set and reuse it across samples. Failure
+links are folded into a complete transition table at build time, so the
+scan does one dictionary lookup per character. Texts and phrases go through
+the same normalization (Unicode form, then case folding), so "ﬁle" matches
+"file" under NFKC and "STRASSE" matches "straße" with case folding.
+"""
+
+import unicodedata
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of phrases.
+
+    Attributes:
+        phrases: The phrases, in the order of hit vectors
+    """
+
+    def __init__(
+        self,
+        phrases: Sequence[str],
+        case_sensitive: bool = True,
+        normalization: Optional[str] = None,
+    ):
+        """
+        Initialize Phrase Matcher.
+
+        Args:
+            phrases: Phrases to look for
+            case_sensitive: False to match case-insensitively (Unicode case folding)
+            normalization: Unicode normalization form applied first
+                ('NFC', 'NFKC', 'NFD', 'NFKD'; None: none)
+        """
+        self.phrases = list(phrases)
+        self.case_sensitive = case_sensitive
+        self.normalization = normalization
+        # Transition table of the automaton, failure links folded in
+        self._delta: List[Dict[str, int]] = [{}]
+        # Phrases ending at each state, including those reached through failure links
+        self._output: List[Tuple[int, ...]] = [()]
+        self._always: List[int] = []
+        self._build()
+
+    def normalize(self, text: str) -> str:
+        """Apply the matcher's normalization and case folding to a text."""
+        if self.normalization:
+            text = unicodedata.normalize(self.normalization, text)
+        return text if self.case_sensitive else text.casefold()
+
+    def _build(self):
+        goto: List[Dict[str, int]] = [{}]
+        ends: List[List[int]] = [[]]
+        for index, phrase in enumerate(self.phrases):
+            phrase = self.normalize(phrase or "")
+            if not phrase:
+                self._always.append(index)  # the empty phrase is in every text
+                continue
+            state = 0
+            for char in phrase:
+                following = goto[state].get(char)
+                if following is None:
+                    following = len(goto)
+                    goto[state][char] = following
+                    goto.append({})
+                    ends.append([])
+                state = following
+            ends[state].append(index)
+
+        # Breadth-first, so the failure state's row is complete before it is copied
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{}] * (len(goto) - 1)
+        output: List[Tuple[int, ...]] = [()] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            output[state] = tuple(ends[state]) + output[fail[state]]
+            row = dict(delta[fail[state]])
+            row.update(goto[state])
+            delta[state] = row
+            for char, following in goto[state].items():
+                fail[following] = delta[fail[state]].get(char, 0)
+                queue.append(following)
+        self._delta = delta
+        self._output = output
+
+    def matches(self, text: str) -> List[int]:
+        """
+        Indices of the phrases occurring in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List[int]: Sorted phrase indices
+        """
+        delta, output = self._delta, self._output
+        found = set(self._always)
+        state = 0
+        for char in self.normalize(text or ""):
+            state = delta[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+                if len(found) == len(self.phrases):
+                    break  # every phrase seen; no need to read further
+        return sorted(found)
+
+    def hits(self, text: str) -> np.ndarray:
+        """
+        Presence of every phrase in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            np.ndarray: Boolean hit vector, one entry per phrase
+        """
+        vector = np.zeros(len(self.phrases), dtype=bool)
+        vector[self.matches(text)] = True
+        return vector
+
+    def coverage(self, text: str) -> float:
+        """
+        Fraction of the phrases present in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            float: Coverage in [0, 1] (1.0 for an empty phrase set)
+        """
+        if not self.phrases:
+            return 1.0
+        return len(self.matches(text)) / len(self.phrases)
+
+    def hit_matrix(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Hit vectors for a batch of texts.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            np.ndarray: Boolean matrix of shape (texts, phrases)
+        """
+        rows = [self.matches(text) for text in texts]
+        matrix = np.zeros((len(rows), len(self.phrases)), dtype=bool)
+        for row, found in enumerate(rows):
+            matrix[row, found] = True
+        return matrix
@@ -9,19 +9,33 @@ Common variants:
     - ROUGE-N: N-gram overlap
     - ROUGE-L: Longest common subsequence
     - ROUGE-W: Weighted longest common subsequence
+
+Scoring uses the batch engine in ``rouge`` (bit-parallel LCS for ROUGE-L);
+``evaluate_corpus`` scores a whole dataset at once.
 """
 
-from typing import Optional, Literal
+from typing import TYPE_CHECKING, Iterable, Literal
+
+from ..base import BaseEvaluator, get_sample_field
 
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    import numpy as np
 
-class ROUGEScoreEvaluator:
+
+class ROUGEScoreEvaluator(BaseEvaluator):
     """
     ROUGE Score metric evaluator.
     
     Computes ROUGE score variants for text similarity evaluation.
     """
     
-    def __init__(self, rouge_type: Literal["rouge1", "rouge2", "rougeL"] = "rouge1"):
+    metric_name = "rouge_score"
+    sample_fields = ("response", "reference")
+    cpu_bound = True
+    
+    def __init__(self, rouge_type: Literal["rouge1", "rouge2", "rougeL"] = "rouge1",
+                 mode: Literal["fmeasure", "precision", "recall"] = "fmeasure"):
         """
         Initialize ROUGE Score Evaluator.
         
@@ -30,8 +44,10 @@ class ROUGEScoreEvaluator:
                 - 'rouge1': 1-gram overlap
                 - 'rouge2': 2-gram overlap
                 - 'rougeL': Longest common subsequence
+            mode: Score reported ('fmeasure', 'precision' or 'recall')
         """
         self.rouge_type = rouge_type
+        self.mode = mode
     
     async def evaluate(self, sample):
         """
@@ -57,18 +73,50 @@ class ROUGEScoreEvaluator:
         3. Compute precision, recall, F1
         4. Return F1 score
         """
-        # Implementation using rouge library or rouge_score
-        pass
+        # Imported here so importing the evaluator stays cheap
+        from .rouge import best_of_references
+
+        response = get_sample_field(sample, "response") or ""
+        reference = get_sample_field(sample, "reference") or ""
+        return float(best_of_references([response], [reference], self.rouge_type, self.mode)[0])
+
+    def evaluate_corpus(self, samples: Iterable, chunk_size: int = 10_000) -> "np.ndarray":
+        """
+        Score a whole dataset in batches.
+
+        Args:
+            samples: Samples with response and reference(s)
+            chunk_size: Samples encoded per batch
+
+        Returns:
+            np.ndarray: Score per sample
+        """
+        import numpy as np
+        from .rouge import best_of_references
+
+        scores = []
+        responses, references = [], []
+        for sample in samples:
+            responses.append(get_sample_field(sample, "response") or "")
+            references.append(get_sample_field(sample, "reference") or "")
+            if len(responses) == chunk_size:
+                scores.append(best_of_references(responses, references, self.rouge_type, self.mode))
+                responses, references = [], []
+        if responses:
+            scores.append(best_of_references(responses, references, self.rouge_type, self.mode))
+        return np.concatenate(scores) if scores else np.zeros(0)
 
 
-def create_rouge_score_evaluator(rouge_type: Literal["rouge1", "rouge2", "rougeL"] = "rouge1"):
+def create_rouge_score_evaluator(rouge_type: Literal["rouge1", "rouge2", "rougeL"] = "rouge1",
+                                 mode: Literal["fmeasure", "precision", "recall"] = "fmeasure"):
     """
     Factory function to create a ROUGE Score evaluator.
     
     Args:
         rouge_type: Type of ROUGE score to compute
+        mode: Score reported ('fmeasure', 'precision' or 'recall')
     
     Returns:
         ROUGEScoreEvaluator: Configured evaluator instance
     """
-    return ROUGEScoreEvaluator(rouge_type=rouge_type)
+    return ROUGEScoreEvaluator(rouge_type=rouge_type, mode=mode)
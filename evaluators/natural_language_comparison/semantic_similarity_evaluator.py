@@ -12,8 +12,10 @@ Process:
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class SemanticSimilarityEvaluator:
+
+class SemanticSimilarityEvaluator(BaseEvaluator):
     """
     Semantic Similarity metric evaluator.
     
@@ -21,6 +23,9 @@ class SemanticSimilarityEvaluator:
     using embedding-based similarity.
     """
     
+    metric_name = "semantic_similarity"
+    sample_fields = ("response", "reference")
+    
     def __init__(self, embeddings=None):
         """
         Initialize Semantic Similarity Evaluator.
@@ -6,12 +6,26 @@ are present in the generated response.
 
 This is a simple but effective metric for verifying presence
 of important terms or phrases.
+
+Matching uses an Aho-Corasick automaton (see ``phrase_matcher``) built
+once per set of reference strings and reused across samples, so each
+response is scanned once however many strings are required.
 """
 
-from typing import Optional, List
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple
+
+from ..base import BaseEvaluator, get_sample_field
+
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    import numpy as np
+
 
+# Matchers kept per distinct set of per-sample reference strings
+MATCHER_CACHE_SIZE = 1024
 
-class StringPresenceEvaluator:
+
+class StringPresenceEvaluator(BaseEvaluator):
     """
     String Presence metric evaluator.
     
@@ -19,11 +33,51 @@ class StringPresenceEvaluator:
     are present in the response.
     """
     
-    def __init__(self):
+    metric_name = "string_presence"
+    sample_fields = ("response", "reference")
+    cpu_bound = True
+    
+    def __init__(self, strings: Optional[Sequence[str]] = None, case_sensitive: bool = True,
+                 normalization: Optional[str] = None):
         """
         Initialize String Presence Evaluator.
+
+        Args:
+            strings: Fixed strings required in every response (default: each
+                sample's reference, a string or a list of strings)
+            case_sensitive: False to match with Unicode case folding
+            normalization: Unicode normalization form ('NFC', 'NFKC', ...)
+        """
+        self.strings = list(strings) if strings is not None else None
+        self.case_sensitive = case_sensitive
+        self.normalization = normalization
+        self._matchers: Dict[Tuple[str, ...], "PhraseMatcher"] = {}
+
+    def matcher(self, sample=None) -> "PhraseMatcher":
         """
-        pass
+        Automaton for the fixed strings, or for a sample's reference strings.
+
+        Args:
+            sample: Sample whose reference is matched (ignored with fixed strings)
+
+        Returns:
+            PhraseMatcher: Cached matcher
+        """
+        # Imported here so importing the evaluator stays cheap
+        from .phrase_matcher import PhraseMatcher
+
+        if self.strings is not None:
+            strings = tuple(self.strings)
+        else:
+            reference = get_sample_field(sample, "reference") or ""
+            strings = (reference,) if isinstance(reference, str) else tuple(reference)
+        matcher = self._matchers.get(strings)
+        if matcher is None:
+            if len(self._matchers) >= MATCHER_CACHE_SIZE:
+                self._matchers.clear()
+            matcher = PhraseMatcher(strings, self.case_sensitive, self.normalization)
+            self._matchers[strings] = matcher
+        return matcher
     
     async def evaluate(self, sample):
         """
@@ -48,14 +102,38 @@ class StringPresenceEvaluator:
         2. Check presence in response
         3. Calculate: # present strings / total strings
         """
-        pass
+        response = get_sample_field(sample, "response") or ""
+        return self.matcher(sample).coverage(response)
+
+    def evaluate_corpus(self, samples: Iterable) -> "np.ndarray":
+        """
+        Score a whole dataset.
+
+        Args:
+            samples: Samples with response (and reference without fixed strings)
+
+        Returns:
+            np.ndarray: Coverage per sample
+        """
+        import numpy as np
+
+        return np.fromiter(
+            (self.matcher(sample).coverage(get_sample_field(sample, "response") or "") for sample in samples),
+            dtype=np.float64,
+        )
 
 
-def create_string_presence_evaluator():
+def create_string_presence_evaluator(strings: Optional[Sequence[str]] = None, case_sensitive: bool = True,
+                                     normalization: Optional[str] = None):
     """
     Factory function to create a String Presence evaluator.
     
+    Args:
+        strings: Fixed strings required in every response (default: the reference)
+        case_sensitive: Match case-sensitively
+        normalization: Unicode normalization form
+    
     Returns:
         StringPresenceEvaluator: Configured evaluator instance
     """
-    return StringPresenceEvaluator()
+    return StringPresenceEvaluator(strings=strings, case_sensitive=case_sensitive, normalization=normalization)
@@ -0,0 +1,235 @@
+"""
+Batched String Similarity
+
+Normalized string similarity (0 to 1) for whole matrices of strings at once:
+
+- similarity_matrix: Every query against every choice, e.g. all retrieved
+  contexts against all reference contexts of a sample
+- pairwise_similarity: Aligned pairs, e.g. the response and reference
+  columns of a dataset
+
+With rapidfuzz installed, both run on its multi-threaded ``cdist`` /
+``cpdist`` kernels. Without it, a pure Python fallback gives the same
+scores (bit-parallel Levenshtein, LCS-based Indel), just slower.
+
+``score_cutoff`` sets scores below it to 0 and lets the kernels stop early
+on pairs that cannot reach it.
+"""
+
+from typing import Callable, Dict, Literal, Optional, Sequence, get_args
+
+import numpy as np
+
+from .rouge import lcs_length
+
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import Hamming, Indel, Jaro, JaroWinkler, Levenshtein
+except ImportError:  # pure Python fallback below
+    rapidfuzz_process = None
+
+
+DistanceMeasure = Literal["levenshtein", "indel", "hamming", "jaro", "jaro_winkler"]
+
+DISTANCE_MEASURES = get_args(DistanceMeasure)
+
+
+def levenshtein_distance(a: str, b: str) -> int:
+    """
+    Levenshtein distance with Myers' bit-parallel algorithm.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(a):
+        masks[char] = masks.get(char, 0) | (1 << position)
+
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    positive, negative = full, 0
+    distance = len(a)
+    for char in b:
+        match = masks.get(char, 0)
+        vertical = match | negative
+        horizontal = ((((match & positive) + positive) & full) ^ positive) | match
+        up = negative | (~(horizontal | positive) & full)
+        down = positive & horizontal
+        if up & last:
+            distance += 1
+        elif down & last:
+            distance -= 1
+        up = ((up << 1) | 1) & full
+        down = (down << 1) & full
+        positive = down | (~(vertical | up) & full)
+        negative = up & vertical
+    return distance
+
+
+def _levenshtein(a: str, b: str) -> float:
+    longest = max(len(a), len(b))
+    return 1.0 - levenshtein_distance(a, b) / longest if longest else 1.0
+
+
+def _indel(a: str, b: str) -> float:
+    total = len(a) + len(b)
+    return 2.0 * lcs_length(a, b) / total if total else 1.0
+
+
+def _hamming(a: str, b: str) -> float:
+    # Shorter string padded, as rapidfuzz does
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    return sum(x == y for x, y in zip(a, b)) / longest
+
+
+def _jaro(a: str, b: str) -> float:
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    window = max(max(len(a), len(b)) // 2 - 1, 0)
+    used = [False] * len(b)
+    a_matches = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not used[j] and b[j] == char:
+                used[j] = True
+                a_matches.append(char)
+                break
+    if not a_matches:
+        return 0.0
+    b_matches = [char for j, char in enumerate(b) if used[j]]
+    transpositions = sum(x != y for x, y in zip(a_matches, b_matches)) // 2
+    m = len(a_matches)
+    return (m / len(a) + m / len(b) + (m - transpositions) / m) / 3.0
+
+
+def _jaro_winkler(a: str, b: str) -> float:
+    similarity = _jaro(a, b)
+    if similarity > 0.7:
+        prefix = 0
+        for x, y in zip(a[:4], b[:4]):
+            if x != y:
+                break
+            prefix += 1
+        similarity += prefix * 0.1 * (1.0 - similarity)
+    return similarity
+
+
+_FALLBACK: Dict[str, Callable[[str, str], float]] = {
+    "levenshtein": _levenshtein,
+    "indel": _indel,
+    "hamming": _hamming,
+    "jaro": _jaro,
+    "jaro_winkler": _jaro_winkler,
+}
+
+
+def _scorer(measure: str):
+    if measure not in DISTANCE_MEASURES:
+        raise ValueError(f"Unknown distance measure: {measure}")
+    if rapidfuzz_process is None:
+        return None
+    return {
+        "levenshtein": Levenshtein,
+        "indel": Indel,
+        "hamming": Hamming,
+        "jaro": Jaro,
+        "jaro_winkler": JaroWinkler,
+    }[measure].normalized_similarity
+
+
+def _fallback_score(measure: str, a: str, b: str, score_cutoff: Optional[float]) -> float:
+    if score_cutoff and measure in ("levenshtein", "indel", "hamming"):
+        # Length difference alone bounds these similarities from above
+        longest = max(len(a), len(b))
+        total = len(a) + len(b) if measure == "indel" else longest
+        bound = 1.0 - abs(len(a) - len(b)) / total if total else 1.0
+        if bound < score_cutoff:
+            return 0.0
+    score = _FALLBACK[measure](a, b)
+    return score if score_cutoff is None or score >= score_cutoff else 0.0
+
+
+def similarity_matrix(
+    queries: Sequence[str],
+    choices: Sequence[str],
+    measure: DistanceMeasure = "levenshtein",
+    score_cutoff: Optional[float] = None,
+    workers: int = -1,
+) -> np.ndarray:
+    """
+    Similarity of every query against every choice.
+
+    Args:
+        queries: Strings for the rows (e.g. retrieved contexts)
+        choices: Strings for the columns (e.g. reference contexts)
+        measure: Distance measure normalized to a 0-1 similarity
+        score_cutoff: Scores below this are reported as 0
+        workers: Threads used by rapidfuzz (-1: all cores)
+
+    Returns:
+        np.ndarray: float32 matrix of shape (len(queries), len(choices))
+    """
+    scorer = _scorer(measure)
+    queries = [q or "" for q in queries]
+    choices = [c or "" for c in choices]
+    if not queries or not choices:
+        return np.zeros((len(queries), len(choices)), dtype=np.float32)
+    if scorer is not None:
+        return rapidfuzz_process.cdist(
+            queries, choices, scorer=scorer, score_cutoff=score_cutoff, dtype=np.float32, workers=workers
+        )
+    matrix = np.empty((len(queries), len(choices)), dtype=np.float32)
+    for i, query in enumerate(queries):
+        for j, choice in enumerate(choices):
+            matrix[i, j] = _fallback_score(measure, query, choice, score_cutoff)
+    return matrix
+
+
+def pairwise_similarity(
+    a: Sequence[str],
+    b: Sequence[str],
+    measure: DistanceMeasure = "levenshtein",
+    score_cutoff: Optional[float] = None,
+    workers: int = -1,
+) -> np.ndarray:
+    """
+    Similarity of aligned pairs (a[i], b[i]), e.g. two dataset columns.
+
+    Args:
+        a: First column
+        b: Second column (same length)
+        measure: Distance measure normalized to a 0-1 similarity
+        score_cutoff: Scores below this are reported as 0
+        workers: Threads used by rapidfuzz (-1: all cores)
+
+    Returns:
+        np.ndarray: float32 array of length len(a)
+    """
+    if len(a) != len(b):
+        raise ValueError(f"Columns differ in length: {len(a)} != {len(b)}")
+    scorer = _scorer(measure)
+    a = [x or "" for x in a]
+    b = [y or "" for y in b]
+    if not a:
+        return np.zeros(0, dtype=np.float32)
+    if scorer is not None and hasattr(rapidfuzz_process, "cpdist"):
+        return rapidfuzz_process.cpdist(
+            a, b, scorer=scorer, score_cutoff=score_cutoff, dtype=np.float32, workers=workers
+        )
+    if scorer is not None:  # rapidfuzz < 3.6
+        scores = (scorer(x, y, score_cutoff=score_cutoff) for x, y in zip(a, b))
+    else:
+        scores = (_fallback_score(measure, x, y, score_cutoff) for x, y in zip(a, b))
+    return np.fromiter(scores, dtype=np.float32, count=len(a))
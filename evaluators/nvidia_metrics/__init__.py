@@ -7,12 +7,15 @@ NVIDIA-specific evaluation metrics:
 - Response Groundedness: NVIDIA-specific groundedness metric
 """
 
-from .answer_accuracy_evaluator import create_answer_accuracy_evaluator
-from .context_relevance_evaluator import create_context_relevance_evaluator
-from .response_groundedness_evaluator import create_response_groundedness_evaluator
+from ..registry import lazy_exports
 
-__all__ = [
-    "create_answer_accuracy_evaluator",
-    "create_context_relevance_evaluator",
-    "create_response_groundedness_evaluator",
-]
+# Factory name -> module defining it, imported on first access
+_EXPORTS = {
+    "create_answer_accuracy_evaluator": ".answer_accuracy_evaluator",
+    "create_context_relevance_evaluator": ".context_relevance_evaluator",
+    "create_response_groundedness_evaluator": ".response_groundedness_evaluator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -7,14 +7,19 @@ This is a NVIDIA-specific metric used for their evaluation frameworks.
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class AnswerAccuracyEvaluator:
+
+class AnswerAccuracyEvaluator(BaseEvaluator):
     """
     Answer Accuracy metric evaluator (NVIDIA-specific).
     
     Measures the accuracy of the generated answer against ground truth/reference.
     """
     
+    metric_name = "answer_accuracy"
+    sample_fields = ("user_input", "response", "reference")
+    
     def __init__(self, llm=None):
         """
         Initialize Answer Accuracy Evaluator.
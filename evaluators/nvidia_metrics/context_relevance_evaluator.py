@@ -7,14 +7,19 @@ This is a NVIDIA-specific metric for their evaluation frameworks.
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class ContextRelevanceEvaluator:
+
+class ContextRelevanceEvaluator(BaseEvaluator):
     """
     Context Relevance metric evaluator (NVIDIA-specific).
     
     Measures how relevant retrieved contexts are for answering the user query.
     """
     
+    metric_name = "context_relevance"
+    sample_fields = ("user_input", "retrieved_contexts")
+    
     def __init__(self, llm=None, embeddings=None):
         """
         Initialize Context Relevance Evaluator.
@@ -8,22 +8,30 @@ can be supported by the provided context.
 
 from typing import Optional
 
+from ..base import get_sample_field
+from ..claims import ClaimBasedEvaluator, ClaimStore
 
-class ResponseGroundednessEvaluator:
+
+class ResponseGroundednessEvaluator(ClaimBasedEvaluator):
     """
     Response Groundedness metric evaluator (NVIDIA-specific).
     
     Measures how well grounded the response is in the retrieved contexts.
     """
     
-    def __init__(self, llm=None):
+    metric_name = "response_groundedness"
+    sample_fields = ("response", "retrieved_contexts")
+    
+    def __init__(self, llm=None, claim_store: Optional[ClaimStore] = None):
         """
         Initialize Response Groundedness Evaluator.
         
         Args:
             llm: Language model for evaluation
+            claim_store: Shared claim decomposition store (default: process-wide store)
         """
         self.llm = llm
+        self.claim_store = claim_store
     
     async def evaluate(self, sample):
         """
@@ -44,22 +52,26 @@ class ResponseGroundednessEvaluator:
         Evaluate groundedness of the response.
         
         Process:
-        1. Extract claims from response
+        1. Extract claims from response (shared via _extract_claims)
         2. Verify each claim is supported by contexts
         3. Calculate: supported claims / total claims
         """
-        # NVIDIA-specific implementation
-        pass
+        contexts = get_sample_field(sample, "retrieved_contexts") or []
+        supported, total = await self._supported_claims(
+            get_sample_field(sample, "response") or "", "\n\n".join(contexts)
+        )
+        return supported / total if total else float("nan")
 
 
-def create_response_groundedness_evaluator(llm=None):
+def create_response_groundedness_evaluator(llm=None, claim_store: Optional[ClaimStore] = None):
     """
     Factory function to create a Response Groundedness evaluator.
     
     Args:
         llm: Language model instance
+        claim_store: Shared claim decomposition store
     
     Returns:
         ResponseGroundednessEvaluator: Configured evaluator instance
     """
-    return ResponseGroundednessEvaluator(llm=llm)
+    return ResponseGroundednessEvaluator(llm=llm, claim_store=claim_store)
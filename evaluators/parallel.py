@@ -0,0 +1,232 @@
+"""
+Parallel Execution for CPU-Bound Evaluators
+
+Non-LLM metrics (BLEU, ROUGE, string similarity, exact match, string presence,
+DataCompy) are pure CPU work. Awaiting them on the event loop thread blocks
+LLM I/O and keeps a single core busy.
+
+CPUExecutor ships their work to a worker pool in chunks of samples:
+- 'process': ProcessPoolExecutor. Evaluators are pickled once per worker
+  (through the pool initializer), not once per sample or chunk.
+- 'thread': ThreadPoolExecutor fallback for evaluators that cannot be pickled
+  or platforms where spawning processes is not an option.
+- 'auto': 'process' if every evaluator pickles, otherwise 'thread'.
+
+Each chunk is evaluated on a private event loop, closed when the chunk is done.
+"""
+
+import asyncio
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple
+
+from .base import BaseEvaluator, EvaluationResult
+
+
+ExecutionMode = Literal["process", "thread", "auto"]
+
+DEFAULT_CHUNK_SIZE = 256
+
+# Chunk payloads: [(sample_index, sample), ...] in, [(index, score, error), ...] out
+IndexedChunk = Sequence[Tuple[int, object]]
+ChunkResult = List[Tuple[int, object, Optional[BaseException]]]
+
+# Per-process state installed by the pool initializer
+_worker_evaluators: Dict[str, BaseEvaluator] = {}
+
+
+def _init_process_worker(payload: bytes):
+    """Process pool initializer: unpickle the evaluators once per worker."""
+    global _worker_evaluators
+    _worker_evaluators = pickle.loads(payload)
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    """Make sure an exception can travel back from a worker process."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _score_chunk_with(evaluators: Mapping[str, BaseEvaluator], name: str, chunk: IndexedChunk) -> ChunkResult:
+    """Evaluate one chunk of samples with the named evaluator."""
+    evaluator = evaluators[name]
+    # One loop per chunk rather than per worker thread: pool threads have no
+    # teardown hook, so a per-thread loop would never be closed
+    loop = asyncio.new_event_loop()
+    scored: ChunkResult = []
+    try:
+        for index, sample in chunk:
+            try:
+                score = loop.run_until_complete(evaluator.evaluate(sample))
+            except Exception as e:
+                scored.append((index, None, _portable_error(e)))
+            else:
+                scored.append((index, score, None))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+    return scored
+
+
+def _score_chunk(name: str, chunk: IndexedChunk) -> ChunkResult:
+    """Process pool task: evaluate a chunk with the worker's evaluators."""
+    return _score_chunk_with(_worker_evaluators, name, chunk)
+
+
+def _is_picklable(obj) -> bool:
+    try:
+        pickle.dumps(obj)
+        return True
+    except Exception:
+        return False
+
+
+class CPUExecutor:
+    """
+    Worker pool for CPU-bound evaluators.
+
+    Use as a context manager (sync or async) so the pool is shut down when
+    the work is done.
+    """
+
+    def __init__(
+        self,
+        evaluators: Mapping[str, BaseEvaluator],
+        mode: ExecutionMode = "auto",
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize CPU Executor.
+
+        Args:
+            evaluators: Mapping of name to evaluator to make available in workers
+            mode: Execution mode:
+                - 'process': Process pool (evaluators must be picklable)
+                - 'thread': Thread pool
+                - 'auto': Process pool if possible, thread pool otherwise
+            max_workers: Pool size (default: number of CPUs)
+        """
+        if mode not in ("process", "thread", "auto"):
+            raise ValueError(f"Unknown execution mode: {mode}")
+
+        self.evaluators = dict(evaluators)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        if mode == "auto":
+            mode = "process" if _is_picklable(self.evaluators) else "thread"
+        self.mode = mode
+        self._pool: Optional[Executor] = None
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_process_worker,
+                    initargs=(pickle.dumps(self.evaluators),),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _task(self, name: str, chunk: IndexedChunk):
+        if self.mode == "process":
+            return partial(_score_chunk, name, list(chunk))
+        return partial(_score_chunk_with, self.evaluators, name, list(chunk))
+
+    async def ascore_chunk(self, name: str, chunk: IndexedChunk) -> List[EvaluationResult]:
+        """
+        Evaluate one chunk of indexed samples in the pool.
+
+        Args:
+            name: Name of the evaluator (key in ``evaluators``)
+            chunk: Sequence of (sample_index, sample) pairs
+
+        Returns:
+            List[EvaluationResult]: One result per sample in the chunk
+        """
+        loop = asyncio.get_running_loop()
+        scored = await loop.run_in_executor(self._get_pool(), self._task(name, chunk))
+        return [EvaluationResult(index, score=score, error=error) for index, score, error in scored]
+
+    async def aevaluate_many(
+        self,
+        name: str,
+        samples: Iterable,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate many samples with one evaluator, keeping every worker busy.
+
+        Args:
+            name: Name of the evaluator
+            samples: Iterable of samples
+            chunk_size: Samples sent to a worker per task
+
+        Returns:
+            List[EvaluationResult]: One result per sample, in input order
+        """
+        pending = enumerate(samples)
+        results: List[EvaluationResult] = []
+
+        async def feeder():
+            while True:
+                chunk = list(islice(pending, chunk_size))
+                if not chunk:
+                    return
+                results.extend(await self.ascore_chunk(name, chunk))
+
+        await asyncio.gather(*(feeder() for _ in range(self.max_workers)))
+        results.sort(key=lambda result: result.index)
+        return results
+
+    def shutdown(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.shutdown()
+
+
+def evaluate_in_pool(
+    evaluator: BaseEvaluator,
+    samples: Iterable,
+    mode: ExecutionMode = "auto",
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[EvaluationResult]:
+    """
+    Evaluate samples with a CPU-bound evaluator on a worker pool.
+
+    Args:
+        evaluator: Evaluator instance
+        samples: Iterable of samples
+        mode: 'process', 'thread' or 'auto'
+        max_workers: Pool size (default: number of CPUs)
+        chunk_size: Samples sent to a worker per task
+
+    Returns:
+        List[EvaluationResult]: One result per sample, in input order
+    """
+    async def run():
+        with CPUExecutor({"evaluator": evaluator}, mode=mode, max_workers=max_workers) as executor:
+            return await executor.aevaluate_many("evaluator", samples, chunk_size=chunk_size)
+
+    return asyncio.run(run())
@@ -0,0 +1,263 @@
+"""
+Streaming Evaluation Pipeline
+
+Evaluates JSONL datasets of any size in constant memory:
+
+1. iter_jsonl reads samples lazily, one line at a time, from files or glob
+   patterns such as ``data/**/*.jsonl``
+2. stream_evaluate feeds every (sample x evaluator) job to the evaluators with
+   a bounded in-flight window; the next sample is only read once a slot frees
+3. Each result is appended to an output JSONL file as soon as it completes,
+   so a job that dies keeps everything it finished
+
+Output records:
+    {"sample_id": "data/x.jsonl:3", "evaluator": "faithfulness", "score": 0.8, "error": null}
+"""
+
+import asyncio
+import glob
+import json
+import os
+from typing import Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from .base import BaseEvaluator, EvaluationResult
+from .runner import EvaluationRunner
+
+
+PathSpec = Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]]
+
+
+def _expand_paths(paths: PathSpec) -> Iterator[str]:
+    """Expand a path, glob pattern, or iterable of either into sorted file paths."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    for path in paths:
+        path = os.fspath(path)
+        if glob.has_magic(path):
+            yield from sorted(glob.iglob(path, recursive=True))
+        else:
+            yield path
+
+
+def is_path_spec(value) -> bool:
+    """
+    Whether a dataset argument names JSONL files rather than holding samples.
+
+    Args:
+        value: Dataset argument
+
+    Returns:
+        bool: True for a path, glob pattern, or non-empty list/tuple of them
+    """
+    if isinstance(value, (str, os.PathLike)):
+        return True
+    return isinstance(value, (list, tuple)) and bool(value) and all(
+        isinstance(item, (str, os.PathLike)) for item in value
+    )
+
+
+def iter_jsonl(paths: PathSpec) -> Iterator[Tuple[str, dict]]:
+    """
+    Lazily read samples from JSONL files.
+
+    Args:
+        paths: File path, glob pattern (``**`` is recursive), or an iterable of them
+
+    Yields:
+        Tuple[str, dict]: (sample_id, sample). The sample id is the sample's own
+            "id" field if present, otherwise "<path>:<line number>".
+    """
+    for path in _expand_paths(paths):
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                sample = json.loads(line)
+                sample_id = sample.get("id") if isinstance(sample, dict) else None
+                yield str(sample_id if sample_id is not None else f"{path}:{line_number}"), sample
+
+
+def _json_default(value):
+    """Serialize scores that are not plain JSON types (e.g. NumPy scalars)."""
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return repr(value)
+
+
+def _truncate_partial_line(f, chunk_size: int = 4096):
+    """
+    Drop a partial line left at the end of a JSONL file by a torn write.
+
+    Records appended after it would otherwise be glued onto the fragment
+    and lost when the file is read back.
+
+    Args:
+        f: File opened in binary read/write mode
+        chunk_size: Bytes read per step while scanning back for a newline
+    """
+    end = f.seek(0, os.SEEK_END)
+    position = end
+    while position > 0:
+        start = max(0, position - chunk_size)
+        f.seek(start)
+        newline = f.read(position - start).rfind(b"\n")
+        if newline >= 0:
+            keep = start + newline + 1
+            break
+        position = start
+    else:
+        keep = 0
+    if keep < end:
+        f.truncate(keep)
+
+
+def result_record(sample_id: str, name: str, result: EvaluationResult) -> dict:
+    """
+    Build the output record for one (sample, evaluator) result.
+
+    Args:
+        sample_id: Identifier of the sample
+        name: Evaluator name
+        result: Evaluation result
+
+    Returns:
+        dict: JSON-serializable record
+    """
+    return {
+        "sample_id": sample_id,
+        "evaluator": name,
+        "score": result.score,
+        "error": None if result.ok else f"{type(result.error).__name__}: {result.error}",
+    }
+
+
+class StreamSummary:
+    """
+    Counters for a streaming run.
+
+    Attributes:
+        samples: Samples read from the input
+        completed: Jobs that returned a score
+        failed: Jobs that raised
+    """
+
+    def __init__(self):
+        self.samples = 0
+        self.completed = 0
+        self.failed = 0
+
+    def __repr__(self):
+        return f"StreamSummary(samples={self.samples}, completed={self.completed}, failed={self.failed})"
+
+
+async def astream_evaluate(
+    evaluators: Union[Iterable[BaseEvaluator], Mapping[str, BaseEvaluator]],
+    samples: Iterable[Tuple[str, object]],
+    output_path: Union[str, os.PathLike],
+    max_in_flight: int = 64,
+) -> StreamSummary:
+    """
+    Evaluate a stream of samples, appending results to a JSONL file.
+
+    Args:
+        evaluators: Evaluator instances, or a mapping of result name to instance
+        samples: Iterable of (sample_id, sample) pairs, e.g. from ``iter_jsonl``
+        output_path: JSONL file results are appended to
+        max_in_flight: Maximum (sample x evaluator) jobs in flight
+
+    Returns:
+        StreamSummary: Counts of samples read and jobs completed/failed
+    """
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+
+    named = EvaluationRunner._name_evaluators(evaluators)
+    summary = StreamSummary()
+    window = asyncio.Semaphore(max_in_flight)
+    in_flight = set()
+
+    if os.path.exists(output_path):
+        with open(output_path, "rb+") as f:
+            _truncate_partial_line(f)
+    with open(output_path, "a", encoding="utf-8") as out:
+
+        async def run_job(sample_id: str, index: int, name: str, evaluator: BaseEvaluator, sample):
+            try:
+                try:
+                    score = await evaluator.evaluate(sample)
+                except Exception as e:
+                    result = EvaluationResult(index, error=e)
+                    summary.failed += 1
+                else:
+                    result = EvaluationResult(index, score=score)
+                    summary.completed += 1
+                out.write(json.dumps(result_record(sample_id, name, result), default=_json_default) + "\n")
+                out.flush()
+            finally:
+                window.release()
+
+        try:
+            for index, (sample_id, sample) in enumerate(samples):
+                summary.samples += 1
+                for name, evaluator in named.items():
+                    # Blocks reading further input until a job slot is free
+                    await window.acquire()
+                    task = asyncio.ensure_future(run_job(sample_id, index, name, evaluator, sample))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            pending = list(in_flight)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    return summary
+
+
+def stream_evaluate(
+    evaluators: Union[Iterable[BaseEvaluator], Mapping[str, BaseEvaluator]],
+    input_paths: PathSpec,
+    output_path: Union[str, os.PathLike],
+    max_in_flight: int = 64,
+) -> StreamSummary:
+    """
+    Evaluate JSONL files from synchronous code, streaming results to disk.
+
+    Args:
+        evaluators: Evaluator instances, or a mapping of result name to instance
+        input_paths: JSONL path, glob pattern, or iterable of them
+        output_path: JSONL file results are appended to
+        max_in_flight: Maximum (sample x evaluator) jobs in flight
+
+    Returns:
+        StreamSummary: Counts of samples read and jobs completed/failed
+    """
+    return asyncio.run(
+        astream_evaluate(evaluators, iter_jsonl(input_paths), output_path, max_in_flight=max_in_flight)
+    )
+
+
+def iter_results(path: Union[str, os.PathLike]) -> Iterator[dict]:
+    """
+    Lazily read result records written by ``stream_evaluate``.
+
+    A trailing partial line left by an interrupted run is skipped.
+
+    Args:
+        path: Results JSONL file
+
+    Yields:
+        dict: Result records
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
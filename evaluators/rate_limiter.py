@@ -0,0 +1,636 @@
+"""
+Rate Limiter
+
+Process-wide admission control for judge LLM calls against a fixed Azure
+OpenAI quota.
+
+- Token buckets for requests per minute and tokens per minute
+- AIMD concurrency: the number of calls in flight grows by one for every
+  window of successful calls, and is cut multiplicatively when the service
+  answers 429 or latency climbs well above its baseline
+- Retry-After: a 429 pauses every caller until the time the service asked for
+
+Every LLM-backed evaluator routes its ``llm`` through the process-wide
+limiter (see ``BaseEvaluator.llm``), so evaluators and tests that each build
+their own ``AzureChatOpenAI`` still share one quota. This is on by default:
+without a configured quota the limiter still starts at 8 calls in flight
+(``initial_concurrency``) and grows from there on success. Configure it from
+the environment:
+
+    AZURE_OPENAI_RPM=600        # requests per minute of the deployment
+    AZURE_OPENAI_TPM=100000     # tokens per minute of the deployment
+    EVAL_RATE_LIMIT=0           # opt out: evaluators use their LLM as given
+
+or explicitly with ``set_rate_limiter(AdaptiveRateLimiter(...))``.
+The LLM passed to an evaluator is never modified; proxies in front of it
+(e.g. CachedLLM) are copied with the limiter inserted beneath them.
+
+The OpenAI client retries 429s on its own before the limiter sees them;
+create the LLM with ``max_retries=0`` so the limiter can back off globally.
+"""
+
+import asyncio
+import copy
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+from .llm_cache import canonical_prompt
+from .llm_proxy import LLMProxy
+
+
+# Azure enforces per-minute quotas over short windows, so allow at most
+# ten seconds' worth of burst by default.
+DEFAULT_BURST_SECONDS = 10.0
+
+# Completion tokens assumed when the LLM does not set max_tokens
+DEFAULT_COMPLETION_TOKENS = 512
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Whether an exception is an HTTP 429 from the LLM service.
+
+    Args:
+        error: Exception raised by the LLM client
+
+    Returns:
+        bool: True for rate limit errors
+    """
+    if getattr(error, "status_code", None) == 429:
+        return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    return type(error).__name__ == "RateLimitError"
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Read the retry delay requested by the service from a 429 error.
+
+    Honours the ``retry-after-ms`` and ``retry-after`` response headers
+    (the latter in seconds).
+
+    Args:
+        error: Exception raised by the LLM client
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the service gave none
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) * scale)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    Callers reserve capacity up front and are told how long to wait, so the
+    bucket can be shared by threads and event loops without blocking.
+    """
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        """
+        Initialize Token Bucket.
+
+        Args:
+            per_minute: Refill rate per minute
+            burst: Bucket capacity (default: DEFAULT_BURST_SECONDS worth of refill)
+        """
+        if per_minute <= 0:
+            raise ValueError(f"per_minute must be > 0, got {per_minute}")
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1.0, self.rate * DEFAULT_BURST_SECONDS)
+        self._level = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take ``amount`` from the bucket, going into debt if needed.
+
+        Args:
+            amount: Capacity to consume (clamped to the bucket size)
+
+        Returns:
+            float: Seconds to wait before the reservation is covered
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._level -= min(amount, self.capacity)
+            return 0.0 if self._level >= 0 else -self._level / self.rate
+
+    def try_take(self, amount: float) -> float:
+        """
+        Take ``amount`` only if the bucket currently holds it.
+
+        Args:
+            amount: Capacity to consume (clamped to the bucket size)
+
+        Returns:
+            float: 0 if taken, otherwise seconds until it would be available
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            amount = min(amount, self.capacity)
+            if self._level >= amount:
+                self._level -= amount
+                return 0.0
+            return (amount - self._level) / self.rate
+
+    def refund(self, amount: float):
+        """
+        Return capacity (or charge more, if negative) after the fact.
+
+        Args:
+            amount: Capacity to give back
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._level = min(self.capacity, self._level + amount)
+
+
+class _Waiter:
+    """Caller queued for a concurrency slot, woken from any thread."""
+
+    __slots__ = ("loop", "future", "event")
+
+    def __init__(self, loop=None):
+        self.loop = loop
+        self.future = loop.create_future() if loop is not None else None
+        self.event = None if loop is not None else threading.Event()
+
+    def wake(self) -> bool:
+        if self.event is not None:
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+        except RuntimeError:  # the waiter's loop has been closed
+            return False
+        return True
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class Permit:
+    """
+    A concurrency slot held for one LLM call.
+
+    Exactly one of ``success``, ``rate_limited`` or ``failed`` must be called
+    when the call finishes; it releases the slot and feeds the AIMD control.
+    """
+
+    def __init__(self, limiter: "AdaptiveRateLimiter", estimated_tokens: float):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.started = time.monotonic()
+        self._released = False
+
+    def _release(self) -> bool:
+        if self._released:
+            return False
+        self._released = True
+        return True
+
+    def success(self, tokens_used: Optional[float] = None):
+        """
+        Record a successful call.
+
+        Args:
+            tokens_used: Tokens actually billed (corrects the estimate)
+        """
+        if self._release():
+            self.limiter._on_success(self, time.monotonic() - self.started, tokens_used)
+
+    def rate_limited(self, retry_after: Optional[float] = None):
+        """
+        Record a 429 response.
+
+        Args:
+            retry_after: Seconds the service asked callers to wait
+        """
+        if self._release():
+            self.limiter._on_rate_limited(retry_after)
+
+    def failed(self):
+        """Record a call that failed for another reason."""
+        if self._release():
+            self.limiter._release_slot()
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket rate limiter with AIMD concurrency control.
+
+    Attributes:
+        concurrency: Current concurrency limit
+        requests: Calls admitted
+        rate_limited: 429 responses observed
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+        default_backoff: float = 1.0,
+    ):
+        """
+        Initialize Adaptive Rate Limiter.
+
+        Args:
+            requests_per_minute: Request quota (None: unlimited)
+            tokens_per_minute: Token quota (None: unlimited)
+            initial_concurrency: Calls allowed in flight at start
+            min_concurrency: Lower bound of the concurrency limit
+            max_concurrency: Upper bound of the concurrency limit
+            decrease_factor: Multiplier applied to the limit on congestion
+            latency_tolerance: Latency above this multiple of the baseline
+                counts as congestion
+            default_backoff: Pause in seconds after a 429 without Retry-After
+        """
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be in (0, 1), got {decrease_factor}")
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("Expected 1 <= min_concurrency <= max_concurrency")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.default_backoff = default_backoff
+        self._initial_concurrency = initial_concurrency
+
+        self._request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+        self._lock = threading.Lock()
+        self._limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._in_flight = 0
+        self._waiters: "deque[_Waiter]" = deque()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+
+        self.requests = 0
+        self.rate_limited = 0
+
+    @property
+    def concurrency(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def __reduce__(self):
+        # Locks and waiters are per process; worker processes build their own
+        if self is _default_limiter:
+            return (get_rate_limiter, ())
+        return (AdaptiveRateLimiter, (
+            self.requests_per_minute, self.tokens_per_minute, self._initial_concurrency,
+            self.min_concurrency, self.max_concurrency, self.decrease_factor,
+            self.latency_tolerance, self.default_backoff,
+        ))
+
+    # Concurrency slots
+
+    def _enter_or_queue(self, waiter_factory) -> Optional[_Waiter]:
+        with self._lock:
+            if self._in_flight < int(self._limit) and not self._waiters:
+                self._in_flight += 1
+                return None
+            waiter = waiter_factory()
+            self._waiters.append(waiter)
+            return waiter
+
+    def _wake_waiters(self):
+        # Called with self._lock held
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+            if not waiter.wake():
+                self._in_flight -= 1
+
+    def _release_slot(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def _abandon(self, waiter: _Waiter):
+        """Handle a waiter cancelled while queued or just after being woken."""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+                return
+            except ValueError:
+                pass
+        self._release_slot()
+
+    # Quota
+
+    def _reserve(self, tokens: float) -> float:
+        delay = max(0.0, self._blocked_until - time.monotonic())
+        if self._request_bucket is not None:
+            delay = max(delay, self._request_bucket.reserve(1))
+        if self._token_bucket is not None:
+            delay = max(delay, self._token_bucket.reserve(tokens))
+        return delay
+
+    async def acquire(self, tokens: float = 0) -> Permit:
+        """
+        Wait for a concurrency slot and quota for one call.
+
+        Args:
+            tokens: Estimated tokens (prompt + completion) of the call
+
+        Returns:
+            Permit: Slot to release when the call finishes
+        """
+        loop = asyncio.get_running_loop()
+        waiter = self._enter_or_queue(lambda: _Waiter(loop))
+        try:
+            if waiter is not None:
+                await waiter.future
+            delay = self._reserve(tokens)
+            while delay > 0:
+                await asyncio.sleep(delay)
+                # A 429 may have arrived while sleeping
+                delay = self._blocked_until - time.monotonic()
+        except BaseException:
+            if waiter is not None:
+                self._abandon(waiter)
+            else:
+                self._release_slot()
+            raise
+        self.requests += 1
+        return Permit(self, tokens)
+
+    def acquire_sync(self, tokens: float = 0) -> Permit:
+        """
+        Blocking variant of ``acquire`` for synchronous LLM calls.
+
+        Args:
+            tokens: Estimated tokens (prompt + completion) of the call
+
+        Returns:
+            Permit: Slot to release when the call finishes
+        """
+        waiter = self._enter_or_queue(_Waiter)
+        if waiter is not None:
+            waiter.event.wait()
+        delay = self._reserve(tokens)
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._blocked_until - time.monotonic()
+        self.requests += 1
+        return Permit(self, tokens)
+
+    # AIMD control
+
+    def _decrease(self, now: float):
+        # Calls in flight together see the same congestion; cut once per round trip
+        if now - self._last_decrease < (self._latency or self.default_backoff):
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_concurrency), self._limit * self.decrease_factor)
+
+    def _on_success(self, permit: Permit, latency: float, tokens_used: Optional[float]):
+        if tokens_used is not None and self._token_bucket is not None:
+            self._token_bucket.refund(permit.estimated_tokens - tokens_used)
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            if self._baseline is None or self._latency < self._baseline:
+                self._baseline = self._latency
+            if self._latency > self.latency_tolerance * self._baseline:
+                self._decrease(now)
+            else:
+                # +1 per window of `limit` successful calls
+                self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._wake_waiters()
+
+    def _on_rate_limited(self, retry_after: Optional[float]):
+        now = time.monotonic()
+        pause = retry_after if retry_after is not None else self.default_backoff
+        with self._lock:
+            self.rate_limited += 1
+            self._in_flight -= 1
+            self._blocked_until = max(self._blocked_until, now + pause)
+            self._decrease(now)
+            self._wake_waiters()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the limiter state.
+
+        Returns:
+            Dict[str, Any]: Concurrency, in-flight calls, counters and latency
+        """
+        return {
+            "concurrency": self.concurrency,
+            "in_flight": self._in_flight,
+            "requests": self.requests,
+            "rate_limited": self.rate_limited,
+            "latency": self._latency,
+            "baseline_latency": self._baseline,
+        }
+
+
+_default_limiter: Optional[AdaptiveRateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """
+    Process-wide limiter shared by every LLM-backed evaluator.
+
+    Created on first use from the AZURE_OPENAI_RPM and AZURE_OPENAI_TPM
+    environment variables (unset: no quota, AIMD concurrency only).
+
+    Returns:
+        AdaptiveRateLimiter: Shared limiter
+    """
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            rpm = os.getenv("AZURE_OPENAI_RPM")
+            tpm = os.getenv("AZURE_OPENAI_TPM")
+            _default_limiter = AdaptiveRateLimiter(
+                requests_per_minute=float(rpm) if rpm else None,
+                tokens_per_minute=float(tpm) if tpm else None,
+            )
+        return _default_limiter
+
+
+def rate_limiting_enabled() -> bool:
+    """
+    Whether evaluators route assigned LLMs through the process-wide limiter.
+
+    Returns:
+        bool: False when EVAL_RATE_LIMIT=0
+    """
+    return os.getenv("EVAL_RATE_LIMIT") != "0"
+
+
+def set_rate_limiter(limiter: Optional[AdaptiveRateLimiter]):
+    """
+    Replace the process-wide limiter.
+
+    Only affects evaluators created afterwards.
+
+    Args:
+        limiter: New limiter, or None to rebuild it from the environment
+    """
+    global _default_limiter
+    with _default_lock:
+        _default_limiter = limiter
+
+
+def _usage_tokens(response) -> Optional[float]:
+    """Total tokens billed for a response, when the LLM reports usage."""
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict) and "total_tokens" in usage:
+        return usage["total_tokens"]
+    llm_output = getattr(response, "llm_output", None)
+    if isinstance(llm_output, dict):
+        usage = llm_output.get("token_usage") or {}
+        if "total_tokens" in usage:
+            return usage["total_tokens"]
+    return None
+
+
+class RateLimitedLLM(LLMProxy):
+    """
+    LLM wrapper admitting calls through an AdaptiveRateLimiter.
+
+    429 responses are retried after the limiter's pause, up to
+    ``max_retries`` times.
+    """
+
+    def __init__(self, llm, limiter: Optional[AdaptiveRateLimiter] = None, max_retries: int = 6):
+        """
+        Initialize Rate Limited LLM.
+
+        Args:
+            llm: LLM instance to wrap
+            limiter: Limiter to use (default: process-wide limiter)
+            max_retries: Retries of a call answered with 429
+        """
+        super().__init__(llm)
+        self.limiter = limiter or get_rate_limiter()
+        self.max_retries = max_retries
+
+    def estimate_tokens(self, args: Tuple, kwargs: Dict[str, Any]) -> float:
+        """
+        Estimate the tokens of a call before sending it.
+
+        Uses ~4 characters per prompt token plus the completion budget; the
+        estimate is corrected from reported usage once the call returns.
+
+        Args:
+            args: Positional call arguments
+            kwargs: Keyword call arguments
+
+        Returns:
+            float: Estimated prompt + completion tokens
+        """
+        prompt_chars = len(str(canonical_prompt(list(args))))
+        completion = kwargs.get("max_tokens") or getattr(self.llm, "max_tokens", None) or DEFAULT_COMPLETION_TOKENS
+        return prompt_chars / 4.0 + completion
+
+    def _call(self, method, args, kwargs):
+        tokens = self.estimate_tokens(args, kwargs)
+        for attempt in range(self.max_retries + 1):
+            permit = self.limiter.acquire_sync(tokens)
+            try:
+                response = super()._call(method, args, kwargs)
+            except BaseException as e:
+                if not isinstance(e, Exception) or not is_rate_limit_error(e):
+                    permit.failed()
+                    raise
+                permit.rate_limited(retry_after_seconds(e))
+                if attempt == self.max_retries:
+                    raise
+            else:
+                permit.success(_usage_tokens(response))
+                return response
+
+    async def _acall(self, method, args, kwargs):
+        tokens = self.estimate_tokens(args, kwargs)
+        for attempt in range(self.max_retries + 1):
+            permit = await self.limiter.acquire(tokens)
+            try:
+                response = await super()._acall(method, args, kwargs)
+            except BaseException as e:
+                if not isinstance(e, Exception) or not is_rate_limit_error(e):
+                    permit.failed()
+                    raise
+                permit.rate_limited(retry_after_seconds(e))
+                if attempt == self.max_retries:
+                    raise
+            else:
+                permit.success(_usage_tokens(response))
+                return response
+
+
+def with_rate_limit(llm, limiter: Optional[AdaptiveRateLimiter] = None, max_retries: int = 6):
+    """
+    Route an LLM through a rate limiter (idempotent).
+
+    LLMs already wrapped by a RateLimitedLLM, directly or beneath other
+    proxies, are returned unchanged. For other proxies (e.g. CachedLLM) the
+    limiter is inserted beneath the innermost proxy, so cache hits are not
+    throttled; the proxies are shallow-copied, so ``llm`` itself is left
+    untouched.
+
+    Args:
+        llm: LLM instance (None is returned as is)
+        limiter: Limiter to use (default: process-wide limiter)
+        max_retries: Retries of a call answered with 429
+
+    Returns:
+        The rate-limited LLM
+    """
+    if llm is None:
+        return None
+    proxies = []
+    current = llm
+    while isinstance(current, LLMProxy):
+        if isinstance(current, RateLimitedLLM):
+            return llm
+        proxies.append(current)
+        current = current.llm
+    wrapped = RateLimitedLLM(current, limiter=limiter, max_retries=max_retries)
+    for proxy in reversed(proxies):
+        proxy = copy.copy(proxy)
+        proxy.llm = wrapped
+        wrapped = proxy
+    return wrapped
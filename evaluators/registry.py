@@ -0,0 +1,139 @@
+"""
+Evaluator Registry
+
+Name-based access to every evaluator factory without importing the whole
+package:
+
+    import evaluators
+    faithfulness = evaluators.get("faithfulness", llm=llm)
+
+Factories are recorded as (module, attribute) strings and only imported when
+first requested, so a worker process that needs one evaluator pays for one
+module import. The package ``__init__`` files use ``lazy_exports`` to provide
+the same behaviour for attribute access (PEP 562 module ``__getattr__``).
+"""
+
+import importlib
+from typing import Callable, Dict, List, Mapping, Tuple
+
+
+# metric_name -> (module, factory function)
+_FACTORIES: Dict[str, Tuple[str, str]] = {
+    # Retrieval Augmented Generation
+    "context_precision": ("evaluators.retrieval_augmented_generation.context_precision_evaluator", "create_context_precision_evaluator"),
+    "context_recall": ("evaluators.retrieval_augmented_generation.context_recall_evaluator", "create_context_recall_evaluator"),
+    "context_entities_recall": ("evaluators.retrieval_augmented_generation.context_entities_recall_evaluator", "create_context_entities_recall_evaluator"),
+    "noise_sensitivity": ("evaluators.retrieval_augmented_generation.noise_sensitivity_evaluator", "create_noise_sensitivity_evaluator"),
+    "response_relevancy": ("evaluators.retrieval_augmented_generation.response_relevancy_evaluator", "create_response_relevancy_evaluator"),
+    "faithfulness": ("evaluators.retrieval_augmented_generation.faithfulness_evaluator", "create_faithfulness_evaluator"),
+    "multimodal_faithfulness": ("evaluators.retrieval_augmented_generation.multimodal_faithfulness_evaluator", "create_multimodal_faithfulness_evaluator"),
+    "multimodal_relevance": ("evaluators.retrieval_augmented_generation.multimodal_relevance_evaluator", "create_multimodal_relevance_evaluator"),
+    # NVIDIA Metrics
+    "answer_accuracy": ("evaluators.nvidia_metrics.answer_accuracy_evaluator", "create_answer_accuracy_evaluator"),
+    "context_relevance": ("evaluators.nvidia_metrics.context_relevance_evaluator", "create_context_relevance_evaluator"),
+    "response_groundedness": ("evaluators.nvidia_metrics.response_groundedness_evaluator", "create_response_groundedness_evaluator"),
+    # Agents and Tools
+    "topic_adherence": ("evaluators.agents_and_tools.topic_adherence_evaluator", "create_topic_adherence_evaluator"),
+    "tool_call_accuracy": ("evaluators.agents_and_tools.tool_call_accuracy_evaluator", "create_tool_call_accuracy_evaluator"),
+    "tool_call_f1": ("evaluators.agents_and_tools.tool_call_f1_evaluator", "create_tool_call_f1_evaluator"),
+    "agent_goal_accuracy": ("evaluators.agents_and_tools.agent_goal_accuracy_evaluator", "create_agent_goal_accuracy_evaluator"),
+    # Natural Language Comparison
+    "factual_correctness": ("evaluators.natural_language_comparison.factual_correctness_evaluator", "create_factual_correctness_evaluator"),
+    "semantic_similarity": ("evaluators.natural_language_comparison.semantic_similarity_evaluator", "create_semantic_similarity_evaluator"),
+    "nonllm_string_similarity": ("evaluators.natural_language_comparison.nonllm_string_similarity_evaluator", "create_nonllm_string_similarity_evaluator"),
+    "bleu_score": ("evaluators.natural_language_comparison.bleu_score_evaluator", "create_bleu_score_evaluator"),
+    "rouge_score": ("evaluators.natural_language_comparison.rouge_score_evaluator", "create_rouge_score_evaluator"),
+    "string_presence": ("evaluators.natural_language_comparison.string_presence_evaluator", "create_string_presence_evaluator"),
+    "exact_match": ("evaluators.natural_language_comparison.exact_match_evaluator", "create_exact_match_evaluator"),
+    # SQL Metrics
+    "datacompy_score": ("evaluators.sql_metrics.datacompy_score_evaluator", "create_datacompy_score_evaluator"),
+    "sql_query_equivalence": ("evaluators.sql_metrics.sql_query_equivalence_evaluator", "create_sql_query_equivalence_evaluator"),
+    # General Purpose and Other Tasks
+    "aspect_critic": ("evaluators.general_purpose_and_other_tasks.aspect_critic_evaluator", "create_aspect_critic_evaluator"),
+    "simple_criteria_scoring": ("evaluators.general_purpose_and_other_tasks.simple_criteria_scoring_evaluator", "create_simple_criteria_scoring_evaluator"),
+    "rubrics_based_scoring": ("evaluators.general_purpose_and_other_tasks.rubrics_based_scoring_evaluator", "create_rubrics_based_scoring_evaluator"),
+    "instance_specific_rubrics_scoring": ("evaluators.general_purpose_and_other_tasks.instance_specific_rubrics_scoring_evaluator", "create_instance_specific_rubrics_scoring_evaluator"),
+    "summarization": ("evaluators.general_purpose_and_other_tasks.summarization_evaluator", "create_summarization_evaluator"),
+}
+
+
+def available() -> List[str]:
+    """
+    List the registered evaluator names.
+
+    Returns:
+        List[str]: Sorted evaluator names accepted by ``get``
+    """
+    return sorted(_FACTORIES)
+
+
+def register(name: str, module: str, factory: str):
+    """
+    Register an additional evaluator factory.
+
+    Args:
+        name: Name to look the evaluator up by
+        module: Absolute module path containing the factory
+        factory: Name of the factory function in that module
+    """
+    _FACTORIES[name] = (module, factory)
+
+
+def get_factory(name: str) -> Callable:
+    """
+    Import and return the factory function for an evaluator.
+
+    Args:
+        name: Registered evaluator name (e.g. "faithfulness")
+
+    Returns:
+        Callable: The evaluator's factory function
+    """
+    try:
+        module, factory = _FACTORIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown evaluator: {name}. Available: {', '.join(available())}"
+        ) from None
+    return getattr(importlib.import_module(module), factory)
+
+
+def get(name: str, **kwargs):
+    """
+    Create an evaluator by name.
+
+    Args:
+        name: Registered evaluator name (e.g. "faithfulness")
+        **kwargs: Arguments forwarded to the evaluator's factory
+
+    Returns:
+        Configured evaluator instance
+    """
+    return get_factory(name)(**kwargs)
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]):
+    """
+    Build PEP 562 ``__getattr__``/``__dir__`` hooks for a package.
+
+    Args:
+        package: ``__name__`` of the package defining the hooks
+        exports: Mapping of attribute name to the (relative) module defining it
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) functions for the package
+    """
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        imported = importlib.import_module(module, package)
+        # Submodule exports (e.g. a category package) are the module itself
+        value = imported if module.lstrip(".") == name else getattr(imported, name)
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
@@ -12,22 +12,20 @@ Metrics for evaluating RAG system quality:
 - Multimodal Relevance: Relevance with multimodal information
 """
 
-from .context_precision_evaluator import create_context_precision_evaluator
-from .context_recall_evaluator import create_context_recall_evaluator
-from .context_entities_recall_evaluator import create_context_entities_recall_evaluator
-from .noise_sensitivity_evaluator import create_noise_sensitivity_evaluator
-from .response_relevancy_evaluator import create_response_relevancy_evaluator
-from .faithfulness_evaluator import create_faithfulness_evaluator
-from .multimodal_faithfulness_evaluator import create_multimodal_faithfulness_evaluator
-from .multimodal_relevance_evaluator import create_multimodal_relevance_evaluator
+from ..registry import lazy_exports
 
-__all__ = [
-    "create_context_precision_evaluator",
-    "create_context_recall_evaluator",
-    "create_context_entities_recall_evaluator",
-    "create_noise_sensitivity_evaluator",
-    "create_response_relevancy_evaluator",
-    "create_faithfulness_evaluator",
-    "create_multimodal_faithfulness_evaluator",
-    "create_multimodal_relevance_evaluator",
-]
+# Factory name -> module defining it, imported on first access
+_EXPORTS = {
+    "create_context_precision_evaluator": ".context_precision_evaluator",
+    "create_context_recall_evaluator": ".context_recall_evaluator",
+    "create_context_entities_recall_evaluator": ".context_entities_recall_evaluator",
+    "create_noise_sensitivity_evaluator": ".noise_sensitivity_evaluator",
+    "create_response_relevancy_evaluator": ".response_relevancy_evaluator",
+    "create_faithfulness_evaluator": ".faithfulness_evaluator",
+    "create_multimodal_faithfulness_evaluator": ".multimodal_faithfulness_evaluator",
+    "create_multimodal_relevance_evaluator": ".multimodal_relevance_evaluator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,119 @@
+"""
+Chunk Verdict Store
+
+LLM context precision judges every retrieved chunk on its own: "was this
+chunk useful for arriving at the reference (or response) to this question?"
+Across retriever variants and repeated runs most (question, chunk) pairs
+come back unchanged. ChunkVerdictStore keeps each verdict, keyed by
+(question, reference or response, chunk, model), so only unseen chunks reach
+the LLM:
+
+- In-memory LRU for the current process
+- Optional DiskCache to reuse verdicts across runs
+- Concurrent requests for the same verdict wait for a single LLM call
+
+Evaluators use the process-wide default store unless one is passed to
+their factory.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+from ..cache import DiskCache, MemoCache, make_key, process_default
+
+
+ChunkJudge = Callable[[str], Awaitable[Optional[bool]]]
+
+
+class ChunkVerdictStore(MemoCache):
+    """
+    Cache of per-chunk relevance verdicts.
+
+    Attributes:
+        hits: Verdicts served without calling the judge
+        misses: Verdicts that called the judge
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, max_memory_entries: int = 1_000_000):
+        """
+        Initialize Chunk Verdict Store.
+
+        Args:
+            cache: Optional DiskCache for persistence across runs
+            max_memory_entries: Verdicts kept in memory (LRU)
+        """
+        super().__init__(cache, max_memory_entries)
+
+    @staticmethod
+    def key(question: str, answer: str, chunk: str, model, against: str = "reference") -> str:
+        """
+        Compute the key of a verdict.
+
+        Args:
+            question: User input
+            answer: Reference or response the chunk is judged against
+            chunk: Retrieved chunk text
+            model: Model identity (see llm_proxy.llm_identity)
+            against: 'reference' or 'response' (which prompt produced the verdict)
+
+        Returns:
+            str: Content-addressed key
+        """
+        return make_key("chunk_verdict", model, against, question, answer, chunk)
+
+    async def get_or_judge(
+        self,
+        question: str,
+        answer: str,
+        chunks: Sequence[str],
+        judge: ChunkJudge,
+        model=None,
+        against: str = "reference",
+    ) -> Optional[List[bool]]:
+        """
+        Return the verdict of every chunk, judging only unseen ones.
+
+        Args:
+            question: User input
+            answer: Reference or response the chunks are judged against
+            chunks: Retrieved chunks, in rank order
+            judge: Coroutine function judging one chunk (True: useful)
+            model: Model identity of the judging LLM
+            against: 'reference' or 'response'
+
+        Returns:
+            Optional[List[bool]]: Verdicts in rank order (None if the judge
+                gave no verdict for some chunk; such verdicts are not cached)
+        """
+        async def judge_one(chunk: str) -> Optional[bool]:
+            verdict = await judge(chunk)
+            return None if verdict is None else bool(verdict)
+
+        verdicts = await asyncio.gather(*(
+            self.aget_or_create(self.key(question, answer, chunk, model, against), lambda chunk=chunk: judge_one(chunk))
+            for chunk in chunks
+        ))
+        return None if any(verdict is None for verdict in verdicts) else list(verdicts)
+
+
+_get_default_store, _set_default_store = process_default(ChunkVerdictStore)
+
+
+def get_default_verdict_store() -> ChunkVerdictStore:
+    """
+    Process-wide verdict store used by evaluators created without one.
+
+    Returns:
+        ChunkVerdictStore: Shared in-memory store
+    """
+    return _get_default_store()
+
+
+def set_default_verdict_store(store: Optional[ChunkVerdictStore]):
+    """
+    Replace the process-wide verdict store (e.g. with a persistent one).
+
+    Args:
+        store: New default store, or None to reset to a fresh in-memory store
+    """
+    _set_default_store(store)
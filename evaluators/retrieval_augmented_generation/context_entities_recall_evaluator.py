@@ -15,8 +15,10 @@ Where:
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class ContextEntitiesRecallEvaluator:
+
+class ContextEntitiesRecallEvaluator(BaseEvaluator):
     """
     Context Entities Recall metric evaluator.
     
@@ -24,6 +26,9 @@ class ContextEntitiesRecallEvaluator:
     in the retrieved contexts. Useful for fact-based evaluation where entities matter.
     """
     
+    metric_name = "context_entities_recall"
+    sample_fields = ("reference", "retrieved_contexts")
+    
     def __init__(self, llm=None):
         """
         Initialize Context Entities Recall Evaluator.
@@ -18,12 +18,67 @@ Where:
     K = total number of chunks in retrieved_contexts
     v_k ∈ {0,1} = relevance indicator at rank k
     Precision@k = true positives@k / (true positives@k + false positives@k)
+
+For 'id_based', ``evaluate_corpus`` scores a whole dataset at once and adds
+average precision, MRR, nDCG and precision@k / recall@k (see ``ranking``).
+
+With ``return_curve``, per-chunk relevance is judged once and the evaluator
+returns precision@k, recall@k and AP@k for every cutoff k ≤ K, so choosing a
+top-k needs one run instead of one per K.
+
+LLM verdicts are cached per (question, reference or response, chunk, model)
+in a ChunkVerdictStore (see ``chunk_verdicts``), so chunks already judged in
+earlier runs or by another retriever variant do not reach the LLM again.
+"""
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..base import BaseEvaluator, get_sample_field
+
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    import numpy as np
+
+    from .chunk_verdicts import ChunkVerdictStore
+
+
+# Context precision verification prompt (after ragas' ContextPrecisionPrompt)
+VERIFICATION_PROMPT = """Given a question, an answer and a context, verify whether the context was useful \
+in arriving at the given answer. Reply with JSON only: {{"reason": "<one sentence>", "verdict": 1}} \
+if it was useful, or the same with "verdict": 0 if it was not.
+
+question: {question}
+context: {context}
+answer: {answer}
 """
 
-from typing import Optional
+
+def parse_verdict(reply) -> Optional[bool]:
+    """
+    Read the 0/1 verdict from an LLM reply to ``VERIFICATION_PROMPT``.
+
+    Args:
+        reply: Chat message (``.content``) or text
+
+    Returns:
+        Optional[bool]: The verdict, or None if the reply holds none
+    """
+    text = getattr(reply, "content", reply)
+    match = re.search(r"\{.*\}", text if isinstance(text, str) else "", re.DOTALL)
+    if match is None:
+        return None
+    try:
+        verdict = json.loads(match.group(0)).get("verdict")
+    except (ValueError, AttributeError):
+        return None
+    if verdict in (0, 1, "0", "1"):
+        return int(verdict) == 1
+    return None
 
 
-class ContextPrecisionEvaluator:
+class ContextPrecisionEvaluator(BaseEvaluator):
     """
     Context Precision metric evaluator.
     
@@ -32,7 +87,12 @@ class ContextPrecisionEvaluator:
     mixed with irrelevant results.
     """
     
-    def __init__(self, llm=None, embeddings=None, metric_type: str = "llm_without_reference"):
+    metric_name = "context_precision"
+    sample_fields = ("user_input", "response", "reference", "retrieved_contexts", "reference_contexts", "retrieved_context_ids", "reference_context_ids")
+    
+    def __init__(self, llm=None, embeddings=None, metric_type: str = "llm_without_reference",
+                 distance_measure: str = "levenshtein", threshold: float = 0.5, return_curve: bool = False,
+                 verdict_store: Optional["ChunkVerdictStore"] = None):
         """
         Initialize Context Precision Evaluator.
         
@@ -44,10 +104,19 @@ class ContextPrecisionEvaluator:
                 - 'llm_with_reference': LLM comparison with reference
                 - 'non_llm': Non-LLM string similarity (requires rapidfuzz)
                 - 'id_based': Direct ID comparison
+            distance_measure: String distance used by 'non_llm'
+            threshold: Similarity at which 'non_llm' counts a chunk as relevant
+            return_curve: Return the precision@k / recall@k / AP@k curve
+                (see ``evaluate_curve``) instead of the score
+            verdict_store: Cache of LLM chunk verdicts (default: process-wide store)
         """
         self.llm = llm
         self.embeddings = embeddings
         self.metric_type = metric_type
+        self.distance_measure = distance_measure
+        self.threshold = threshold
+        self.return_curve = return_curve
+        self.verdict_store = verdict_store
     
     async def evaluate(self, sample):
         """
@@ -64,8 +133,10 @@ class ContextPrecisionEvaluator:
                 - reference_context_ids (optional): IDs of reference contexts
         
         Returns:
-            float: Precision score between 0 and 1
+            float: Precision score between 0 and 1 (a dict of curves with ``return_curve``)
         """
+        if self.return_curve:
+            return await self.evaluate_curve(sample)
         if self.metric_type == "llm_without_reference":
             return await self._evaluate_llm_without_reference(sample)
         elif self.metric_type == "llm_with_reference":
@@ -77,29 +148,183 @@ class ContextPrecisionEvaluator:
         else:
             raise ValueError(f"Unknown metric type: {self.metric_type}")
     
-    async def _evaluate_llm_without_reference(self, sample) -> float:
+    async def _evaluate_llm_without_reference(self, sample) -> Optional[float]:
         """Evaluate using LLM comparison with response."""
-        # Implementation would use ragas.metrics.LLMContextPrecisionWithoutReference
-        pass
+        verdicts = await self._llm_verdicts(sample, use_reference=False)
+        return None if verdicts is None else self._average_precision(verdicts)
     
-    async def _evaluate_llm_with_reference(self, sample) -> float:
+    async def _evaluate_llm_with_reference(self, sample) -> Optional[float]:
         """Evaluate using LLM comparison with reference."""
-        # Implementation would use ragas.metrics.LLMContextPrecisionWithReference
-        pass
+        verdicts = await self._llm_verdicts(sample, use_reference=True)
+        return None if verdicts is None else self._average_precision(verdicts)
+
+    @staticmethod
+    def _average_precision(verdicts) -> float:
+        """Context Precision@K of relevance verdicts in rank order."""
+        import numpy as np
+
+        verdicts = np.asarray(verdicts, dtype=bool)
+        hits = np.cumsum(verdicts)
+        if not len(verdicts) or not hits[-1]:
+            return 0.0
+        precision_at_k = hits / np.arange(1, len(verdicts) + 1)
+        return float(precision_at_k[verdicts].sum() / hits[-1])
     
     async def _evaluate_non_llm(self, sample) -> float:
-        """Evaluate using non-LLM similarity measures."""
-        # Implementation would use ragas.metrics.NonLLMContextPrecisionWithReference
-        pass
+        """
+        Evaluate using non-LLM similarity measures.
+
+        A retrieved chunk is relevant when its best match among the reference
+        contexts reaches ``threshold``; all pairs are scored as one matrix.
+        """
+        return self._average_precision(self._non_llm_verdicts(sample))
+
+    def _non_llm_verdicts(self, sample) -> "np.ndarray":
+        """Relevance of each retrieved chunk by string similarity to the reference contexts."""
+        # Imported here so importing the evaluator stays cheap
+        import numpy as np
+        from ..natural_language_comparison.string_similarity import similarity_matrix
+
+        retrieved = get_sample_field(sample, "retrieved_contexts") or []
+        reference = get_sample_field(sample, "reference_contexts") or []
+        if not retrieved or not reference:
+            return np.zeros(len(retrieved), dtype=bool)
+        matrix = similarity_matrix(retrieved, reference, self.distance_measure, score_cutoff=self.threshold)
+        return matrix.max(axis=1) >= self.threshold
+
+    async def _llm_verdicts(self, sample, use_reference: bool) -> Optional[List[bool]]:
+        """
+        Judge each retrieved chunk with the LLM, reusing cached verdicts.
+
+        Process:
+        1. Look up each (question, reference or response, chunk, model) verdict
+        2. Judge the chunks not seen before (``_judge_chunk``)
+        3. Return one verdict per chunk, in rank order
+        """
+        # Imported here so importing the evaluator stays cheap
+        from ..llm_proxy import llm_identity
+        from .chunk_verdicts import get_default_verdict_store
+
+        question = get_sample_field(sample, "user_input") or ""
+        answer = get_sample_field(sample, "reference" if use_reference else "response") or ""
+        chunks = get_sample_field(sample, "retrieved_contexts") or []
+        store = self.verdict_store or get_default_verdict_store()
+
+        async def judge(chunk: str) -> Optional[bool]:
+            return await self._judge_chunk(question, answer, chunk, use_reference)
+
+        return await store.get_or_judge(
+            question, answer, chunks, judge,
+            model=llm_identity(self.llm) if self.llm is not None else None,
+            against="reference" if use_reference else "response",
+        )
+
+    async def _judge_chunk(self, question: str, answer: str, chunk: str, use_reference: bool) -> Optional[bool]:
+        """
+        Ask the LLM whether one chunk was useful for arriving at the answer.
+
+        Process:
+        1. Prompt the LLM with the question, the chunk and the reference
+           (``use_reference``) or the response
+        2. Parse the verdict (1: useful, 0: not useful)
+
+        Returns:
+            Optional[bool]: The verdict; None without an LLM or when the reply
+                holds none (not cached, so the chunk is judged again next time)
+        """
+        if self.llm is None:
+            return None
+        reply = await self.llm.ainvoke(VERIFICATION_PROMPT.format(question=question, context=chunk, answer=answer))
+        return parse_verdict(reply)
+
+    async def _relevance(self, sample) -> Tuple[Optional["np.ndarray"], Optional[int]]:
+        """
+        Relevance of each retrieved item, and the number of relevant items if known.
+
+        Returns:
+            Tuple: Boolean verdicts in rank order (None if the judge gave
+                none) and the recall denominator (None: relevant items in
+                the ranking)
+        """
+        import numpy as np
+
+        if self.metric_type in ("llm_without_reference", "llm_with_reference"):
+            verdicts = await self._llm_verdicts(sample, use_reference=self.metric_type == "llm_with_reference")
+            return (None if verdicts is None else np.asarray(verdicts, dtype=bool)), None
+        if self.metric_type == "non_llm":
+            return self._non_llm_verdicts(sample), None
+        if self.metric_type == "id_based":
+            from .ranking import encode_id_lists, id_relevance
+
+            encoded = encode_id_lists(
+                [get_sample_field(sample, "retrieved_context_ids") or []],
+                [get_sample_field(sample, "reference_context_ids") or []],
+            )
+            relevance, _, reference_counts = id_relevance(*encoded)
+            return relevance, int(reference_counts[0])
+        raise ValueError(f"Unknown metric type: {self.metric_type}")
+
+    async def evaluate_curve(self, sample) -> Optional[Dict[str, Any]]:
+        """
+        Precision@k, recall@k and AP@k for every cutoff k = 1..K.
+
+        Relevance is judged once per retrieved chunk; every cutoff reuses
+        the same verdicts.
+
+        Args:
+            sample: Sample as for ``evaluate``
+
+        Returns:
+            Optional[Dict[str, Any]]: "precision@k", "recall@k" and "ap@k"
+                arrays (index k - 1 holds cutoff k) and "context_precision"
+                (AP@K); None if the LLM gave no verdicts. Recall is relative
+                to the reference IDs for 'id_based', otherwise to the
+                relevant chunks in the top K.
+        """
+        import numpy as np
+        from .ranking import ranking_curves
+
+        verdicts, relevant_total = await self._relevance(sample)
+        if verdicts is None:
+            return None
+        totals = None if relevant_total is None else np.array([relevant_total])
+        curves: Dict[str, Any] = ranking_curves(verdicts, np.array([0, len(verdicts)]), totals)
+        curves["context_precision"] = float(curves["ap@k"][-1]) if len(verdicts) else 0.0
+        return curves
     
     async def _evaluate_id_based(self, sample) -> float:
         """Evaluate using ID-based comparison."""
-        # Implementation would use ragas.metrics.IDBasedContextPrecision
-        # Formula: # of retrieved IDs found in reference / total retrieved IDs
-        pass
+        result = self.evaluate_corpus([sample], cutoffs=())
+        return float(result["precision"][0])
+
+    def evaluate_corpus(self, samples: Iterable, cutoffs: Sequence[int] = (1, 5, 10)) -> Dict[str, "np.ndarray"]:
+        """
+        Ranking metrics of ID-based retrieval for a whole dataset.
+
+        Args:
+            samples: Samples with retrieved_context_ids and reference_context_ids
+            cutoffs: Ranks k to report "precision@k" and "recall@k" for
+
+        Returns:
+            Dict[str, np.ndarray]: Per-sample "precision", "recall",
+                "average_precision", "reciprocal_rank", "ndcg" and the cutoff
+                metrics (see ranking.ranking_metrics)
+        """
+        if self.metric_type != "id_based":
+            raise ValueError(f"evaluate_corpus needs metric_type='id_based', not {self.metric_type!r}")
+        # Imported here so importing the evaluator stays cheap
+        from .ranking import id_ranking_metrics
+
+        retrieved, reference = [], []
+        for sample in samples:
+            retrieved.append(get_sample_field(sample, "retrieved_context_ids") or [])
+            reference.append(get_sample_field(sample, "reference_context_ids") or [])
+        return id_ranking_metrics(retrieved, reference, cutoffs=cutoffs)
 
 
-def create_context_precision_evaluator(llm=None, embeddings=None, metric_type: str = "llm_without_reference"):
+def create_context_precision_evaluator(llm=None, embeddings=None, metric_type: str = "llm_without_reference",
+                                       distance_measure: str = "levenshtein", threshold: float = 0.5,
+                                       return_curve: bool = False, verdict_store=None):
     """
     Factory function to create a Context Precision evaluator.
     
@@ -107,8 +332,16 @@ def create_context_precision_evaluator(llm=None, embeddings=None, metric_type: s
         llm: Language model instance
         embeddings: Embeddings model instance
         metric_type: Type of evaluation metric to use
+        distance_measure: String distance for 'non_llm'
+        threshold: Relevance threshold for 'non_llm'
+        return_curve: Return precision@k / recall@k / AP@k curves instead of the score
+        verdict_store: Cache of LLM chunk verdicts
     
     Returns:
         ContextPrecisionEvaluator: Configured evaluator instance
     """
-    return ContextPrecisionEvaluator(llm=llm, embeddings=embeddings, metric_type=metric_type)
+    return ContextPrecisionEvaluator(
+        llm=llm, embeddings=embeddings, metric_type=metric_type,
+        distance_measure=distance_measure, threshold=threshold, return_curve=return_curve,
+        verdict_store=verdict_store,
+    )
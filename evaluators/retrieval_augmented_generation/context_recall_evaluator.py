@@ -14,12 +14,21 @@ Formula:
 
 Or for ID-based:
     Context Recall = # reference context IDs found in retrieved context IDs / Total reference context IDs
+
+For 'id_based', ``evaluate_corpus`` scores a whole dataset at once (see ``ranking``).
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence
+
+from ..base import get_sample_field
+from ..claims import ClaimBasedEvaluator, ClaimStore
 
+if TYPE_CHECKING:
+    # Annotations only, so importing the evaluator stays cheap
+    import numpy as np
 
-class ContextRecallEvaluator:
+
+class ContextRecallEvaluator(ClaimBasedEvaluator):
     """
     Context Recall metric evaluator.
     
@@ -27,7 +36,11 @@ class ContextRecallEvaluator:
     reference contexts. A high recall means fewer relevant documents were left out.
     """
     
-    def __init__(self, llm=None, metric_type: str = "llm"):
+    metric_name = "context_recall"
+    sample_fields = ("user_input", "reference", "retrieved_contexts", "reference_contexts", "retrieved_context_ids", "reference_context_ids")
+    
+    def __init__(self, llm=None, metric_type: str = "llm", claim_store: Optional[ClaimStore] = None,
+                 distance_measure: str = "levenshtein", threshold: float = 0.5):
         """
         Initialize Context Recall Evaluator.
         
@@ -37,9 +50,15 @@ class ContextRecallEvaluator:
                 - 'llm': LLM-based claim decomposition
                 - 'non_llm': Non-LLM string similarity
                 - 'id_based': Direct ID comparison
+            claim_store: Shared claim decomposition store (default: process-wide store)
+            distance_measure: String distance used by 'non_llm'
+            threshold: Similarity at which 'non_llm' counts a reference context as retrieved
         """
         self.llm = llm
         self.metric_type = metric_type
+        self.claim_store = claim_store
+        self.distance_measure = distance_measure
+        self.threshold = threshold
     
     async def evaluate(self, sample):
         """
@@ -72,12 +91,15 @@ class ContextRecallEvaluator:
         Evaluate using LLM-based claim decomposition.
         
         Process:
-        1. Break reference into claims using LLM
+        1. Break reference into claims using LLM (shared via _extract_claims)
         2. For each claim, check if it can be inferred from retrieved contexts
         3. Calculate: supported claims / total claims
         """
-        # Implementation would use ragas.metrics.LLMContextRecall
-        pass
+        contexts = get_sample_field(sample, "retrieved_contexts") or []
+        supported, total = await self._supported_claims(
+            get_sample_field(sample, "reference") or "", "\n\n".join(contexts)
+        )
+        return supported / total if total else float("nan")
     
     async def _evaluate_non_llm(self, sample) -> float:
         """
@@ -88,8 +110,17 @@ class ContextRecallEvaluator:
         2. Count how many reference contexts are matched
         3. Calculate: # matched reference contexts / total reference contexts
         """
-        # Implementation would use ragas.metrics.NonLLMContextRecall
-        pass
+        # Imported here so importing the evaluator stays cheap
+        from ..natural_language_comparison.string_similarity import similarity_matrix
+
+        reference = get_sample_field(sample, "reference_contexts") or []
+        retrieved = get_sample_field(sample, "retrieved_contexts") or []
+        if not reference:
+            return float("nan")
+        if not retrieved:
+            return 0.0
+        matrix = similarity_matrix(reference, retrieved, self.distance_measure, score_cutoff=self.threshold)
+        return float((matrix.max(axis=1) >= self.threshold).mean())
     
     async def _evaluate_id_based(self, sample) -> float:
         """
@@ -99,19 +130,50 @@ class ContextRecallEvaluator:
         1. Compare retrieved_context_ids with reference_context_ids
         2. Calculate: # of reference IDs found in retrieved IDs / total reference IDs
         """
-        # Implementation would use ragas.metrics.IDBasedContextRecall
-        pass
+        result = self.evaluate_corpus([sample], cutoffs=())
+        return float(result["recall"][0])
+
+    def evaluate_corpus(self, samples: Iterable, cutoffs: Sequence[int] = (1, 5, 10)) -> Dict[str, "np.ndarray"]:
+        """
+        Ranking metrics of ID-based retrieval for a whole dataset.
+
+        Args:
+            samples: Samples with retrieved_context_ids and reference_context_ids
+            cutoffs: Ranks k to report "precision@k" and "recall@k" for
+
+        Returns:
+            Dict[str, np.ndarray]: Per-sample "precision", "recall",
+                "average_precision", "reciprocal_rank", "ndcg" and the cutoff
+                metrics (see ranking.ranking_metrics)
+        """
+        if self.metric_type != "id_based":
+            raise ValueError(f"evaluate_corpus needs metric_type='id_based', not {self.metric_type!r}")
+        # Imported here so importing the evaluator stays cheap
+        from .ranking import id_ranking_metrics
+
+        retrieved, reference = [], []
+        for sample in samples:
+            retrieved.append(get_sample_field(sample, "retrieved_context_ids") or [])
+            reference.append(get_sample_field(sample, "reference_context_ids") or [])
+        return id_ranking_metrics(retrieved, reference, cutoffs=cutoffs)
 
 
-def create_context_recall_evaluator(llm=None, metric_type: str = "llm"):
+def create_context_recall_evaluator(llm=None, metric_type: str = "llm", claim_store: Optional[ClaimStore] = None,
+                                    distance_measure: str = "levenshtein", threshold: float = 0.5):
     """
     Factory function to create a Context Recall evaluator.
     
     Args:
         llm: Language model instance
         metric_type: Type of evaluation metric to use
+        claim_store: Shared claim decomposition store
+        distance_measure: String distance for 'non_llm'
+        threshold: Match threshold for 'non_llm'
     
     Returns:
         ContextRecallEvaluator: Configured evaluator instance
     """
-    return ContextRecallEvaluator(llm=llm, metric_type=metric_type)
+    return ContextRecallEvaluator(
+        llm=llm, metric_type=metric_type, claim_store=claim_store,
+        distance_measure=distance_measure, threshold=threshold,
+    )
@@ -19,8 +19,11 @@ Process:
 
 from typing import Optional, Literal
 
+from ..base import get_sample_field
+from ..claims import ClaimBasedEvaluator, ClaimStore
 
-class FaithfulnessEvaluator:
+
+class FaithfulnessEvaluator(ClaimBasedEvaluator):
     """
     Faithfulness metric evaluator.
     
@@ -28,7 +31,11 @@ class FaithfulnessEvaluator:
     Higher scores indicate the response stays grounded in the provided information.
     """
     
-    def __init__(self, llm=None, method: Literal["standard", "hhem"] = "standard"):
+    metric_name = "faithfulness"
+    sample_fields = ("user_input", "response", "retrieved_contexts")
+    
+    def __init__(self, llm=None, method: Literal["standard", "hhem"] = "standard",
+                 claim_store: Optional[ClaimStore] = None):
         """
         Initialize Faithfulness Evaluator.
         
@@ -37,9 +44,11 @@ class FaithfulnessEvaluator:
             method: Evaluation method:
                 - 'standard': LLM-based claim checking
                 - 'hhem': HHEM-2.1-Open hallucination detector (free, open-source T5 model)
+            claim_store: Shared claim decomposition store (default: process-wide store)
         """
         self.llm = llm
         self.method = method
+        self.claim_store = claim_store
     
     async def evaluate(self, sample):
         """
@@ -65,12 +74,15 @@ class FaithfulnessEvaluator:
         Evaluate using standard LLM-based claim verification.
         
         Process:
-        1. Break response into individual claims
+        1. Break response into individual claims (shared via _extract_claims)
         2. For each claim, verify it against retrieved contexts using LLM
         3. Calculate: # verified claims / total claims
         """
-        # Implementation would use ragas.metrics.Faithfulness
-        pass
+        contexts = get_sample_field(sample, "retrieved_contexts") or []
+        supported, total = await self._supported_claims(
+            get_sample_field(sample, "response") or "", "\n\n".join(contexts)
+        )
+        return supported / total if total else float("nan")
     
     async def _evaluate_hhem(self, sample) -> float:
         """
@@ -83,15 +95,17 @@ class FaithfulnessEvaluator:
         pass
 
 
-def create_faithfulness_evaluator(llm=None, method: Literal["standard", "hhem"] = "standard"):
+def create_faithfulness_evaluator(llm=None, method: Literal["standard", "hhem"] = "standard",
+                                  claim_store: Optional[ClaimStore] = None):
     """
     Factory function to create a Faithfulness evaluator.
     
     Args:
         llm: Language model instance
         method: Evaluation method ('standard' or 'hhem')
+        claim_store: Shared claim decomposition store
     
     Returns:
         FaithfulnessEvaluator: Configured evaluator instance
     """
-    return FaithfulnessEvaluator(llm=llm, method=method)
+    return FaithfulnessEvaluator(llm=llm, method=method, claim_store=claim_store)
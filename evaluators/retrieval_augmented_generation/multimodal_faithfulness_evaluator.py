@@ -7,8 +7,10 @@ Measures how factually consistent a response is with multimodal contexts
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class MultimodalFaithfulnessEvaluator:
+
+class MultimodalFaithfulnessEvaluator(BaseEvaluator):
     """
     Multimodal Faithfulness metric evaluator.
     
@@ -16,6 +18,9 @@ class MultimodalFaithfulnessEvaluator:
     images, tables, and other non-text content.
     """
     
+    metric_name = "multimodal_faithfulness"
+    sample_fields = ("response", "retrieved_contexts")
+    
     def __init__(self, llm=None, vision_model=None):
         """
         Initialize Multimodal Faithfulness Evaluator.
@@ -7,8 +7,10 @@ Measures how relevant the response is when considering multimodal contexts
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class MultimodalRelevanceEvaluator:
+
+class MultimodalRelevanceEvaluator(BaseEvaluator):
     """
     Multimodal Relevance metric evaluator.
     
@@ -16,6 +18,9 @@ class MultimodalRelevanceEvaluator:
     information in the retrieved contexts.
     """
     
+    metric_name = "multimodal_relevance"
+    sample_fields = ("user_input", "response", "retrieved_contexts")
+    
     def __init__(self, llm=None, vision_model=None, embeddings=None):
         """
         Initialize Multimodal Relevance Evaluator.
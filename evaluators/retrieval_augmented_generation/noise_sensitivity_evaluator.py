@@ -15,8 +15,11 @@ Modes:
 
 from typing import Optional, Literal
 
+from ..base import get_sample_field
+from ..claims import ClaimBasedEvaluator, ClaimStore
 
-class NoiseSensitivityEvaluator:
+
+class NoiseSensitivityEvaluator(ClaimBasedEvaluator):
     """
     Noise Sensitivity metric evaluator.
     
@@ -24,7 +27,11 @@ class NoiseSensitivityEvaluator:
     retrieved contexts. Lower scores indicate better robustness to noise.
     """
     
-    def __init__(self, llm=None, mode: Literal["relevant", "irrelevant"] = "relevant"):
+    metric_name = "noise_sensitivity"
+    sample_fields = ("user_input", "response", "reference", "retrieved_contexts")
+    
+    def __init__(self, llm=None, mode: Literal["relevant", "irrelevant"] = "relevant",
+                 claim_store: Optional[ClaimStore] = None):
         """
         Initialize Noise Sensitivity Evaluator.
         
@@ -33,9 +40,11 @@ class NoiseSensitivityEvaluator:
             mode: Type of noise to evaluate:
                 - 'relevant': Noisy relevant contexts (mix of relevant and irrelevant)
                 - 'irrelevant': Clearly irrelevant contexts
+            claim_store: Shared claim decomposition store (default: process-wide store)
         """
         self.llm = llm
         self.mode = mode
+        self.claim_store = claim_store
     
     async def evaluate(self, sample):
         """
@@ -58,26 +67,30 @@ class NoiseSensitivityEvaluator:
         Evaluate noise sensitivity.
         
         Process:
-        1. Identify claims in the response
+        1. Identify claims in the response (shared via _extract_claims)
         2. Identify claims that are NOT supported by ground truth
         3. Calculate: # incorrect claims / total claims
         
         The score indicates how many claims in the response are incorrect,
         potentially due to noise in the retrieved contexts.
         """
-        # Implementation would use ragas.metrics.NoiseSensitivity
-        pass
+        supported, total = await self._supported_claims(
+            get_sample_field(sample, "response") or "", get_sample_field(sample, "reference") or ""
+        )
+        return (total - supported) / total if total else float("nan")
 
 
-def create_noise_sensitivity_evaluator(llm=None, mode: Literal["relevant", "irrelevant"] = "relevant"):
+def create_noise_sensitivity_evaluator(llm=None, mode: Literal["relevant", "irrelevant"] = "relevant",
+                                       claim_store: Optional[ClaimStore] = None):
     """
     Factory function to create a Noise Sensitivity evaluator.
     
     Args:
         llm: Language model instance
         mode: Type of noise to evaluate ('relevant' or 'irrelevant')
+        claim_store: Shared claim decomposition store
     
     Returns:
         NoiseSensitivityEvaluator: Configured evaluator instance
     """
-    return NoiseSensitivityEvaluator(llm=llm, mode=mode)
+    return NoiseSensitivityEvaluator(llm=llm, mode=mode, claim_store=claim_store)
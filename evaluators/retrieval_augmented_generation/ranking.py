@@ -0,0 +1,279 @@
+"""
+Batch Ranking Metrics
+
+Ranking metrics for a whole retrieval run as NumPy array operations, for
+ID-based context precision and recall:
+
+1. Retrieved and reference ID lists are interned into one integer space and
+   laid out as ragged (CSR) arrays: flat ids plus row offsets
+2. A (row, id) key per position turns "is this retrieved ID relevant?" into
+   one sorted search over the dataset
+3. Cumulative sums of the relevance flags give hits@k, and so precision@k
+   for every k at once; the other metrics are per-row sums (``bincount``)
+
+``ranking_curves`` returns precision@k, recall@k and AP@k for every cutoff
+from relevance flags of any origin (IDs, string similarity, LLM verdicts).
+
+Metrics per query:
+- precision: relevant retrieved IDs / distinct retrieved IDs
+- recall: relevant retrieved IDs / distinct reference IDs
+- average_precision: ∑ precision@k × v_k / relevant items in the ranking
+  (the Context Precision formula)
+- reciprocal_rank: 1 / rank of the first relevant ID
+- ndcg: Binary-relevance nDCG over the retrieved list
+
+IDs are compared as strings, as in ragas (1 and "1" are the same ID), and
+a retrieved ID repeated later in the ranking only counts the first time.
+Rows are processed in chunks, so 1M queries × top-100 fits in memory.
+"""
+
+from itertools import chain, count
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _offsets(id_lists: Sequence[Sequence]) -> np.ndarray:
+    offsets = np.zeros(len(id_lists) + 1, dtype=np.int64)
+    np.cumsum([len(id_list) for id_list in id_lists], out=offsets[1:])
+    return offsets
+
+
+def encode_id_lists(
+    retrieved: Sequence[Optional[Sequence]],
+    reference: Sequence[Optional[Sequence]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Intern retrieved and reference ID lists into one integer space.
+
+    Integer IDs are used as they are (or densified with NumPy when too large
+    for the row keys); any other IDs are compared by their string form.
+
+    Args:
+        retrieved: Retrieved ID lists (None counts as empty)
+        reference: Reference ID lists (None counts as empty)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Retrieved ids
+            and offsets, reference ids and offsets
+    """
+    retrieved = [ids if ids is not None else () for ids in retrieved]
+    reference = [ids if ids is not None else () for ids in reference]
+    retrieved_offsets, reference_offsets = _offsets(retrieved), _offsets(reference)
+    values = list(chain.from_iterable(retrieved))
+    values.extend(chain.from_iterable(reference))
+
+    if set(map(type, values)) <= {int}:
+        dense = np.array(values, dtype=np.int64)
+        # Small non-negative IDs already work as (row, id) key components
+        rows = max(len(retrieved), len(reference), 1)
+        if len(dense) and (dense.min() < 0 or int(dense.max()) >= (1 << 62) // rows):
+            _, dense = np.unique(dense, return_inverse=True)
+    else:
+        if not set(map(type, values)) <= {str}:
+            values = list(map(str, values))
+        table: Dict[str, int] = dict(zip(dict.fromkeys(values), count()))
+        dense = np.fromiter(map(table.__getitem__, values), dtype=np.int64, count=len(values))
+    split = int(retrieved_offsets[-1])
+    return dense[:split], retrieved_offsets, dense[split:], reference_offsets
+
+
+def _starts(ordered: np.ndarray) -> np.ndarray:
+    """Mask of the first element of each run of equal values in a sorted array."""
+    mask = np.ones(len(ordered), dtype=bool)
+    mask[1:] = ordered[1:] != ordered[:-1]
+    return mask
+
+
+def _row_index(offsets: np.ndarray) -> np.ndarray:
+    return np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+
+
+def id_relevance(
+    retrieved_ids: np.ndarray,
+    retrieved_offsets: np.ndarray,
+    reference_ids: np.ndarray,
+    reference_offsets: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Relevance flag of every retrieved position.
+
+    Args:
+        retrieved_ids, retrieved_offsets: Ragged retrieved ids
+        reference_ids, reference_offsets: Ragged reference ids (same number of rows)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Boolean relevance per
+            retrieved position (first occurrences only), and distinct
+            retrieved and distinct reference IDs per row
+    """
+    rows = len(retrieved_offsets) - 1
+    width = int(max(retrieved_ids.max(initial=-1), reference_ids.max(initial=-1))) + 1
+    retrieved_keys = _row_index(retrieved_offsets) * width + retrieved_ids
+    reference_keys = np.sort(_row_index(reference_offsets) * width + reference_ids)
+    reference_keys = reference_keys[_starts(reference_keys)]
+
+    # Sort-based rather than np.unique / np.isin defaults, which hash and
+    # are several times slower on large integer arrays
+    order = np.argsort(retrieved_keys, kind="stable")
+    ordered = retrieved_keys[order]
+    first_occurrence = np.zeros(len(retrieved_keys), dtype=bool)
+    first_occurrence[order[_starts(ordered)]] = True
+    relevant = np.zeros(len(retrieved_keys), dtype=bool)
+    if len(reference_keys):
+        found = np.minimum(np.searchsorted(reference_keys, ordered), len(reference_keys) - 1)
+        relevant[order] = reference_keys[found] == ordered
+
+    retrieved_counts = np.bincount(_row_index(retrieved_offsets)[first_occurrence], minlength=rows)
+    reference_counts = np.bincount(reference_keys // max(width, 1), minlength=rows)
+    return relevant & first_occurrence, retrieved_counts, reference_counts
+
+
+def ranking_metrics(
+    relevance: np.ndarray,
+    offsets: np.ndarray,
+    reference_counts: np.ndarray,
+    cutoffs: Sequence[int] = (),
+    retrieved_counts: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Ranking metrics from per-position relevance flags.
+
+    Args:
+        relevance: Boolean relevance per ranked position (ragged, CSR)
+        offsets: Row offsets into ``relevance``
+        reference_counts: Relevant items per row (recall and nDCG denominators)
+        cutoffs: Ranks k to also report "precision@k" and "recall@k" for
+        retrieved_counts: Precision denominators (default: the ranking lengths)
+
+    Returns:
+        Dict[str, np.ndarray]: Per-row "precision", "recall",
+            "average_precision", "reciprocal_rank", "ndcg" and one
+            "precision@k" / "recall@k" pair per cutoff (recall is NaN for
+            rows without relevant items)
+    """
+    relevance = np.asarray(relevance, dtype=bool)
+    rows = len(offsets) - 1
+    lengths = np.diff(offsets)
+    row_of = _row_index(offsets)
+    rank = np.arange(len(relevance), dtype=np.int64) - offsets[row_of] + 1
+
+    # running[i]: relevant positions before flat position i
+    running = np.concatenate(([0], np.cumsum(relevance, dtype=np.int64)))
+    before_row = running[offsets[:-1]]
+    hits_at = running[1:] - before_row[row_of]
+    hits = np.bincount(row_of, weights=relevance, minlength=rows)
+
+    reference_counts = np.asarray(reference_counts, dtype=np.float64)
+    retrieved_counts = lengths if retrieved_counts is None else retrieved_counts
+
+    def ratio(numerator, denominator, empty=0.0):
+        numerator = np.asarray(numerator, dtype=np.float64)
+        out = np.full(rows, empty)
+        return np.divide(numerator, denominator, out=out, where=np.asarray(denominator) > 0)
+
+    precision_at = hits_at / rank
+    average_precision = ratio(np.bincount(row_of, weights=precision_at * relevance, minlength=rows), hits)
+
+    reciprocal_rank = np.zeros(rows)
+    relevant_rows = row_of[relevance]
+    first = _starts(relevant_rows)
+    reciprocal_rank[relevant_rows[first]] = 1.0 / rank[relevance][first]
+
+    max_length = int(lengths.max(initial=0))
+    ideal = np.concatenate(([0.0], np.cumsum(1.0 / np.log2(np.arange(2, max_length + 2)))))
+    dcg = np.bincount(row_of, weights=relevance / np.log2(rank + 1), minlength=rows)
+    ideal_dcg = ideal[np.minimum(reference_counts, lengths).astype(np.int64)]
+
+    result = {
+        "precision": ratio(hits, retrieved_counts),
+        "recall": ratio(hits, reference_counts, empty=np.nan),
+        "average_precision": average_precision,
+        "reciprocal_rank": reciprocal_rank,
+        "ndcg": ratio(dcg, ideal_dcg),
+    }
+    for k in cutoffs:
+        if k < 1:
+            raise ValueError(f"Cutoffs must be positive ranks, got {k}")
+        hits_k = running[offsets[:-1] + np.minimum(lengths, k)] - before_row
+        result[f"precision@{k}"] = hits_k / k
+        result[f"recall@{k}"] = ratio(hits_k, reference_counts, empty=np.nan)
+    return result
+
+
+def ranking_curves(
+    relevance: np.ndarray,
+    offsets: np.ndarray,
+    relevant_totals: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Precision, recall and average precision at every cutoff of every ranking.
+
+    Each output is ragged like ``relevance``: position i of a row holds the
+    metric at k = i + 1. AP@k is the Context Precision formula applied to
+    the top k (∑ precision@j × v_j over j ≤ k, divided by the relevant items
+    in the top k).
+
+    Args:
+        relevance: Boolean relevance per ranked position (ragged, CSR)
+        offsets: Row offsets into ``relevance``
+        relevant_totals: Relevant items per row, the recall denominators
+            (default: the relevant items in the whole ranking)
+
+    Returns:
+        Dict[str, np.ndarray]: Flat "precision@k", "recall@k" and "ap@k"
+            arrays aligned with ``relevance``
+    """
+    relevance = np.asarray(relevance, dtype=bool)
+    row_of = _row_index(offsets)
+    rank = np.arange(len(relevance), dtype=np.int64) - offsets[row_of] + 1
+
+    running = np.concatenate(([0], np.cumsum(relevance, dtype=np.int64)))
+    hits_at = running[1:] - running[offsets[:-1]][row_of]
+    precision_at = hits_at / rank
+    weighted = np.concatenate(([0.0], np.cumsum(precision_at * relevance)))
+    ap_numerator = weighted[1:] - weighted[offsets[:-1]][row_of]
+
+    if relevant_totals is None:
+        relevant_totals = running[offsets[1:]] - running[offsets[:-1]]
+    totals = np.asarray(relevant_totals, dtype=np.float64)[row_of]
+    return {
+        "precision@k": precision_at,
+        "recall@k": np.divide(hits_at, totals, out=np.zeros(len(relevance)), where=totals > 0),
+        "ap@k": np.divide(ap_numerator, hits_at, out=np.zeros(len(relevance)), where=hits_at > 0),
+    }
+
+
+def id_ranking_metrics(
+    retrieved: Sequence[Optional[Sequence]],
+    reference: Sequence[Optional[Sequence]],
+    cutoffs: Sequence[int] = (),
+    chunk_size: int = 100_000,
+) -> Dict[str, np.ndarray]:
+    """
+    ID-based ranking metrics for a dataset.
+
+    Args:
+        retrieved: Retrieved context IDs per query, in rank order
+        reference: Reference (relevant) context IDs per query
+        cutoffs: Ranks k to also report "precision@k" and "recall@k" for
+        chunk_size: Queries processed per batch
+
+    Returns:
+        Dict[str, np.ndarray]: Per-query metrics (see ``ranking_metrics``)
+    """
+    if len(retrieved) != len(reference):
+        raise ValueError(f"Got {len(retrieved)} retrieved lists but {len(reference)} reference lists")
+    parts: Dict[str, List[np.ndarray]] = {}
+    for start in range(0, max(len(retrieved), 1), chunk_size):
+        retrieved_ids, retrieved_offsets, reference_ids, reference_offsets = encode_id_lists(
+            retrieved[start:start + chunk_size], reference[start:start + chunk_size]
+        )
+        relevance, retrieved_counts, reference_counts = id_relevance(
+            retrieved_ids, retrieved_offsets, reference_ids, reference_offsets
+        )
+
+        chunk = ranking_metrics(relevance, retrieved_offsets, reference_counts, cutoffs, retrieved_counts)
+        for name, values in chunk.items():
+            parts.setdefault(name, []).append(values)
+    return {name: np.concatenate(values) for name, values in parts.items()}
@@ -20,8 +20,10 @@ Process:
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class ResponseRelevancyEvaluator:
+
+class ResponseRelevancyEvaluator(BaseEvaluator):
     """
     Response Relevancy metric evaluator.
     
@@ -30,6 +32,9 @@ class ResponseRelevancyEvaluator:
     the original user input.
     """
     
+    metric_name = "response_relevancy"
+    sample_fields = ("user_input", "response", "retrieved_contexts")
+    
     def __init__(self, llm=None, embeddings=None, num_questions: int = 3):
         """
         Initialize Response Relevancy Evaluator.
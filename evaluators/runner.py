@@ -0,0 +1,245 @@
+"""
+Evaluation Runner
+
+Runs several evaluators over the same dataset on a single event loop.
+
+Every (sample x evaluator) pair is an independent job. Jobs from different
+evaluators overlap, so LLM-bound metrics waiting on the network do not hold
+up CPU-bound metrics and vice versa.
+
+Concurrency limits:
+- max_concurrency: Jobs in flight across all evaluators
+- per_evaluator_concurrency: Jobs in flight for a single evaluator, either
+  one limit for all evaluators or a mapping of metric name to limit
+
+Each evaluator gets a pool of workers sized to its own limit, and every job
+additionally holds a slot of the global limit. Only as many coroutines as the
+limits allow exist at any time, independent of the dataset size.
+
+With ``cpu_execution`` set, evaluators flagged ``cpu_bound`` are sent to a
+process or thread pool in chunks (see evaluators.parallel) so they use all
+cores and never block the event loop. Each chunk in flight holds one global
+slot, and at most one chunk per pool worker is in flight per evaluator.
+"""
+
+import asyncio
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from .base import BaseEvaluator, EvaluationResult
+from .parallel import DEFAULT_CHUNK_SIZE, CPUExecutor, ExecutionMode
+
+
+ResultCallback = Callable[[int, str, EvaluationResult], None]
+SkipPredicate = Callable[[int, str], bool]
+
+
+class EvaluationRunner:
+    """
+    Multi-evaluator runner with global and per-evaluator concurrency limits.
+
+    Results are keyed by each evaluator's ``metric_name``. Pass a mapping of
+    name to evaluator to run several instances of the same evaluator class
+    (e.g. two aspect critics) side by side.
+    """
+
+    def __init__(
+        self,
+        evaluators: Union[Iterable[BaseEvaluator], Mapping[str, BaseEvaluator]],
+        max_concurrency: int = 64,
+        per_evaluator_concurrency: Union[int, Mapping[str, int], None] = None,
+        cpu_execution: Optional[ExecutionMode] = None,
+        cpu_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize Evaluation Runner.
+
+        Args:
+            evaluators: Evaluator instances, or a mapping of result name to instance
+            max_concurrency: Maximum jobs in flight across all evaluators
+            per_evaluator_concurrency: Maximum jobs in flight per evaluator.
+                An int applies to every evaluator; a mapping sets limits by
+                name, and evaluators missing from it are limited by
+                max_concurrency only.
+                Default: no per-evaluator limit beyond max_concurrency
+            cpu_execution: Pool used for ``cpu_bound`` evaluators:
+                'process', 'thread', 'auto', or None to run them on the event loop
+            cpu_workers: Pool size (default: number of CPUs)
+            chunk_size: Samples per pool task for ``cpu_bound`` evaluators
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        self.evaluators = self._name_evaluators(evaluators)
+        self.max_concurrency = max_concurrency
+        self.per_evaluator_concurrency = per_evaluator_concurrency
+        self.cpu_execution = cpu_execution
+        self.cpu_workers = cpu_workers
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _name_evaluators(evaluators) -> Dict[str, BaseEvaluator]:
+        """Build the name -> evaluator mapping, rejecting ambiguous names."""
+        if isinstance(evaluators, Mapping):
+            return dict(evaluators)
+
+        named: Dict[str, BaseEvaluator] = {}
+        for evaluator in evaluators:
+            name = getattr(evaluator, "metric_name", "") or type(evaluator).__name__
+            if name in named:
+                raise ValueError(
+                    f"Duplicate evaluator name '{name}'; pass a dict of "
+                    f"name -> evaluator to run several instances"
+                )
+            named[name] = evaluator
+        return named
+
+    @staticmethod
+    def _unskipped(pending, name: str, skip: SkipPredicate):
+        """Filter an evaluator's (index, sample) stream through the skip predicate."""
+        for index, sample in pending:
+            if not skip(index, name):
+                yield index, sample
+
+    def _limit_for(self, name: str) -> int:
+        """Resolve the concurrency limit for one evaluator."""
+        limit = self.per_evaluator_concurrency
+        if limit is None:
+            return self.max_concurrency
+        if isinstance(limit, Mapping):
+            limit = limit.get(name, self.max_concurrency)
+        if limit < 1:
+            raise ValueError(f"Concurrency limit for '{name}' must be >= 1, got {limit}")
+        return min(limit, self.max_concurrency)
+
+    async def arun(
+        self,
+        dataset: Iterable,
+        on_result: Optional[ResultCallback] = None,
+        skip: Optional[SkipPredicate] = None,
+    ) -> List[Dict[str, EvaluationResult]]:
+        """
+        Evaluate every sample with every evaluator.
+
+        Args:
+            dataset: Iterable of samples (materialized once)
+            on_result: Optional callback ``(sample_index, name, result)``
+                invoked as each job completes
+            skip: Optional predicate ``(sample_index, name)``; jobs for which
+                it returns True are not run and have no result
+
+        Returns:
+            List[Dict[str, EvaluationResult]]: Per sample (in input order),
+                a mapping of evaluator name to its result
+        """
+        samples = list(dataset)
+        results: List[Dict[str, EvaluationResult]] = [{} for _ in samples]
+        global_slots = asyncio.Semaphore(self.max_concurrency)
+
+        def record(name: str, result: EvaluationResult):
+            results[result.index][name] = result
+            if on_result is not None:
+                on_result(result.index, name, result)
+
+        async def worker(name: str, evaluator: BaseEvaluator, pending):
+            for index, sample in pending:
+                async with global_slots:
+                    try:
+                        score = await evaluator.evaluate(sample)
+                    except Exception as e:
+                        result = EvaluationResult(index, error=e)
+                    else:
+                        result = EvaluationResult(index, score=score)
+                record(name, result)
+
+        async def chunk_worker(name: str, executor: CPUExecutor, pending):
+            while True:
+                chunk = list(islice(pending, self.chunk_size))
+                if not chunk:
+                    return
+                async with global_slots:
+                    chunk_results = await executor.ascore_chunk(name, chunk)
+                for result in chunk_results:
+                    record(name, result)
+
+        pooled = {}
+        if self.cpu_execution is not None:
+            pooled = {
+                name: evaluator
+                for name, evaluator in self.evaluators.items()
+                if getattr(evaluator, "cpu_bound", False)
+            }
+        executor = None
+        if pooled:
+            executor = CPUExecutor(pooled, mode=self.cpu_execution, max_workers=self.cpu_workers)
+
+        workers = []
+        for name, evaluator in self.evaluators.items():
+            # Workers of one evaluator share one iterator over the samples
+            pending = enumerate(samples)
+            if skip is not None:
+                pending = self._unskipped(pending, name, skip)
+            if name in pooled:
+                count = min(self._limit_for(name), executor.max_workers)
+                workers.extend(chunk_worker(name, executor, pending) for _ in range(count))
+            else:
+                count = self._limit_for(name)
+                workers.extend(worker(name, evaluator, pending) for _ in range(count))
+
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return results
+
+    def run(
+        self,
+        dataset: Iterable,
+        on_result: Optional[ResultCallback] = None,
+        skip: Optional[SkipPredicate] = None,
+    ) -> List[Dict[str, EvaluationResult]]:
+        """
+        Evaluate every sample with every evaluator from synchronous code.
+
+        Must not be called from inside a running event loop (use ``arun``).
+
+        Args:
+            dataset: Iterable of samples
+            on_result: Optional per-job completion callback
+            skip: Optional predicate ``(sample_index, name)`` selecting jobs not to run
+
+        Returns:
+            List[Dict[str, EvaluationResult]]: Per-sample results keyed by evaluator name
+        """
+        return asyncio.run(self.arun(dataset, on_result=on_result, skip=skip))
+
+
+def run_evaluators(
+    evaluators: Union[Iterable[BaseEvaluator], Mapping[str, BaseEvaluator]],
+    dataset: Iterable,
+    max_concurrency: int = 64,
+    per_evaluator_concurrency: Union[int, Mapping[str, int], None] = None,
+    cpu_execution: Optional[ExecutionMode] = None,
+) -> List[Dict[str, EvaluationResult]]:
+    """
+    Convenience function to run several evaluators over a dataset.
+
+    Args:
+        evaluators: Evaluator instances, or a mapping of result name to instance
+        dataset: Iterable of samples
+        max_concurrency: Maximum jobs in flight across all evaluators
+        per_evaluator_concurrency: Maximum jobs in flight per evaluator
+        cpu_execution: Pool used for ``cpu_bound`` evaluators (None: event loop)
+
+    Returns:
+        List[Dict[str, EvaluationResult]]: Per-sample results keyed by evaluator name
+    """
+    runner = EvaluationRunner(
+        evaluators,
+        max_concurrency=max_concurrency,
+        per_evaluator_concurrency=per_evaluator_concurrency,
+        cpu_execution=cpu_execution,
+    )
+    return runner.run(dataset)
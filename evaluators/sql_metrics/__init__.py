@@ -6,10 +6,14 @@ Metrics for evaluating SQL query quality:
 - SQL Query Equivalence: Semantic equivalence without execution
 """
 
-from .datacompy_score_evaluator import create_datacompy_score_evaluator
-from .sql_query_equivalence_evaluator import create_sql_query_equivalence_evaluator
+from ..registry import lazy_exports
 
-__all__ = [
-    "create_datacompy_score_evaluator",
-    "create_sql_query_equivalence_evaluator",
-]
+# Factory name -> module defining it, imported on first access
+_EXPORTS = {
+    "create_datacompy_score_evaluator": ".datacompy_score_evaluator",
+    "create_sql_query_equivalence_evaluator": ".sql_query_equivalence_evaluator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -9,8 +9,10 @@ This is an execution-based metric that runs the queries and compares outputs.
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class DataCompyScoreEvaluator:
+
+class DataCompyScoreEvaluator(BaseEvaluator):
     """
     DataCompy Score metric evaluator for SQL.
     
@@ -18,6 +20,10 @@ class DataCompyScoreEvaluator:
     for comprehensive data frame comparison.
     """
     
+    metric_name = "datacompy_score"
+    sample_fields = ("response", "reference")
+    cpu_bound = True
+    
     def __init__(self):
         """
         Initialize DataCompy Score Evaluator.
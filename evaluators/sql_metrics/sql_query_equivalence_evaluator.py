@@ -7,8 +7,10 @@ This is a non-execution metric that analyzes query structure and logic.
 
 from typing import Optional
 
+from ..base import BaseEvaluator
 
-class SQLQueryEquivalenceEvaluator:
+
+class SQLQueryEquivalenceEvaluator(BaseEvaluator):
     """
     SQL Query Equivalence metric evaluator.
     
@@ -16,6 +18,9 @@ class SQLQueryEquivalenceEvaluator:
     using non-execution methods (parsing, normalization, comparison).
     """
     
+    metric_name = "sql_query_equivalence"
+    sample_fields = ("response", "reference", "reference_contexts")
+    
     def __init__(self, llm=None):
         """
         Initialize SQL Query Equivalence Evaluator.
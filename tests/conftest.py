@@ -15,6 +15,28 @@ from langchain_core.documents import Document
 load_dotenv()
 
 
+def pytest_configure(config):
+    """Point the Azure OpenAI settings at a local fake endpoint when EVAL_FAKE_BACKEND=1."""
+    if os.getenv("EVAL_FAKE_BACKEND") != "1":
+        return
+    from evaluators.fake_backend import FakeAzureOpenAIServer, FakeBackend, use_offline_tokenizer
+
+    config.add_cleanup(use_offline_tokenizer())
+    server = FakeAzureOpenAIServer(FakeBackend(
+        latency=float(os.getenv("EVAL_FAKE_LATENCY", "0")),
+        error_rate=float(os.getenv("EVAL_FAKE_ERROR_RATE", "0")),
+    )).start()
+    config.add_cleanup(server.stop)
+    os.environ.update({
+        "AZURE_OPENAI_ENDPOINT": server.endpoint,
+        "AZURE_OPENAI_API_KEY": "fake",
+        "AZURE_OPENAI_API_VERSION": os.getenv("AZURE_OPENAI_API_VERSION") or "2024-12-01-preview",
+        "AZURE_OPENAI_DEPLOYMENT_NAME": "gpt-4o",
+        "AZURE_OPENAI_EMBEDDING_MODEL": "text-embedding-3-small",
+    })
+    print(f"\n🧪 Using fake Azure OpenAI endpoint at {server.endpoint}")
+
+
 @pytest.fixture(scope="session")
 def ragas_dataset():
     """Generate synthetic test data using Ragas TestsetGenerator with Azure OpenAI."""
@@ -57,7 +79,10 @@ code. Python is used by many large organizations including Google, NASA, and CER
                 api_key=os.getenv("AZURE_OPENAI_API_KEY"),
                 api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
                 azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-                model=os.getenv("AZURE_OPENAI_EMBEDDING_MODEL")
+                model=os.getenv("AZURE_OPENAI_EMBEDDING_MODEL"),
+                # Token-length checks download a tiktoken encoding; the fake
+                # backend has to work offline
+                check_embedding_ctx_length=os.getenv("EVAL_FAKE_BACKEND") != "1",
             )
         )
         
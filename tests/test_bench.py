@@ -0,0 +1,63 @@
+"""
+Test Bench - Evaluator Throughput Benchmarks
+"""
+
+import json
+import sys
+
+import allure
+
+from evaluators import registry
+from evaluators.bench import _peak_rss_mb, main, run_benchmarks, synthetic_samples
+
+
+@allure.feature("Core")
+@allure.story("Benchmarks")
+def test_synthetic_samples_are_deterministic():
+    """The same seed produces the same dataset, with fields for every category."""
+    samples = synthetic_samples(50, seed=3)
+    assert samples == synthetic_samples(50, seed=3)
+    assert samples != synthetic_samples(50, seed=4)
+    for field in ("user_input", "response", "reference", "retrieved_contexts",
+                  "retrieved_context_ids", "reference_context_ids", "reference_tool_calls"):
+        assert all(sample[field] for sample in samples)
+    print("✅ Test passed: Deterministic synthetic samples")
+
+
+@allure.feature("Core")
+@allure.story("Benchmarks")
+def test_every_registered_evaluator_is_benchmarked():
+    """Each registry entry gets a record with throughput, latency and call counts."""
+    report = run_benchmarks(sizes=[20], concurrency=4, isolate=False)
+
+    assert [r["evaluator"] for r in report["results"]] == registry.available()
+    for record in report["results"]:
+        assert record["samples"] == 20
+        assert record["samples_per_sec"] > 0
+        assert record["latency_ms"]["p50"] <= record["latency_ms"]["p99"]
+        assert record["peak_rss_mb"] > 0
+        assert record["llm_calls_per_sample"] >= 0
+    json.dumps(report)
+    print("✅ Test passed: All evaluators benchmarked")
+
+
+@allure.feature("Core")
+@allure.story("Benchmarks")
+def test_peak_rss_without_resource_module(monkeypatch):
+    """Platforms without the resource module report no peak RSS instead of failing to import."""
+    monkeypatch.setitem(sys.modules, "resource", None)
+    assert _peak_rss_mb() is None
+    print("✅ Test passed: Peak RSS fallback")
+
+
+@allure.feature("Core")
+@allure.story("Benchmarks")
+def test_cli_writes_json_report_from_isolated_case(tmp_path):
+    """The command line entry point runs cases in fresh processes and writes JSON."""
+    output = tmp_path / "bench.json"
+    main(["--evaluators", "exact_match", "--sizes", "10", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert report["config"]["isolate"] is True
+    assert [(r["evaluator"], r["samples"]) for r in report["results"]] == [("exact_match", 10)]
+    print("✅ Test passed: CLI JSON report")
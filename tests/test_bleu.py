@@ -0,0 +1,67 @@
+"""
+Test BLEU - Batch Sentence and Corpus BLEU Engine
+"""
+
+import math
+
+import pytest
+import allure
+
+from evaluators.bench import synthetic_samples
+from evaluators.natural_language_comparison.bleu import BLEUAccumulator, corpus_bleu, sentence_bleu
+from evaluators.natural_language_comparison.bleu_score_evaluator import create_bleu_score_evaluator
+
+
+@allure.feature("Core")
+@allure.story("BLEU")
+def test_sentence_bleu_matches_hand_computed_values():
+    """Clipped precisions, brevity penalty and zero-match orders follow the BLEU definition."""
+    hypotheses = ["the the the cat", "the cat sat on the mat", "", "a b"]
+    references = ["the cat is here", "the cat sat on the mat today", "anything", "c d"]
+    scores = sentence_bleu(hypotheses, references, weights=(0.5, 0.5))
+
+    # Unigrams: "the" clipped to 1 + "cat" = 2/4; bigrams: "the cat" = 1/3
+    assert scores[0] == pytest.approx(math.sqrt(2 / 4 * 1 / 3))
+    # Perfect precision, brevity penalty exp(1 - 7/6)
+    assert scores[1] == pytest.approx(math.exp(1 - 7 / 6))
+    assert scores[2] == 0.0 and scores[3] == 0.0
+    print("✅ Test passed: Sentence BLEU")
+
+
+@allure.feature("Core")
+@allure.story("BLEU")
+def test_streaming_corpus_bleu_accumulates_counts():
+    """Chunked accumulation equals one batch, and differs from the mean of sentence scores."""
+    samples = synthetic_samples(300, seed=1)
+    hypotheses = [s["response"] for s in samples]
+    references = [s["reference"] for s in samples]
+
+    accumulator = BLEUAccumulator()
+    sentence_scores = accumulator.add(hypotheses, references)
+    streamed = corpus_bleu(iter(hypotheses), iter(references), chunk_size=7)
+
+    assert streamed == pytest.approx(accumulator.score)
+    assert accumulator.score != pytest.approx(sentence_scores.mean())
+    with pytest.raises(ValueError, match="300 hypotheses but 299 references"):
+        corpus_bleu(iter(hypotheses), iter(references[:-1]), chunk_size=7)
+    with pytest.raises(ValueError, match="2 hypotheses but 3 references"):
+        corpus_bleu(hypotheses[:2], references[:3])
+    print("✅ Test passed: Streaming corpus BLEU")
+
+
+@allure.feature("Core")
+@allure.story("BLEU")
+@pytest.mark.asyncio
+async def test_evaluator_uses_batch_engine():
+    """Per-sample scores and evaluate_corpus agree with the engine for the configured weights."""
+    evaluator = create_bleu_score_evaluator(weights=(1.0,))
+    samples = synthetic_samples(20, seed=2)
+
+    single = [await evaluator.evaluate(s) for s in samples]
+    batch, corpus = evaluator.evaluate_corpus(samples, chunk_size=6)
+
+    assert batch.tolist() == pytest.approx(single)
+    assert corpus == pytest.approx(corpus_bleu(
+        [s["response"] for s in samples], [s["reference"] for s in samples], weights=(1.0,)
+    ))
+    print("✅ Test passed: BLEU evaluator")
@@ -0,0 +1,132 @@
+"""
+Test Chunk Verdicts - Per-(Question, Chunk) Verdict Cache
+"""
+
+import asyncio
+
+import pytest
+import allure
+
+from evaluators.cache import DiskCache
+from evaluators.retrieval_augmented_generation.chunk_verdicts import ChunkVerdictStore
+from evaluators.retrieval_augmented_generation.context_precision_evaluator import ContextPrecisionEvaluator
+
+
+class CountingContextPrecision(ContextPrecisionEvaluator):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.judged = []
+
+    async def _judge_chunk(self, question, answer, chunk, use_reference):
+        self.judged.append(chunk)
+        await asyncio.sleep(0)
+        return "paris" in chunk.lower()
+
+
+class VerdictLLM:
+    """Chat model stand-in answering the verification prompt for chunks about Paris."""
+
+    model_name = "gpt-4o"
+
+    def __init__(self):
+        self.prompts = []
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        context = prompt.split("context: ", 1)[1].split("\n", 1)[0]
+        if context == "garbled":
+            return "I cannot decide."
+        return '```json\n{"reason": "...", "verdict": %d}\n```' % ("paris" in context.lower())
+
+
+def _sample(chunks):
+    return {"user_input": "Capital of France?", "reference": "Paris", "response": "It is Paris",
+            "retrieved_contexts": chunks}
+
+
+@allure.feature("Core")
+@allure.story("Chunk Verdicts")
+@pytest.mark.asyncio
+async def test_only_unseen_chunks_reach_the_judge():
+    """A second retriever sharing most chunks only pays for the new ones."""
+    store = ChunkVerdictStore()
+    evaluator = CountingContextPrecision(metric_type="llm_with_reference", verdict_store=store)
+
+    first = await evaluator.evaluate(_sample(["Paris is the capital", "Lyon", "Nice", "Paris, France", "Lille"]))
+    assert len(evaluator.judged) == 5 and store.hit_rate == 0.0
+
+    evaluator.judged.clear()
+    second = await evaluator.evaluate(_sample(["Paris is the capital", "Lyon", "Nice", "Paris, France", "Brest"]))
+    assert evaluator.judged == ["Brest"]
+    assert store.stats()["hits"] == 4 and store.hit_rate == pytest.approx(0.4)
+    assert first == second
+
+    # Judging against the response is a different prompt, so it is not reused
+    evaluator.metric_type = "llm_without_reference"
+    evaluator.judged.clear()
+    await evaluator.evaluate(_sample(["Lyon"]))
+    assert evaluator.judged == ["Lyon"]
+    print("✅ Test passed: Verdict reuse")
+
+
+@allure.feature("Core")
+@allure.story("Chunk Verdicts")
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_calls_and_disk_cache_persists(tmp_path):
+    """Duplicate chunks in flight are judged once; verdicts survive in the DiskCache."""
+    cache = DiskCache(str(tmp_path / "verdicts.sqlite"))
+    evaluator = CountingContextPrecision(metric_type="llm_with_reference", verdict_store=ChunkVerdictStore(cache))
+    sample = _sample(["Paris", "Rome", "Paris"])
+    await asyncio.gather(evaluator.evaluate(sample), evaluator.evaluate(sample))
+    assert sorted(evaluator.judged) == ["Paris", "Rome"]
+
+    restarted = CountingContextPrecision(metric_type="llm_with_reference", verdict_store=ChunkVerdictStore(cache))
+    assert await restarted.evaluate(sample) == pytest.approx((1 + 2 / 3) / 2)
+    assert restarted.judged == [] and restarted.verdict_store.hit_rate == 1.0
+
+    stub = ContextPrecisionEvaluator(metric_type="llm_with_reference", verdict_store=ChunkVerdictStore())
+    assert await stub.evaluate(_sample(["Paris"])) is None
+    assert stub.verdict_store.stats()["memory_entries"] == 0
+    print("✅ Test passed: Concurrent and persistent verdicts")
+
+
+@allure.feature("Core")
+@allure.story("Chunk Verdicts")
+@pytest.mark.asyncio
+async def test_llm_judge_prompts_once_per_chunk():
+    """The verification prompt goes through the store; replies without a verdict are not cached."""
+    llm = VerdictLLM()
+    store = ChunkVerdictStore()
+    evaluator = ContextPrecisionEvaluator(llm=llm, metric_type="llm_with_reference", verdict_store=store)
+
+    sample = _sample(["Lyon", "Paris is the capital"])
+    assert await evaluator.evaluate(sample) == pytest.approx(0.5)
+    assert await evaluator.evaluate(sample) == pytest.approx(0.5)
+    assert len(llm.prompts) == 2 and "answer: Paris" in llm.prompts[0]
+
+    assert await evaluator.evaluate(_sample(["garbled"])) is None
+    assert store.stats()["memory_entries"] == 2
+    print("✅ Test passed: LLM chunk judge")
+
+
+@allure.feature("Core")
+@allure.story("Chunk Verdicts")
+def test_default_stores_are_independent_and_resettable():
+    """Claim and verdict stores share the memo implementation but not their defaults."""
+    from evaluators.cache import MemoCache
+    from evaluators.claims import get_default_claim_store
+    from evaluators.retrieval_augmented_generation.chunk_verdicts import (
+        get_default_verdict_store,
+        set_default_verdict_store,
+    )
+
+    store = get_default_verdict_store()
+    assert isinstance(store, MemoCache) and store is get_default_verdict_store()
+    assert get_default_claim_store() is not store
+
+    replacement = ChunkVerdictStore()
+    set_default_verdict_store(replacement)
+    assert get_default_verdict_store() is replacement
+    set_default_verdict_store(None)
+    assert get_default_verdict_store() not in (store, replacement)
+    print("✅ Test passed: Default stores")
@@ -0,0 +1,149 @@
+"""
+Test Claim Store - Shared Claim Decomposition
+"""
+
+import asyncio
+
+import pytest
+import allure
+
+from evaluators.cache import DiskCache
+from evaluators.claims import ClaimStore
+from evaluators.natural_language_comparison.factual_correctness_evaluator import FactualCorrectnessEvaluator
+from evaluators.nvidia_metrics.response_groundedness_evaluator import ResponseGroundednessEvaluator
+from evaluators.retrieval_augmented_generation.faithfulness_evaluator import FaithfulnessEvaluator
+
+
+class FakeLLM:
+    """Stand-in LLM exposing only identifying attributes."""
+
+    def __init__(self, model_name="gpt-4o", temperature=0):
+        self.model_name = model_name
+        self.temperature = temperature
+
+
+def counting_decomposer(calls):
+    async def decompose(text):
+        calls.append(text)
+        await asyncio.sleep(0.01)
+        return [part.strip() for part in text.split(".") if part.strip()]
+    return decompose
+
+
+@allure.feature("Core")
+@allure.story("Claim Store")
+@pytest.mark.asyncio
+async def test_claims_are_shared_across_evaluators():
+    """A response decomposed by one evaluator is reused by the others."""
+    calls = []
+    store = ClaimStore()
+    llm = FakeLLM()
+    faithfulness = FaithfulnessEvaluator(llm=llm, claim_store=store)
+    groundedness = ResponseGroundednessEvaluator(llm=llm, claim_store=store)
+    for evaluator in (faithfulness, groundedness):
+        evaluator._decompose_claims = counting_decomposer(calls)
+
+    text = "Paris is in France. It is the capital."
+    first = await faithfulness._extract_claims(text)
+    second = await groundedness._extract_claims(text)
+
+    assert first == second == ["Paris is in France", "It is the capital"]
+    assert calls == [text]
+    assert (store.hits, store.misses) == (1, 1)
+    print("✅ Test passed: Claims shared across evaluators")
+
+
+@allure.feature("Core")
+@allure.story("Claim Store")
+@pytest.mark.asyncio
+async def test_concurrent_requests_call_extractor_once():
+    """Concurrent evaluators asking for the same text wait for one extraction."""
+    calls = []
+    store = ClaimStore()
+    extractor = counting_decomposer(calls)
+
+    results = await asyncio.gather(*[
+        store.get_or_extract("A. B.", extractor, model="m") for _ in range(10)
+    ])
+
+    assert calls == ["A. B."]
+    assert all(r == ["A", "B"] for r in results)
+    print("✅ Test passed: Concurrent extraction deduplicated")
+
+
+@allure.feature("Core")
+@allure.story("Claim Store")
+@pytest.mark.asyncio
+async def test_key_includes_granularity_and_model():
+    """Atomicity, coverage and model produce distinct decompositions."""
+    calls = []
+    store = ClaimStore()
+    text = "One. Two."
+
+    high = FactualCorrectnessEvaluator(llm=FakeLLM(), atomicity="high", coverage="high", claim_store=store)
+    low = FactualCorrectnessEvaluator(llm=FakeLLM(), atomicity="low", coverage="low", claim_store=store)
+    other_model = FaithfulnessEvaluator(llm=FakeLLM(model_name="gpt-4o-mini"), claim_store=store)
+    same_as_low = FaithfulnessEvaluator(llm=FakeLLM(), claim_store=store)
+    for evaluator in (high, low, other_model, same_as_low):
+        evaluator._decompose_claims = counting_decomposer(calls)
+        await evaluator._extract_claims(text)
+
+    assert len(calls) == 3
+    print("✅ Test passed: Keys include granularity and model")
+
+
+@allure.feature("Core")
+@allure.story("Claim Store")
+@pytest.mark.asyncio
+async def test_decompositions_persist_and_failures_are_not_cached(tmp_path):
+    """Decompositions survive a new store on the same DiskCache; None is retried."""
+    path = str(tmp_path / "claims.sqlite")
+    calls = []
+    await ClaimStore(DiskCache(path)).get_or_extract("X. Y.", counting_decomposer(calls))
+
+    store = ClaimStore(DiskCache(path))
+    assert await store.get_or_extract("X. Y.", counting_decomposer(calls)) == ["X", "Y"]
+    assert calls == ["X. Y."]
+
+    async def failing(text):
+        calls.append(text)
+        return None
+
+    await store.get_or_extract("Z.", failing)
+    await store.get_or_extract("Z.", failing)
+    assert calls.count("Z.") == 2
+    print("✅ Test passed: Persistence and failures")
+
+
+@allure.feature("Core")
+@allure.story("Claim Store")
+@pytest.mark.asyncio
+async def test_evaluators_decompose_through_the_store():
+    """Scoring a response with a second evaluator reuses the first one's decomposition."""
+    calls = []
+    store = ClaimStore()
+    llm = FakeLLM()
+
+    async def verify(claims, premise):
+        return [claim in premise for claim in claims]
+
+    faithfulness = FaithfulnessEvaluator(llm=llm, claim_store=store)
+    groundedness = ResponseGroundednessEvaluator(llm=llm, claim_store=store)
+    for evaluator in (faithfulness, groundedness):
+        evaluator._decompose_claims = counting_decomposer(calls)
+        evaluator._verify_claims = verify
+
+    sample = {"response": "Paris is in France. It has ten moons.", "retrieved_contexts": ["Paris is in France"]}
+    assert await faithfulness.evaluate(sample) == 0.5
+    assert await groundedness.evaluate(sample) == 0.5
+    assert calls == [sample["response"]]
+    assert (store.hits, store.misses) == (1, 1)
+
+    correctness = FactualCorrectnessEvaluator(llm=llm, claim_store=store)
+    correctness._decompose_claims = counting_decomposer(calls)
+    correctness._verify_claims = verify
+    assert await correctness.evaluate({"response": "A. B.", "reference": "A. C. D."}) == pytest.approx(0.4)
+
+    with pytest.raises(ValueError):
+        await FaithfulnessEvaluator(llm=llm, claim_store=ClaimStore()).evaluate(sample)
+    print("✅ Test passed: Evaluators share decompositions")
@@ -0,0 +1,104 @@
+"""
+Test Embedding Cache - Memory-Mapped Vector Store
+"""
+
+import os
+
+import numpy as np
+import pytest
+import allure
+
+from evaluators.embedding_cache import CachedEmbeddings, EmbeddingStore, with_embedding_cache
+
+
+class CountingEmbeddings:
+    """Deterministic embeddings stand-in that records which texts it embedded."""
+
+    model = "text-embedding-3-small"
+
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(t)), float(t.count("a")), 1.0] for t in texts]
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+
+@allure.feature("Core")
+@allure.story("Embedding Cache")
+def test_only_unseen_texts_are_embedded(tmp_path):
+    """Repeated texts are served from the store, within and across batches."""
+    backend = CountingEmbeddings()
+    embeddings = with_embedding_cache(backend, path=str(tmp_path / "emb"))
+
+    first = embeddings.embed_documents(["banana", "apple", "banana"])
+    second = embeddings.embed_documents(["apple", "cherry"])
+
+    assert backend.embedded == ["banana", "apple", "cherry"]
+    assert first[0] == first[2] == [6.0, 3.0, 1.0]
+    assert second[0] == first[1]
+    assert embeddings.embed_query("cherry") == [6.0, 0.0, 1.0]
+    print("✅ Test passed: Only unseen texts embedded")
+
+
+@allure.feature("Core")
+@allure.story("Embedding Cache")
+@pytest.mark.asyncio
+async def test_store_is_shared_read_only_and_keyed_by_model(tmp_path):
+    """A read-only reader sees vectors written by another store instance."""
+    path = str(tmp_path / "emb")
+    writer = CachedEmbeddings(CountingEmbeddings(), EmbeddingStore(path, dtype="float16"))
+    await writer.aembed_documents(["alpha", "beta"])
+
+    reader_backend = CountingEmbeddings()
+    reader = CachedEmbeddings(reader_backend, EmbeddingStore(path, readonly=True))
+    vectors = reader.embed_array(["alpha", "beta"])
+    assert reader_backend.embedded == []
+    assert vectors.dtype == np.float32 and vectors.shape == (2, 3)
+    assert reader.store.dtype == np.float16
+
+    other_model = CachedEmbeddings(CountingEmbeddings(), EmbeddingStore(path), model="another-model")
+    other_model.embed_documents(["alpha"])
+    assert other_model.misses == 1 and other_model.hits == 0
+    print("✅ Test passed: Shared read-only store")
+
+
+@allure.feature("Core")
+@allure.story("Embedding Cache")
+def test_store_rejects_mismatched_dimensions(tmp_path):
+    """Vectors must match the store's dimension."""
+    store = EmbeddingStore(str(tmp_path / "emb"))
+    store.add_many(["a"], [[1.0, 2.0]])
+    with pytest.raises(ValueError):
+        store.add_many(["b"], [[1.0, 2.0, 3.0]])
+    assert len(store) == 1
+    print("✅ Test passed: Dimension checks")
+
+
+@allure.feature("Core")
+@allure.story("Embedding Cache")
+@pytest.mark.parametrize("reopen", [True, False])
+def test_torn_write_does_not_shift_later_rows(tmp_path, reopen):
+    """A partial row left by a crashed writer is dropped before the next append."""
+    path = str(tmp_path / "emb")
+    store = EmbeddingStore(path, dtype="float16")
+    first = np.arange(8, dtype=np.float32).reshape(2, 4)
+    store.add_many(["a", "b"], first)
+
+    # A writer died halfway through a row: 3 stray bytes, no index entry
+    with open(store.vectors_path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    if reopen:
+        store.close()
+        store = EmbeddingStore(path)
+        assert os.path.getsize(store.vectors_path) == 2 * 4 * 2
+
+    second = np.arange(8, 16, dtype=np.float32).reshape(2, 4)
+    store.add_many(["c", "d"], second)
+    found = store.get_many(["a", "b", "c", "d"])
+    np.testing.assert_array_equal(np.stack(found), np.vstack([first, second]))
+    assert os.path.getsize(store.vectors_path) == 4 * 4 * 2
+    print("✅ Test passed: Torn write repaired")
@@ -0,0 +1,56 @@
+"""
+Test Exact Match - Dataset-Level Hash Join
+"""
+
+import pytest
+import allure
+
+from evaluators.natural_language_comparison.exact_match import TextNormalizer, exact_match, match_any
+from evaluators.natural_language_comparison.exact_match_evaluator import create_exact_match_evaluator
+
+
+@allure.feature("Core")
+@allure.story("Exact Match")
+def test_normalization_options():
+    """Case folding, NFKC, whitespace collapse and punctuation stripping are applied once per side."""
+    assert TextNormalizer()("  Ｐａｒｉｓ\t IS  ") == "paris is"
+    assert TextNormalizer(case_sensitive=True)("Paris") == "Paris"
+    assert TextNormalizer(strip_punctuation=True)("Hello, world!") == "hello world"
+    assert TextNormalizer(unicode_form=None)("ｆｉ") != TextNormalizer()("ｆｉ")
+
+    matches = exact_match(["Paris", "paris!", None, "Berlin"], ["PARIS", "Paris", "", "Bonn"])
+    assert matches.tolist() == [True, False, True, False]
+    print("✅ Test passed: Normalization")
+
+
+@allure.feature("Core")
+@allure.story("Exact Match")
+def test_match_any_reports_first_matching_reference():
+    """Each response is joined against the whole reference set."""
+    found, index = match_any(["b", "x", "A ", "B"], ["a", "b", "a"])
+    assert found.tolist() == [True, False, True, True]
+    assert index.tolist() == [1, -1, 0, 1]
+    print("✅ Test passed: Match any")
+
+
+@allure.feature("Core")
+@allure.story("Exact Match")
+@pytest.mark.asyncio
+async def test_evaluator_per_sample_and_dataset_modes_agree():
+    """Per-sample scores equal the vectorized dataset scores for the same options."""
+    evaluator = create_exact_match_evaluator(strip_punctuation=True)
+    samples = [
+        {"response": "The answer is 42.", "reference": "the answer is 42"},
+        {"response": "Yes", "reference": "No"},
+        {"response": "no", "reference": "Yes"},
+    ]
+    single = [await evaluator.evaluate(s) for s in samples]
+    assert single == [1.0, 0.0, 0.0]
+    assert evaluator.evaluate_corpus(samples).tolist() == single
+
+    # Across the set, "Yes" and "no" match other samples' references
+    found, index = evaluator.match_any(samples)
+    assert found.tolist() == [True, True, True] and index.tolist() == [0, 2, 1]
+    found, _ = evaluator.match_any(samples, references=["maybe", "the answer is 42"])
+    assert found.tolist() == [True, False, False]
+    print("✅ Test passed: Exact match evaluator")
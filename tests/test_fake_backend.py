@@ -0,0 +1,180 @@
+"""
+Test Fake Backend - Offline Azure OpenAI Stand-In
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+import allure
+from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
+
+from evaluators.fake_backend import (
+    SCHEMA_MARKER,
+    FakeAzureOpenAIServer,
+    FakeBackend,
+    FakeChatModel,
+    FakeEmbeddings,
+    prompt_identifiers,
+    schema_instance,
+)
+from evaluators.rate_limiter import AdaptiveRateLimiter, RateLimitedLLM
+
+
+SCHEMA = {
+    "$defs": {
+        "Verdict": {
+            "properties": {
+                "statement": {"type": "string"},
+                "verdict": {"type": "integer"},
+            },
+            "required": ["statement", "verdict"],
+            "type": "object",
+        }
+    },
+    "properties": {"statements": {"items": {"$ref": "#/$defs/Verdict"}, "type": "array"}},
+    "required": ["statements"],
+    "type": "object",
+}
+
+PROMPT = (
+    "Judge the statements.\n"
+    "Please return the output in a JSON format that complies with the following schema "
+    f"as specified in JSON Schema:\n{json.dumps(SCHEMA)}Do not use single quotes.\n"
+    "input: {\"statements\": [\"Paris is in France\"]}"
+)
+
+
+@allure.feature("Core")
+@allure.story("Fake Backend")
+def test_replies_are_deterministic_and_schema_valid():
+    """Judge prompts get a JSON instance of their schema, identical across backends."""
+    first = FakeChatModel(FakeBackend(seed=1)).invoke(PROMPT).content
+    second = FakeChatModel(FakeBackend(seed=1)).invoke(PROMPT).content
+
+    assert first == second
+    output = json.loads(first)
+    assert output["statements"]
+    for item in output["statements"]:
+        assert isinstance(item["statement"], str)
+        assert item["verdict"] in (0, 1)
+    print("✅ Test passed: Deterministic schema-valid replies")
+
+
+@allure.feature("Core")
+@allure.story("Fake Backend")
+@pytest.mark.asyncio
+async def test_rate_limits_and_errors_are_simulated():
+    """Quota overruns answer 429 with Retry-After; the rate limiter recovers from them."""
+    backend = FakeBackend(requests_per_minute=600)  # burst of 100 requests
+    llm = RateLimitedLLM(FakeChatModel(backend), limiter=AdaptiveRateLimiter(max_concurrency=200))
+    for i in range(105):
+        await llm.ainvoke(f"prompt {i}")
+    assert backend.rate_limited >= 1
+    assert backend.calls == 105 + backend.rate_limited
+
+    failing = FakeChatModel(FakeBackend(error_rate=1.0))
+    with pytest.raises(Exception) as info:
+        failing.invoke("hello")
+    assert info.value.status_code == 500
+    print("✅ Test passed: Rate limits and errors")
+
+
+@allure.feature("Core")
+@allure.story("Fake Backend")
+def test_http_endpoint_serves_azure_clients():
+    """AzureChatOpenAI and AzureOpenAIEmbeddings work against the local endpoint."""
+    backend = FakeBackend(embedding_dim=64)
+    with FakeAzureOpenAIServer(backend) as server:
+        settings = dict(azure_endpoint=server.endpoint, api_key="fake", api_version="2024-12-01-preview")
+        llm = AzureChatOpenAI(azure_deployment="gpt-4o", max_retries=0, **settings)
+        reply = llm.invoke(PROMPT)
+        embeddings = AzureOpenAIEmbeddings(
+            model="text-embedding-3-small", check_embedding_ctx_length=False, **settings
+        )
+        vectors = embeddings.embed_documents(["red apple", "red apple pie", "quantum field"])
+
+    assert reply.content == FakeChatModel(FakeBackend()).invoke(PROMPT).content
+    assert reply.usage_metadata["total_tokens"] > 0
+    assert len(vectors[0]) == 64
+    similarity = lambda a, b: sum(x * y for x, y in zip(a, b))
+    assert similarity(vectors[0], vectors[1]) > similarity(vectors[0], vectors[2])
+    assert FakeEmbeddings(FakeBackend(embedding_dim=64)).embed_query("red apple") == pytest.approx(vectors[0], abs=1e-6)
+    assert backend.calls == 2
+    print("✅ Test passed: HTTP endpoint")
+
+
+@allure.feature("Core")
+@allure.story("Fake Backend")
+def test_schema_instance_handles_enums_and_nullable_fields():
+    """Enums, nullable unions and bounded numbers produce valid values."""
+    schema = {
+        "properties": {
+            "label": {"enum": ["yes", "no"]},
+            "note": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            "score": {"type": "number", "minimum": 1, "maximum": 5},
+        },
+        "type": "object",
+    }
+    value = schema_instance(schema, random.Random(0))
+    assert value["label"] in ("yes", "no")
+    assert isinstance(value["note"], str)
+    assert 1 <= value["score"] <= 5
+    print("✅ Test passed: Schema coverage")
+
+
+@allure.feature("Core")
+@allure.story("Fake Backend")
+def test_free_form_mappings_use_input_names_and_identifiers():
+    """Dict-valued outputs (ragas persona -> themes) refer back to the input."""
+    schema = {
+        "properties": {
+            "mapping": {"additionalProperties": {"items": {"type": "string"}, "type": "array"}, "type": "object"},
+            "score": {"description": "1 to 5 score", "type": "integer"},
+        },
+        "type": "object",
+    }
+    prompt = (
+        f"Map personas to themes. ... {SCHEMA_MARKER} {json.dumps(schema)}\n"
+        'input: {"themes": ["Python", "CERN"], "personas": [{"name": "Data Scientist", "role_description": "Uses Python"}]}\n'
+        "Output: "
+    )
+    identifiers = prompt_identifiers(prompt)
+    names = prompt_identifiers(prompt, field="name")
+    assert identifiers == ["Python", "CERN", "Data Scientist", "Uses Python"]
+    assert names == ["Data Scientist"]
+
+    value = schema_instance(schema, random.Random(0), identifiers=identifiers, names=names)
+    assert list(value["mapping"]) == ["Data Scientist"]
+    assert set(value["mapping"]["Data Scientist"]) <= {"Python", "CERN", "Uses Python"}
+    assert 1 <= value["score"] <= 5
+    print("✅ Test passed: Grounded mappings")
+
+
+@allure.feature("Core")
+@allure.story("Fake Backend")
+def test_generated_data_tests_run_offline_with_fake_backend(tmp_path):
+    """EVAL_FAKE_BACKEND=1 generates a dataset without network access instead of skipping."""
+    env = dict(
+        os.environ,
+        EVAL_FAKE_BACKEND="1",
+        # Any download attempt (e.g. tiktoken encodings) fails fast
+        HTTPS_PROXY="http://127.0.0.1:9",
+        HTTP_PROXY="http://127.0.0.1:9",
+        NO_PROXY="127.0.0.1,localhost",
+        TIKTOKEN_CACHE_DIR=str(tmp_path),
+    )
+    target = os.path.join(
+        os.path.dirname(__file__),
+        "natural_language_comparison", "llm_generated_data", "test_exact_match_generated.py",
+    )
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", target],
+        capture_output=True, text=True, env=env, timeout=600,
+    )
+    summary = result.stdout.strip().splitlines()[-1]
+    assert result.returncode == 0 and "1 passed" in summary, result.stdout[-2000:]
+    print(f"✅ Test passed: Offline generated-data run ({summary})")
@@ -0,0 +1,93 @@
+"""
+Test Incremental - Re-Evaluation of Changed Cells Only
+"""
+
+import json
+
+import allure
+
+from evaluators.base import BaseEvaluator
+from evaluators.incremental import IncrementalRunner, evaluator_fingerprint, sample_fingerprint
+from evaluators.natural_language_comparison.factual_correctness_evaluator import (
+    create_factual_correctness_evaluator,
+)
+
+
+class LengthEvaluator(BaseEvaluator):
+    """Scores the response length, scaled; records the samples it evaluated."""
+
+    sample_fields = ("response",)
+
+    def __init__(self, metric_name, scale=1):
+        self.metric_name = metric_name
+        self.scale = scale
+        self._seen = []
+
+    async def evaluate(self, sample):
+        self._seen.append(sample["id"])
+        return len(sample["response"]) * self.scale
+
+
+def samples():
+    return [{"id": f"s{i}", "response": "x" * i, "reference": "y"} for i in range(4)]
+
+
+@allure.feature("Core")
+@allure.story("Incremental")
+def test_changed_sample_is_the_only_recomputed_cell(tmp_path):
+    """Editing one row re-evaluates that row; unrelated fields do not invalidate."""
+    store = str(tmp_path / "results.sqlite")
+    IncrementalRunner([LengthEvaluator("length")], store=store).run(samples())
+
+    data = samples()
+    data[2]["response"] = "changed"
+    data[3]["reference"] = "not read by the evaluator"
+    evaluator = LengthEvaluator("length")
+    runner = IncrementalRunner([evaluator], store=store)
+    assert runner.stale(data) == [(2, "length")]
+    results = runner.run(data)
+
+    assert evaluator._seen == ["s2"]
+    assert (runner.reused, runner.computed) == (3, 1)
+    assert [r["length"].score for r in results] == [0, 1, 7, 3]
+    print("✅ Test passed: Changed sample recomputed")
+
+
+@allure.feature("Core")
+@allure.story("Incremental")
+def test_config_change_recomputes_only_that_evaluator(tmp_path):
+    """Changing one evaluator's parameters invalidates its column only."""
+    data = tmp_path / "data.jsonl"
+    data.write_text("".join(json.dumps(s) + "\n" for s in samples()))
+    store = str(tmp_path / "results.sqlite")
+    IncrementalRunner([LengthEvaluator("a"), LengthEvaluator("b")], store=store).run(str(data))
+
+    a, b = LengthEvaluator("a"), LengthEvaluator("b", scale=2)
+    runner = IncrementalRunner([a, b], store=store)
+    results = runner.run(str(data))
+
+    assert a._seen == [] and len(b._seen) == 4
+    assert [r["b"].score for r in results] == [0, 2, 4, 6]
+
+    low = create_factual_correctness_evaluator(atomicity="low")
+    assert evaluator_fingerprint(low) != evaluator_fingerprint(create_factual_correctness_evaluator())
+    assert evaluator_fingerprint(low) == evaluator_fingerprint(create_factual_correctness_evaluator(atomicity="low"))
+    print("✅ Test passed: Config change recomputed")
+
+
+@allure.feature("Core")
+@allure.story("Incremental")
+def test_sample_fingerprint_ignores_ids_and_unread_fields():
+    """Renumbered rows and unread fields keep the fingerprint stable."""
+    fields = ("response", "reference")
+    base = sample_fingerprint({"id": 1, "response": "a", "reference": "b"}, fields)
+    assert base == sample_fingerprint({"id": 2, "response": "a", "reference": "b", "extra": 0}, fields)
+    assert base != sample_fingerprint({"id": 1, "response": "a", "reference": "c"}, fields)
+    assert sample_fingerprint({"id": 1, "q": "a"}) == sample_fingerprint({"id": 9, "q": "a"}, ("response",))
+
+    def calls(value):
+        return {"id": 1, "tool_calls": [{"name": "lookup", "args": {"id": value}}]}
+
+    assert sample_fingerprint(calls(42)) != sample_fingerprint(calls(7))
+    assert sample_fingerprint(calls(42), ("tool_calls",)) != sample_fingerprint(calls(7), ("tool_calls",))
+    print("✅ Test passed: Sample fingerprints")
@@ -0,0 +1,96 @@
+"""
+Test LLM Response Cache - Disk Cache and Cached LLM Wrapper
+"""
+
+import time
+import pytest
+import allure
+from langchain_core.messages import HumanMessage
+
+from evaluators.cache import DiskCache, make_key
+from evaluators.llm_cache import CachedLLM, with_llm_cache
+
+
+class CountingLLM:
+    """Minimal chat model stand-in that counts generation calls."""
+
+    def __init__(self, deployment_name="gpt-4o", temperature=0.0):
+        self.deployment_name = deployment_name
+        self.temperature = temperature
+        self.calls = 0
+
+    def invoke(self, prompt, **kwargs):
+        self.calls += 1
+        return f"answer to {prompt!r}"
+
+    async def ainvoke(self, prompt, **kwargs):
+        return self.invoke(prompt, **kwargs)
+
+
+@allure.feature("Core")
+@allure.story("LLM Response Cache")
+def test_disk_cache_lru_eviction_and_ttl(tmp_path):
+    """Least recently used entries are evicted first and expired entries vanish."""
+    cache = DiskCache(str(tmp_path / "c.sqlite"), max_entries=2)
+    cache.set("a", 1)
+    time.sleep(0.01)
+    cache.set("b", 2)
+    time.sleep(0.01)
+    assert cache.get("a") == 1          # "a" is now more recently used than "b"
+    time.sleep(0.01)
+    cache.set("c", 3)
+    assert "b" not in cache and cache.get("a") == 1 and cache.get("c") == 3
+
+    expiring = DiskCache(str(tmp_path / "ttl.sqlite"), ttl=0.05)
+    expiring.set("k", None)
+    assert expiring.get("k", "missing") is None
+    time.sleep(0.1)
+    assert expiring.get("k", "missing") == "missing"
+    print("✅ Test passed: LRU eviction and TTL")
+
+
+@allure.feature("Core")
+@allure.story("LLM Response Cache")
+def test_make_key_is_order_insensitive_for_dicts():
+    """Keys depend on content, not dict ordering."""
+    assert make_key({"a": 1, "b": 2}) == make_key({"b": 2, "a": 1})
+    assert make_key("x", 1) != make_key("x", 2)
+    print("✅ Test passed: Content-addressed keys")
+
+
+@allure.feature("Core")
+@allure.story("LLM Response Cache")
+@pytest.mark.asyncio
+async def test_cached_llm_reuses_responses_across_runs(tmp_path):
+    """Identical prompts hit the cache, also after reopening it."""
+    path = str(tmp_path / "llm.sqlite")
+    backend = CountingLLM()
+    llm = with_llm_cache(backend, path=path)
+
+    first = await llm.ainvoke([HumanMessage(content="Is the claim supported?")], callbacks=[object()])
+    again = llm.invoke([HumanMessage(content="Is the claim supported?")])
+    other = await llm.ainvoke([HumanMessage(content="A different prompt")])
+    assert first == again and other != first
+    assert backend.calls == 2
+
+    reopened = with_llm_cache(CountingLLM(), path=path)
+    await reopened.ainvoke([HumanMessage(content="Is the claim supported?")])
+    assert reopened.llm.calls == 0 and reopened.cache.hits == 1
+    print("✅ Test passed: Responses reused")
+
+
+@allure.feature("Core")
+@allure.story("LLM Response Cache")
+def test_cache_key_depends_on_model_and_parameters(tmp_path):
+    """Different deployments or temperatures never share entries."""
+    cache = DiskCache(str(tmp_path / "llm.sqlite"))
+    base = CachedLLM(CountingLLM(), cache)
+    other_model = CachedLLM(CountingLLM(deployment_name="gpt-4o-mini"), cache)
+    other_temperature = CachedLLM(CountingLLM(temperature=0.7), cache)
+
+    keys = {llm.cache_key("invoke", ("prompt",), {}) for llm in (base, other_model, other_temperature)}
+    assert len(keys) == 3
+    assert base.cache_key("invoke", ("p",), {}) == base.cache_key("ainvoke", ("p",), {})
+    assert base.cache_key("invoke", ("p",), {"stop": ["x"]}) != base.cache_key("invoke", ("p",), {})
+    assert base.deployment_name == "gpt-4o"
+    print("✅ Test passed: Model-aware keys")
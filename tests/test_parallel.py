@@ -0,0 +1,102 @@
+"""
+Test Parallel Execution - Process and Thread Pools for CPU-Bound Evaluators
+"""
+
+import os
+import threading
+import pytest
+import allure
+
+from evaluators.base import BaseEvaluator
+from evaluators.parallel import CPUExecutor, evaluate_in_pool
+from evaluators.runner import EvaluationRunner
+
+
+class WordCountEvaluator(BaseEvaluator):
+    """CPU-only evaluator reporting the worker that scored each sample."""
+
+    metric_name = "word_count"
+    cpu_bound = True
+
+    async def evaluate(self, sample):
+        if not sample:
+            raise ValueError("empty sample")
+        return (len(sample.split()), os.getpid(), threading.get_ident())
+
+
+class UnpicklableEvaluator(WordCountEvaluator):
+    """Holds a lock, which cannot be pickled."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+
+SAMPLES = ["one", "two words", "three more words", "", "a b c d"] * 20
+
+
+@allure.feature("Core")
+@allure.story("Parallel Execution")
+@pytest.mark.parametrize("mode", ["process", "thread"])
+def test_evaluate_in_pool_returns_ordered_results(mode):
+    """Pool execution keeps input order and captures per-sample errors."""
+    results = evaluate_in_pool(WordCountEvaluator(), SAMPLES, mode=mode, max_workers=2, chunk_size=7)
+
+    assert [r.index for r in results] == list(range(len(SAMPLES)))
+    assert [r.score[0] for r in results if r.ok] == [len(s.split()) for s in SAMPLES if s]
+    assert all(isinstance(r.error, ValueError) for r in results if not r.ok)
+    print(f"✅ Test passed: {mode} pool results ordered")
+
+
+@allure.feature("Core")
+@allure.story("Parallel Execution")
+def test_process_mode_runs_outside_main_process():
+    """Process mode scores samples in worker processes."""
+    results = evaluate_in_pool(WordCountEvaluator(), SAMPLES, mode="process", max_workers=2, chunk_size=10)
+    assert {r.score[1] for r in results if r.ok}.isdisjoint({os.getpid()})
+    print("✅ Test passed: Process workers used")
+
+
+@allure.feature("Core")
+@allure.story("Parallel Execution")
+def test_auto_mode_falls_back_to_threads():
+    """Evaluators that cannot be pickled fall back to the thread pool."""
+    assert CPUExecutor({"a": WordCountEvaluator()}, mode="auto").mode == "process"
+    assert CPUExecutor({"a": UnpicklableEvaluator()}, mode="auto").mode == "thread"
+    print("✅ Test passed: Auto mode fallback")
+
+
+@allure.feature("Core")
+@allure.story("Parallel Execution")
+def test_runner_sends_cpu_bound_evaluators_to_pool():
+    """The runner dispatches cpu_bound evaluators to the pool in chunks."""
+    runner = EvaluationRunner([WordCountEvaluator()], cpu_execution="thread", cpu_workers=2, chunk_size=8)
+    results = runner.run(SAMPLES)
+
+    main_thread = threading.get_ident()
+    scored = [r["word_count"] for r in results]
+    assert all(r.score[2] != main_thread for r in scored if r.ok)
+    assert sum(not r.ok for r in scored) == SAMPLES.count("")
+    print("✅ Test passed: Runner uses the CPU pool")
+
+
+@allure.feature("Core")
+@allure.story("Parallel Execution")
+def test_thread_mode_closes_worker_event_loops(monkeypatch):
+    """Every event loop a thread worker opens is closed once its chunk is scored."""
+    import asyncio
+
+    opened = []
+    new_event_loop = asyncio.new_event_loop
+
+    def tracking_new_event_loop():
+        loop = new_event_loop()
+        opened.append(loop)
+        return loop
+
+    monkeypatch.setattr(asyncio, "new_event_loop", tracking_new_event_loop)
+    results = evaluate_in_pool(WordCountEvaluator(), SAMPLES, mode="thread", max_workers=4, chunk_size=7)
+
+    assert len(results) == len(SAMPLES)
+    assert len(opened) == -(-len(SAMPLES) // 7)  # one per chunk
+    assert all(loop.is_closed() for loop in opened)
+    print(f"✅ Test passed: {len(opened)} worker loops closed")
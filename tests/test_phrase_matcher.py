@@ -0,0 +1,63 @@
+"""
+Test Phrase Matcher - Aho-Corasick String Presence
+"""
+
+import random
+
+import pytest
+import allure
+
+from evaluators.natural_language_comparison.phrase_matcher import PhraseMatcher
+from evaluators.natural_language_comparison.string_presence_evaluator import create_string_presence_evaluator
+
+
+@allure.feature("Core")
+@allure.story("Phrase Matcher")
+def test_automaton_agrees_with_substring_checks():
+    """Overlapping, nested and repeated phrases are all found in one scan."""
+    rng = random.Random(0)
+    for _ in range(500):
+        phrases = ["".join(rng.choice("abc") for _ in range(rng.randrange(0, 6))) for _ in range(rng.randrange(1, 9))]
+        text = "".join(rng.choice("abcd") for _ in range(rng.randrange(0, 40)))
+        expected = [phrase in text for phrase in phrases]
+        assert PhraseMatcher(phrases).hits(text).tolist() == expected
+
+    matcher = PhraseMatcher(["he", "she", "his", "hers"])
+    assert matcher.hit_matrix(["ushers", "this", ""]).tolist() == [
+        [True, True, False, True],
+        [False, False, True, False],
+        [False, False, False, False],
+    ]
+    print("✅ Test passed: Automaton matches")
+
+
+@allure.feature("Core")
+@allure.story("Phrase Matcher")
+def test_case_folding_and_unicode_normalization():
+    """Case folding and NFKC apply to phrases and texts alike."""
+    phrases = ["STRASSE", "ﬁle", "Café"]
+    text = "Die straße, the file and the café."
+
+    assert PhraseMatcher(phrases).hits(text).tolist() == [False, False, False]
+    assert PhraseMatcher(phrases, case_sensitive=False, normalization="NFKC").hits(text).tolist() == [True, True, True]
+    print("✅ Test passed: Normalization")
+
+
+@allure.feature("Core")
+@allure.story("Phrase Matcher")
+@pytest.mark.asyncio
+async def test_evaluator_coverage_with_fixed_and_per_sample_strings():
+    """Coverage uses fixed strings or each sample's reference; automata are reused."""
+    compliance = create_string_presence_evaluator(strings=["terms apply", "not financial advice"], case_sensitive=False)
+    samples = [
+        {"response": "Terms apply. This is not financial advice."},
+        {"response": "Buy now, terms apply!"},
+        {"response": "Hello"},
+    ]
+    assert compliance.evaluate_corpus(samples).tolist() == [1.0, 0.5, 0.0]
+    assert compliance.matcher() is compliance.matcher()
+
+    per_sample = create_string_presence_evaluator()
+    assert await per_sample.evaluate({"response": "Paris, France", "reference": "Paris"}) == 1.0
+    assert await per_sample.evaluate({"response": "Paris, France", "reference": ["Paris", "Lyon"]}) == 0.5
+    print("✅ Test passed: String presence evaluator")
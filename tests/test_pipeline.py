@@ -0,0 +1,106 @@
+"""
+Test Streaming Pipeline - Lazy JSONL Reading and Incremental Result Writing
+"""
+
+import asyncio
+import json
+import pytest
+import allure
+
+from evaluators.base import BaseEvaluator
+from evaluators.pipeline import astream_evaluate, iter_jsonl, iter_results, stream_evaluate
+
+
+class LengthEvaluator(BaseEvaluator):
+    """Scores the response length; tracks jobs in flight."""
+
+    metric_name = "length"
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def evaluate(self, sample):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if sample["response"] is None:
+                raise ValueError("missing response")
+            return len(sample["response"])
+        finally:
+            self.in_flight -= 1
+
+
+def write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+@allure.feature("Core")
+@allure.story("Streaming Pipeline")
+def test_iter_jsonl_reads_globs_lazily(tmp_path):
+    """Samples are yielded one by one with stable ids across matched files."""
+    (tmp_path / "nested").mkdir()
+    write_jsonl(tmp_path / "a.jsonl", [{"response": "x"}, {"id": "custom", "response": "y"}])
+    write_jsonl(tmp_path / "nested" / "b.jsonl", [{"response": "z"}])
+
+    samples = iter_jsonl(str(tmp_path / "**" / "*.jsonl"))
+    first_id, first = next(samples)
+    assert first_id.endswith("a.jsonl:1") and first == {"response": "x"}
+    rest = [sample_id for sample_id, _ in samples]
+    assert rest[0] == "custom" and rest[1].endswith("b.jsonl:1")
+    print("✅ Test passed: Lazy JSONL reading")
+
+
+@allure.feature("Core")
+@allure.story("Streaming Pipeline")
+def test_stream_evaluate_appends_results(tmp_path):
+    """Every job's result is appended to the output file, errors included."""
+    rows = [{"response": "ab"}, {"response": None}, {"response": "abcd"}]
+    write_jsonl(tmp_path / "in.jsonl", rows)
+    output = tmp_path / "out.jsonl"
+
+    summary = stream_evaluate([LengthEvaluator()], tmp_path / "in.jsonl", output, max_in_flight=2)
+
+    records = {r["sample_id"].rsplit(":", 1)[1]: r for r in iter_results(output)}
+    assert (summary.samples, summary.completed, summary.failed) == (3, 2, 1)
+    assert records["1"]["score"] == 2 and records["3"]["score"] == 4
+    assert records["2"]["score"] is None and records["2"]["error"].startswith("ValueError")
+    print("✅ Test passed: Results streamed to disk")
+
+
+@allure.feature("Core")
+@allure.story("Streaming Pipeline")
+def test_stream_evaluate_drops_torn_tail_before_appending(tmp_path):
+    """A partial line left by a crashed run does not swallow the next record."""
+    write_jsonl(tmp_path / "in.jsonl", [{"response": "ab"}, {"response": "é"}])
+    output = tmp_path / "out.jsonl"
+    output.write_text('{"sample_id": "old", "evaluator": "length", "score": 1, "error": null}\n{"sample_id": "to')
+
+    stream_evaluate([LengthEvaluator()], tmp_path / "in.jsonl", output)
+
+    records = list(iter_results(output))
+    assert [r["sample_id"] for r in records][0] == "old" and len(records) == 3
+    assert sorted(r["score"] for r in records[1:]) == [1, 2]
+    print("✅ Test passed: Torn output tail dropped")
+
+
+@allure.feature("Core")
+@allure.story("Streaming Pipeline")
+@pytest.mark.asyncio
+async def test_stream_evaluate_bounds_input_reads(tmp_path):
+    """Input is only consumed as fast as the in-flight window allows."""
+    evaluator = LengthEvaluator()
+    consumed = []
+
+    def samples():
+        for i in range(50):
+            consumed.append(i)
+            yield str(i), {"response": "x" * i}
+
+    summary = await astream_evaluate([evaluator], samples(), tmp_path / "out.jsonl", max_in_flight=3)
+
+    assert summary.completed == 50
+    assert evaluator.peak_in_flight <= 3
+    assert len(list(iter_results(tmp_path / "out.jsonl"))) == 50
+    print("✅ Test passed: Bounded in-flight window")
@@ -0,0 +1,126 @@
+"""
+Test Ranking - Batch ID-Based Ranking Metrics
+"""
+
+import math
+
+import numpy as np
+import pytest
+import allure
+
+from evaluators.retrieval_augmented_generation.ranking import id_ranking_metrics, ranking_curves, ranking_metrics
+from evaluators.retrieval_augmented_generation.context_precision_evaluator import (
+    ContextPrecisionEvaluator, create_context_precision_evaluator,
+)
+from evaluators.retrieval_augmented_generation.context_recall_evaluator import create_context_recall_evaluator
+
+
+@allure.feature("Core")
+@allure.story("Ranking Metrics")
+def test_metrics_from_relevance_flags():
+    """Cumulative sums give precision@k, AP, MRR and nDCG for every row at once."""
+    relevance = np.array([False, True, False, True, True, False, False])
+    offsets = np.array([0, 4, 5, 7, 7])
+    result = ranking_metrics(relevance, offsets, reference_counts=np.array([3, 1, 2, 0]), cutoffs=(2,))
+
+    assert result["average_precision"].tolist() == pytest.approx([(1 / 2 + 2 / 4) / 2, 1.0, 0.0, 0.0])
+    assert result["reciprocal_rank"].tolist() == pytest.approx([0.5, 1.0, 0.0, 0.0])
+    ideal = 1 + 1 / math.log2(3) + 1 / math.log2(4)
+    assert result["ndcg"][0] == pytest.approx((1 / math.log2(3) + 1 / math.log2(5)) / ideal)
+    assert result["precision@2"].tolist() == pytest.approx([0.5, 0.5, 0.0, 0.0])
+    assert result["recall@2"][:3].tolist() == pytest.approx([1 / 3, 1.0, 0.0])
+    assert math.isnan(result["recall"][3])
+    print("✅ Test passed: Ranking metrics")
+
+
+@allure.feature("Core")
+@allure.story("Ranking Metrics")
+def test_id_metrics_follow_ragas_set_semantics():
+    """IDs compare as strings and repeated retrieved IDs count once."""
+    retrieved = [[1, "2", 2, 9], ["a", "b"], None, [10**19, 3]]
+    reference = [["2", 1, 5], ["c"], ["x"], [10**19]]
+    result = id_ranking_metrics(retrieved, reference, cutoffs=(1,), chunk_size=2)
+
+    assert result["precision"].tolist() == pytest.approx([2 / 3, 0.0, 0.0, 0.5])
+    assert result["recall"].tolist() == pytest.approx([2 / 3, 0.0, 0.0, 1.0])
+    assert result["average_precision"].tolist() == pytest.approx([1.0, 0.0, 0.0, 1.0])
+    assert result["precision@1"].tolist() == pytest.approx([1.0, 0.0, 0.0, 1.0])
+
+    # Integer IDs take the NumPy path and give the same answers as strings
+    numbers = id_ranking_metrics([[4, 7, 4, 1]], [[1, 4]])
+    strings = id_ranking_metrics([["4", "7", "4", "1"]], [["1", "4"]])
+    for name in numbers:
+        assert numbers[name].tolist() == pytest.approx(strings[name].tolist())
+    print("✅ Test passed: ID ranking metrics")
+
+
+@allure.feature("Core")
+@allure.story("Ranking Metrics")
+@pytest.mark.asyncio
+async def test_id_based_evaluators():
+    """Per-sample id_based scores match the dataset-level metrics."""
+    samples = [
+        {"retrieved_context_ids": ["d1", "d3", "d2"], "reference_context_ids": ["d1", "d2"]},
+        {"retrieved_context_ids": ["d4"], "reference_context_ids": ["d1", "d4", "d5", "d6"]},
+    ]
+    precision = create_context_precision_evaluator(metric_type="id_based")
+    recall = create_context_recall_evaluator(metric_type="id_based")
+    assert [await precision.evaluate(s) for s in samples] == pytest.approx([2 / 3, 1.0])
+    assert [await recall.evaluate(s) for s in samples] == pytest.approx([1.0, 0.25])
+
+    result = precision.evaluate_corpus(samples, cutoffs=(1, 2))
+    assert result["recall@2"].tolist() == pytest.approx([0.5, 0.25])
+    assert result["reciprocal_rank"].tolist() == pytest.approx([1.0, 1.0])
+    with pytest.raises(ValueError):
+        create_context_precision_evaluator().evaluate_corpus(samples)
+    print("✅ Test passed: ID-based context precision and recall")
+
+
+class JudgedContextPrecision(ContextPrecisionEvaluator):
+    def __init__(self, verdicts, **kwargs):
+        super().__init__(**kwargs)
+        self.verdicts = verdicts
+        self.calls = 0
+
+    async def _llm_verdicts(self, sample, use_reference):
+        self.calls += 1
+        return self.verdicts
+
+
+@allure.feature("Core")
+@allure.story("Ranking Metrics")
+def test_curves_match_metrics_at_each_cutoff():
+    """Every cutoff of the curve equals the metric computed on the truncated ranking."""
+    relevance = np.array([True, False, True, True, False, True])
+    offsets = np.array([0, 5, 6])
+    curves = ranking_curves(relevance, offsets, relevant_totals=np.array([4, 1]))
+    for k in range(1, 6):
+        truncated = ranking_metrics(relevance[:k], np.array([0, k]), reference_counts=np.array([4]))
+        assert curves["precision@k"][k - 1] == pytest.approx(truncated["precision"][0])
+        assert curves["recall@k"][k - 1] == pytest.approx(truncated["recall"][0])
+        assert curves["ap@k"][k - 1] == pytest.approx(truncated["average_precision"][0])
+    assert curves["precision@k"][5] == 1.0
+    print("✅ Test passed: Ranking curves")
+
+
+@allure.feature("Core")
+@allure.story("Ranking Metrics")
+@pytest.mark.asyncio
+async def test_curve_mode_judges_each_chunk_once():
+    """One set of verdicts yields the curve for every K; AP@K equals the usual score."""
+    sample = {"user_input": "q", "reference": "r", "retrieved_contexts": ["a", "b", "c", "d"]}
+    evaluator = JudgedContextPrecision([True, False, True, False], metric_type="llm_with_reference",
+                                       return_curve=True)
+    curves = await evaluator.evaluate(sample)
+    assert evaluator.calls == 1
+    assert curves["precision@k"].tolist() == pytest.approx([1.0, 0.5, 2 / 3, 0.5])
+    assert curves["recall@k"].tolist() == pytest.approx([0.5, 0.5, 1.0, 1.0])
+    assert curves["ap@k"].tolist() == pytest.approx([1.0, 1.0, 5 / 6, 5 / 6])
+
+    evaluator.return_curve = False
+    assert await evaluator.evaluate(sample) == pytest.approx(curves["context_precision"])
+
+    by_id = create_context_precision_evaluator(metric_type="id_based", return_curve=True)
+    curves = await by_id.evaluate({"retrieved_context_ids": ["d2", "d9", "d1"], "reference_context_ids": ["d1", "d2", "d3"]})
+    assert curves["recall@k"].tolist() == pytest.approx([1 / 3, 1 / 3, 2 / 3])
+    print("✅ Test passed: Precision curve mode")
@@ -0,0 +1,144 @@
+"""
+Test Rate Limiter - Token Buckets and AIMD Concurrency
+"""
+
+import asyncio
+
+import pytest
+import allure
+
+from evaluators.cache import DiskCache
+from evaluators.llm_cache import CachedLLM
+from evaluators.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimitedLLM,
+    TokenBucket,
+    with_rate_limit,
+)
+from evaluators.retrieval_augmented_generation.faithfulness_evaluator import FaithfulnessEvaluator
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class RateLimitError(Exception):
+    """Mimics openai.RateLimitError (HTTP 429 with Retry-After headers)."""
+
+    def __init__(self, retry_after_ms):
+        super().__init__("429 Too Many Requests")
+        self.response = FakeResponse(429, {"retry-after-ms": str(retry_after_ms)})
+
+
+class FakeLLM:
+    """Async LLM stand-in that throttles the first calls and tracks concurrency."""
+
+    model_name = "gpt-4o"
+
+    def __init__(self, throttled_calls=0, latency=0.01):
+        self.throttled_calls = throttled_calls
+        self.latency = latency
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.calls <= self.throttled_calls:
+                raise RateLimitError(retry_after_ms=50)
+            return f"verdict for {prompt}"
+        finally:
+            self.active -= 1
+
+
+@allure.feature("Core")
+@allure.story("Rate Limiter")
+def test_token_bucket_paces_reservations():
+    """Reservations beyond the burst are told to wait for the refill."""
+    bucket = TokenBucket(per_minute=60, burst=2)
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+    bucket.refund(1)
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+    print("✅ Test passed: Token bucket pacing")
+
+
+@allure.feature("Core")
+@allure.story("Rate Limiter")
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_shared_and_grows_on_success():
+    """Calls through different wrappers share one concurrency limit."""
+    limiter = AdaptiveRateLimiter(initial_concurrency=2, max_concurrency=4)
+    backend = FakeLLM()
+    first = RateLimitedLLM(backend, limiter=limiter)
+    second = RateLimitedLLM(backend, limiter=limiter)
+
+    results = await asyncio.gather(*[
+        (first if i % 2 else second).ainvoke(str(i)) for i in range(20)
+    ])
+
+    assert results == [f"verdict for {i}" for i in range(20)]
+    assert backend.max_active <= 4
+    assert limiter.concurrency > 2
+    assert limiter.in_flight == 0
+    print("✅ Test passed: Shared concurrency limit")
+
+
+@allure.feature("Core")
+@allure.story("Rate Limiter")
+@pytest.mark.asyncio
+async def test_429_backs_off_and_retries():
+    """A 429 halves the concurrency limit, honours Retry-After and is retried."""
+    limiter = AdaptiveRateLimiter(initial_concurrency=8, default_backoff=0.0)
+    backend = FakeLLM(throttled_calls=1)
+    llm = RateLimitedLLM(backend, limiter=limiter)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert await llm.ainvoke("q") == "verdict for q"
+
+    assert loop.time() - started >= 0.05
+    assert backend.calls == 2
+    assert limiter.rate_limited == 1
+    assert limiter.concurrency == 4
+    print("✅ Test passed: 429 backoff")
+
+
+@allure.feature("Core")
+@allure.story("Rate Limiter")
+@pytest.mark.asyncio
+async def test_retries_are_bounded():
+    """Persistent 429s surface after max_retries."""
+    limiter = AdaptiveRateLimiter(default_backoff=0.0)
+    llm = RateLimitedLLM(FakeLLM(throttled_calls=10, latency=0), limiter=limiter, max_retries=1)
+    with pytest.raises(RateLimitError):
+        await llm.ainvoke("q")
+    assert limiter.rate_limited == 2 and limiter.in_flight == 0
+    print("✅ Test passed: Bounded retries")
+
+
+@allure.feature("Core")
+@allure.story("Rate Limiter")
+def test_evaluators_route_llm_through_limiter(tmp_path, monkeypatch):
+    """Evaluators wrap their LLM once, beneath any cache in front of it, without modifying it."""
+    backend = FakeLLM()
+    evaluator = FaithfulnessEvaluator(llm=backend)
+    assert isinstance(evaluator.llm, RateLimitedLLM)
+    assert with_rate_limit(evaluator.llm) is evaluator.llm
+
+    cached = CachedLLM(backend, DiskCache(str(tmp_path / "llm.sqlite")))
+    evaluator = FaithfulnessEvaluator(llm=cached)
+    assert isinstance(evaluator.llm, CachedLLM) and evaluator.llm.cache is cached.cache
+    assert isinstance(evaluator.llm.llm, RateLimitedLLM) and evaluator.llm.llm.llm is backend
+    assert cached.llm is backend
+
+    monkeypatch.setenv("EVAL_RATE_LIMIT", "0")
+    assert FaithfulnessEvaluator(llm=backend).llm is backend
+    print("✅ Test passed: Evaluators route through limiter")
@@ -0,0 +1,93 @@
+"""
+Test Evaluator Registry - Name Lookup and Lazy Loading
+"""
+
+import importlib
+import subprocess
+import sys
+import pytest
+import allure
+
+import evaluators
+from evaluators import registry
+
+
+@allure.feature("Core")
+@allure.story("Evaluator Registry")
+def test_registry_covers_all_evaluators_by_metric_name():
+    """Every registered factory builds an evaluator whose metric_name matches."""
+    names = evaluators.available()
+    assert len(names) == 29
+
+    for name in names:
+        evaluator = evaluators.get(name)
+        assert evaluator.metric_name == name, name
+    print(f"✅ Test passed: {len(names)} evaluators registered")
+
+
+@allure.feature("Core")
+@allure.story("Evaluator Registry")
+def test_get_forwards_factory_arguments():
+    """Keyword arguments are passed to the evaluator factory."""
+    evaluator = evaluators.get("factual_correctness", mode="precision", atomicity="low")
+    assert evaluator.mode == "precision"
+    assert evaluator.atomicity == "low"
+
+    with pytest.raises(ValueError):
+        evaluators.get("does_not_exist")
+    print("✅ Test passed: Factory arguments forwarded")
+
+
+@allure.feature("Core")
+@allure.story("Evaluator Registry")
+def test_importing_one_evaluator_loads_nothing_else():
+    """Importing one evaluator does not pull in other categories or modules."""
+    code = (
+        "import sys\n"
+        "import evaluators.natural_language_comparison.bleu_score_evaluator\n"
+        "print(sorted(m for m in sys.modules if m.startswith('evaluators')))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert eval(output) == [
+        "evaluators",
+        "evaluators.base",
+        "evaluators.natural_language_comparison",
+        "evaluators.natural_language_comparison.bleu_score_evaluator",
+        "evaluators.registry",
+    ]
+    print("✅ Test passed: Lazy loading")
+
+
+@allure.feature("Core")
+@allure.story("Evaluator Registry")
+def test_lazy_package_attributes():
+    """Package attributes resolve on first access and support star imports."""
+    from evaluators.sql_metrics import create_datacompy_score_evaluator
+
+    assert evaluators.sql_metrics.create_datacompy_score_evaluator is create_datacompy_score_evaluator
+    assert "create_sql_query_equivalence_evaluator" in dir(evaluators.sql_metrics)
+    assert registry.get_factory("exact_match").__name__ == "create_exact_match_evaluator"
+    with pytest.raises(AttributeError):
+        evaluators.not_an_export
+    print("✅ Test passed: Lazy attributes")
+
+
+@allure.feature("Core")
+@allure.story("Evaluator Registry")
+@pytest.mark.parametrize("package", [
+    "evaluators",
+    "evaluators.agents_and_tools",
+    "evaluators.natural_language_comparison",
+    "evaluators.nvidia_metrics",
+    "evaluators.retrieval_augmented_generation",
+    "evaluators.sql_metrics",
+    "evaluators.general_purpose_and_other_tasks",
+])
+def test_every_lazy_export_resolves(package):
+    """Every name in a package's _EXPORTS can be loaded from the package."""
+    module = importlib.import_module(package)
+    for name in module._EXPORTS:
+        assert getattr(module, name) is not None, name
+    print(f"✅ Test passed: {len(module._EXPORTS)} exports of {package}")
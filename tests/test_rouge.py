@@ -0,0 +1,93 @@
+"""
+Test ROUGE - Batch ROUGE-N and Bit-Parallel ROUGE-L Engine
+"""
+
+import random
+
+import pytest
+import allure
+
+from evaluators.bench import synthetic_samples
+from evaluators.natural_language_comparison.rouge import lcs_length, rouge_scores
+from evaluators.natural_language_comparison.rouge_score_evaluator import create_rouge_score_evaluator
+
+
+def dynamic_programming_lcs(a, b):
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+@allure.feature("Core")
+@allure.story("ROUGE")
+def test_bit_parallel_lcs_matches_dynamic_programming():
+    """The bit-vector LCS agrees with the quadratic recurrence, including long sequences."""
+    rng = random.Random(0)
+    for _ in range(300):
+        a = [rng.randrange(6) for _ in range(rng.randrange(0, 40))]
+        b = [rng.randrange(6) for _ in range(rng.randrange(0, 40))]
+        assert lcs_length(a, b) == dynamic_programming_lcs(a, b)
+
+    a = [rng.randrange(50) for _ in range(400)]
+    b = [rng.randrange(50) for _ in range(300)]
+    assert lcs_length(a, b) == dynamic_programming_lcs(a, b)
+    print("✅ Test passed: Bit-parallel LCS")
+
+
+@allure.feature("Core")
+@allure.story("ROUGE")
+def test_all_rouge_types_in_one_pass():
+    """ROUGE-1/2/L precision, recall and F-measure for a batch of pairs."""
+    scores = rouge_scores(
+        ["The cat sat on the mat.", "", "police killed the gunman"],
+        ["the cat was on the mat", "anything", "the gunman killed police"],
+    )
+
+    assert scores["rouge1"]["precision"][0] == pytest.approx(5 / 6)
+    assert scores["rouge2"]["recall"][0] == pytest.approx(3 / 5)
+    assert scores["rougeL"]["fmeasure"][0] == pytest.approx(5 / 6)
+    assert scores["rouge1"]["fmeasure"][1] == 0.0
+    # Same bag of words, different order: only ROUGE-L notices
+    assert scores["rouge1"]["fmeasure"][2] == pytest.approx(1.0)
+    assert scores["rougeL"]["fmeasure"][2] == pytest.approx(0.5)
+    print("✅ Test passed: ROUGE types")
+
+
+@allure.feature("Core")
+@allure.story("ROUGE")
+def test_tokenization_matches_rouge_score_on_non_ascii_text():
+    """Accented letters and other scripts split tokens exactly as in rouge_score."""
+    rouge_scorer = pytest.importorskip("rouge_score.rouge_scorer")
+
+    pairs = [
+        ("Le café était naïf", "le caf etait na f"),
+        ("Straße_zum Bahnhof 42", "strasse zum bahnhof 42"),
+        ("東京 is big", "tokyo is big"),
+    ]
+    scores = rouge_scores([h for h, _ in pairs], [r for _, r in pairs])
+    scorer = rouge_scorer.RougeScorer(["rouge1", "rougeL"])
+    for index, (hypothesis, reference) in enumerate(pairs):
+        expected = scorer.score(reference, hypothesis)
+        for rouge_type in ("rouge1", "rougeL"):
+            assert scores[rouge_type]["fmeasure"][index] == pytest.approx(expected[rouge_type].fmeasure)
+    print("✅ Test passed: rouge_score tokenization")
+
+
+@allure.feature("Core")
+@allure.story("ROUGE")
+@pytest.mark.asyncio
+async def test_evaluator_modes_and_multiple_references():
+    """The evaluator reports its mode, picks the best reference and batches identically."""
+    recall = create_rouge_score_evaluator(rouge_type="rougeL", mode="recall")
+    sample = {"response": "a b c", "reference": ["a", "a b c d"]}
+    assert await recall.evaluate(sample) == pytest.approx(0.75)
+
+    evaluator = create_rouge_score_evaluator(rouge_type="rouge2")
+    samples = synthetic_samples(25, seed=5)
+    single = [await evaluator.evaluate(s) for s in samples]
+    assert evaluator.evaluate_corpus(samples, chunk_size=4).tolist() == pytest.approx(single)
+    print("✅ Test passed: ROUGE evaluator")
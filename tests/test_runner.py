@@ -0,0 +1,101 @@
+"""
+Test Evaluation Runner - Multi-Evaluator Scheduling
+"""
+
+import asyncio
+import pytest
+import allure
+
+from evaluators.base import BaseEvaluator
+from evaluators.runner import EvaluationRunner
+
+
+class SlowEvaluator(BaseEvaluator):
+    """Sleeps, tracks concurrency and returns a fixed offset of the sample."""
+
+    def __init__(self, metric_name, offset, tracker):
+        self.metric_name = metric_name
+        self.offset = offset
+        self.tracker = tracker
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def evaluate(self, sample):
+        self.in_flight += 1
+        self.tracker["total"] += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["total"])
+        try:
+            await asyncio.sleep(0.002)
+            if sample == "bad":
+                raise RuntimeError("bad sample")
+            return sample + self.offset
+        finally:
+            self.in_flight -= 1
+            self.tracker["total"] -= 1
+
+
+@allure.feature("Core")
+@allure.story("Evaluation Runner")
+def test_runner_respects_global_and_per_evaluator_limits():
+    """Jobs from all evaluators overlap within the configured limits."""
+    tracker = {"total": 0, "peak": 0}
+    fast = SlowEvaluator("fast", 100, tracker)
+    slow = SlowEvaluator("slow", 200, tracker)
+
+    runner = EvaluationRunner(
+        [fast, slow],
+        max_concurrency=5,
+        per_evaluator_concurrency={"slow": 2},
+    )
+    results = runner.run(range(20))
+
+    assert [r["fast"].score for r in results] == [i + 100 for i in range(20)]
+    assert [r["slow"].score for r in results] == [i + 200 for i in range(20)]
+    assert tracker["peak"] <= 5
+    assert slow.peak_in_flight <= 2
+    assert fast.peak_in_flight > 2
+    print("✅ Test passed: Global and per-evaluator limits respected")
+
+
+@allure.feature("Core")
+@allure.story("Evaluation Runner")
+def test_evaluators_missing_from_limit_mapping_use_global_limit():
+    """An evaluator not named in per_evaluator_concurrency is bounded by max_concurrency alone."""
+    tracker = {"total": 0, "peak": 0}
+    fast = SlowEvaluator("fast", 100, tracker)
+    slow = SlowEvaluator("slow", 200, tracker)
+
+    runner = EvaluationRunner([fast, slow], max_concurrency=40, per_evaluator_concurrency={"slow": 2})
+    runner.run(range(60))
+
+    assert runner._limit_for("fast") == 40
+    assert fast.peak_in_flight > 16
+    assert slow.peak_in_flight <= 2
+    print("✅ Test passed: Missing mapping keys use the global limit")
+
+
+@allure.feature("Core")
+@allure.story("Evaluation Runner")
+def test_runner_captures_errors_and_reports_progress():
+    """Errors stay on their cell and on_result sees every job."""
+    tracker = {"total": 0, "peak": 0}
+    seen = []
+    runner = EvaluationRunner({"a": SlowEvaluator("x", 1, tracker)})
+
+    results = runner.run([1, "bad", 3], on_result=lambda i, name, r: seen.append((i, name)))
+
+    assert results[0]["a"].score == 2
+    assert isinstance(results[1]["a"].error, RuntimeError)
+    assert sorted(seen) == [(0, "a"), (1, "a"), (2, "a")]
+    print("✅ Test passed: Errors captured per job")
+
+
+@allure.feature("Core")
+@allure.story("Evaluation Runner")
+def test_runner_rejects_duplicate_names():
+    """Two instances with the same metric name need explicit names."""
+    tracker = {"total": 0, "peak": 0}
+    with pytest.raises(ValueError):
+        EvaluationRunner([SlowEvaluator("x", 1, tracker), SlowEvaluator("x", 2, tracker)])
+    print("✅ Test passed: Duplicate names rejected")
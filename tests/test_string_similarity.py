@@ -0,0 +1,92 @@
+"""
+Test String Similarity - Batched Similarity Matrices
+"""
+
+import random
+
+import numpy as np
+import pytest
+import allure
+
+from evaluators.natural_language_comparison import string_similarity
+from evaluators.natural_language_comparison.string_similarity import (
+    DISTANCE_MEASURES,
+    levenshtein_distance,
+    pairwise_similarity,
+    similarity_matrix,
+)
+from evaluators.natural_language_comparison.nonllm_string_similarity_evaluator import (
+    create_nonllm_string_similarity_evaluator,
+)
+from evaluators.retrieval_augmented_generation.context_precision_evaluator import create_context_precision_evaluator
+from evaluators.retrieval_augmented_generation.context_recall_evaluator import create_context_recall_evaluator
+
+
+def random_strings(rng, count):
+    return ["".join(rng.choice("abcd ") for _ in range(rng.randrange(0, 25))) for _ in range(count)]
+
+
+@allure.feature("Core")
+@allure.story("String Similarity")
+def test_bit_parallel_levenshtein_matches_dynamic_programming():
+    """Myers' bit-vector distance agrees with the textbook recurrence."""
+    def reference(a, b):
+        previous = list(range(len(b) + 1))
+        for i, x in enumerate(a, 1):
+            current = [i]
+            for j, y in enumerate(b, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+            previous = current
+        return previous[-1]
+
+    rng = random.Random(0)
+    for a, b in zip(random_strings(rng, 300), random_strings(rng, 300)):
+        assert levenshtein_distance(a, b) == reference(a, b)
+    assert levenshtein_distance("kitten", "sitting") == 3
+    print("✅ Test passed: Levenshtein distance")
+
+
+@allure.feature("Core")
+@allure.story("String Similarity")
+@pytest.mark.parametrize("measure", DISTANCE_MEASURES)
+def test_fallback_matches_rapidfuzz_and_applies_cutoff(measure, monkeypatch):
+    """The pure Python path gives the rapidfuzz scores; scores under the cutoff become 0."""
+    rng = random.Random(1)
+    queries, choices = random_strings(rng, 12), random_strings(rng, 5)
+
+    fallback = similarity_matrix(queries, choices, measure)
+    if string_similarity.rapidfuzz_process is not None:
+        assert similarity_matrix(queries, choices, measure) == pytest.approx(fallback, abs=1e-6)
+        monkeypatch.setattr(string_similarity, "rapidfuzz_process", None)
+        fallback = similarity_matrix(queries, choices, measure)
+
+    cut = similarity_matrix(queries, choices, measure, score_cutoff=0.6)
+    assert fallback.shape == (12, 5)
+    assert np.array_equal(cut, np.where(fallback >= 0.6, fallback, 0))
+    assert pairwise_similarity(queries[:5], choices, measure) == pytest.approx(np.diag(fallback[:5]), abs=1e-6)
+    print("✅ Test passed: Similarity matrix")
+
+
+@allure.feature("Core")
+@allure.story("String Similarity")
+@pytest.mark.asyncio
+async def test_non_llm_evaluators_use_similarity_matrices():
+    """String similarity, non-LLM context precision and recall score from the matrices."""
+    sample = {
+        "response": "Paris is the capital of France.",
+        "reference": "The capital of France is Paris.",
+        "retrieved_contexts": ["Berlin is in Germany.", "Paris is the capital of France.", "Paris is in Europe"],
+        "reference_contexts": ["Paris is the capital of France", "Paris lies in Europe"],
+    }
+    similarity = create_nonllm_string_similarity_evaluator()
+    assert 0 < await similarity.evaluate(sample) < 1
+    assert similarity.evaluate_corpus([sample, sample]).tolist() == pytest.approx([await similarity.evaluate(sample)] * 2)
+
+    precision = create_context_precision_evaluator(metric_type="non_llm", threshold=0.7)
+    # Relevant at ranks 2 and 3: (1/2 + 2/3) / 2
+    assert await precision.evaluate(sample) == pytest.approx((1 / 2 + 2 / 3) / 2)
+
+    recall = create_context_recall_evaluator(metric_type="non_llm", threshold=0.7)
+    assert await recall.evaluate(sample) == pytest.approx(1.0)
+    assert await recall.evaluate({**sample, "retrieved_contexts": sample["retrieved_contexts"][:2]}) == pytest.approx(0.5)
+    print("✅ Test passed: Non-LLM evaluators")
@@ -0,0 +1,117 @@
+"""
+Test Tool Calls - Encoding and Batch Multiset F1
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+import allure
+
+from evaluators.agents_and_tools.tool_calls import ToolCallEncoder, canonical_arguments, tool_call_alignment, tool_call_f1
+from evaluators.agents_and_tools.tool_call_accuracy_evaluator import create_tool_call_accuracy_evaluator
+from evaluators.agents_and_tools.tool_call_f1_evaluator import create_tool_call_f1_evaluator
+
+
+DATA = Path(__file__).resolve().parent.parent / "data" / "agents_and_tools" / "tool_call_f1.jsonl"
+
+
+def _counter_f1(predicted, reference):
+    matches = sum((Counter(predicted) & Counter(reference)).values())
+    precision = matches / len(predicted) if predicted else 0.0
+    recall = matches / len(reference) if reference else 0.0
+    return 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+
+@allure.feature("Core")
+@allure.story("Tool Calls")
+def test_canonical_arguments_ignore_key_order_and_number_format():
+    """Equal arguments get equal ids however they were serialized."""
+    assert canonical_arguments({"b": 1.0, "a": "x"}) == canonical_arguments('{"a": "x", "b": 1}')
+    assert canonical_arguments({"a": 1.5}) != canonical_arguments({"a": 1})
+
+    encoder = ToolCallEncoder(with_arguments=True)
+    ids, offsets = encoder.encode([
+        [{"name": "search", "args": {"q": "paris", "n": 3}}],
+        [{"name": "search", "arguments": '{"n": 3.0, "q": "paris"}'}, "search"],
+    ])
+    assert ids.tolist() == [0, 0, 1] and offsets.tolist() == [0, 1, 3]
+    print("✅ Test passed: Canonical arguments")
+
+
+@allure.feature("Core")
+@allure.story("Tool Calls")
+def test_batch_f1_matches_counter_reference_on_dataset():
+    """Vectorized multiset counting agrees with collections.Counter per trace."""
+    rows = [json.loads(line) for line in DATA.read_text().splitlines() if line.strip()]
+    predicted = [row["tool_calls"] for row in rows] + [[], ["a", "a", "b"]]
+    reference = [row["expected_tool_calls"] for row in rows] + [["a"], ["a", "b", "b"]]
+
+    result = tool_call_f1(predicted, reference)
+    expected = [_counter_f1(p, r) for p, r in zip(predicted, reference)]
+    assert result["f1"].tolist() == pytest.approx(expected)
+    assert result["macro_f1"] == pytest.approx(sum(expected) / len(expected))
+    # Duplicates count once per occurrence on both sides: 2 of 3 calls match
+    assert result["precision"][-1] == pytest.approx(2 / 3)
+    assert 0.0 < result["micro_f1"] <= 1.0
+    print("✅ Test passed: Batch tool call F1")
+
+
+@allure.feature("Core")
+@allure.story("Tool Calls")
+@pytest.mark.asyncio
+async def test_evaluator_argument_matching_and_corpus_mode():
+    """with_arguments separates calls to the same tool; per-sample and corpus scores agree."""
+    samples = [
+        {
+            "tool_calls": [{"name": "weather", "args": {"city": "Paris"}}],
+            "reference_tool_calls": [{"name": "weather", "args": {"city": "Rome"}}],
+        },
+        {"tool_calls": ["search_hotels", "get_time"], "expected_tool_calls": ["search_hotels"]},
+    ]
+    by_name = create_tool_call_f1_evaluator()
+    by_call = create_tool_call_f1_evaluator(with_arguments=True)
+    assert await by_name.evaluate(samples[0]) == 1.0
+    assert await by_call.evaluate(samples[0]) == 0.0
+
+    single = [await by_name.evaluate(s) for s in samples]
+    assert by_name.evaluate_corpus(samples)["f1"].tolist() == pytest.approx(single)
+    assert single[1] == pytest.approx(2 / 3)
+    print("✅ Test passed: Tool call F1 evaluator")
+
+
+@allure.feature("Core")
+@allure.story("Tool Calls")
+def test_alignment_strict_and_any_order():
+    """Strict order counts the LCS of call ids; any order counts the multiset overlap."""
+    predicted = [["b", "a", "c"], [], [], [{"tool": "get_weather", "params": {"location": "Los Angeles"}}]]
+    reference = [["a", "b", "c"], [], ["a"], [{"name": "get_weather", "args": {"location": "New York"}}]]
+
+    strict = tool_call_alignment(predicted, reference)
+    assert strict["matched"].tolist() == [2, 0, 0, 0]
+    assert strict["distance"].tolist() == [2, 0, 1, 2]
+    assert strict["accuracy"].tolist() == pytest.approx([2 / 3, 1.0, 0.0, 0.0])
+
+    loose = tool_call_alignment(predicted, reference, strict_order=False, with_arguments=False)
+    assert loose["matched"].tolist() == [3, 0, 0, 1]
+    assert loose["mean_accuracy"] == pytest.approx(0.75)
+    print("✅ Test passed: Tool call alignment")
+
+
+@allure.feature("Core")
+@allure.story("Tool Calls")
+@pytest.mark.asyncio
+async def test_accuracy_evaluator_scores_long_traces():
+    """Per-sample and corpus scores agree, including a 1k-call trace."""
+    trace = [{"name": f"tool_{i % 7}", "args": {"step": i}} for i in range(1000)]
+    samples = [
+        {"tool_calls": ["get_weather"], "expected_tools": ["get_weather"]},
+        {"tool_calls": ["calculate_math"], "expected_tools": ["get_weather"]},
+        {"tool_calls": trace, "reference_tool_calls": trace[:500] + [{"name": "other"}] + trace[500:]},
+    ]
+    evaluator = create_tool_call_accuracy_evaluator()
+    single = [await evaluator.evaluate(s) for s in samples]
+    assert single == pytest.approx([1.0, 0.0, 1000 / 1001])
+    assert evaluator.evaluate_corpus(samples)["accuracy"].tolist() == pytest.approx(single)
+    print("✅ Test passed: Tool call accuracy evaluator")
@@ -0,0 +1,137 @@
+"""
+Test Topic Filter - Embedding Pre-Filter for Topic Adherence
+"""
+
+import pytest
+import allure
+
+from evaluators.agents_and_tools.topic_filter import adherence_scores, classify_turns, conversation_turns
+from evaluators.agents_and_tools.topic_adherence_evaluator import TopicAdherenceEvaluator
+
+
+AXES = ("billing", "weather", "pasta")
+
+
+class KeywordEmbeddings:
+    """Embeds texts on one axis per keyword, so similarities are known exactly."""
+
+    def __init__(self):
+        self.texts = []
+
+    async def aembed_documents(self, texts):
+        self.texts.extend(texts)
+        vectors = []
+        for text in texts:
+            words = text.lower().split()
+            vectors.append([float(words.count(axis)) for axis in AXES])
+        return vectors
+
+
+class CountingEvaluator(TopicAdherenceEvaluator):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.asked = []
+
+    async def _classify_turn(self, text, topics):
+        self.asked.append(text)
+        return "invoice" in text
+
+
+@allure.feature("Core")
+@allure.story("Topic Adherence")
+def test_conversation_turns_and_scores():
+    """Human messages open turns; refused on-topic turns cost recall, answered off-topic turns precision."""
+    messages = [
+        {"role": "user", "content": "Why is my bill high?"},
+        {"role": "assistant", "content": "Your plan changed."},
+        {"role": "tool", "content": "{}"},
+        {"type": "human", "content": "Tell me a joke"},
+        {"type": "ai", "content": "Sure."},
+    ]
+    assert conversation_turns(messages) == [("Why is my bill high?", "Your plan changed."), ("Tell me a joke", "Sure.")]
+    assert conversation_turns("Hi", "Hello") == [("Hi", "Hello")]
+
+    scores = adherence_scores(on_topic=[True, True, False], answered=[True, False, True])
+    assert scores["precision"] == pytest.approx(0.5)
+    assert scores["recall"] == pytest.approx(0.5)
+    assert scores["f1"] == pytest.approx(0.5)
+    print("✅ Test passed: Turns and scores")
+
+
+@allure.feature("Core")
+@allure.story("Topic Adherence")
+@pytest.mark.asyncio
+async def test_only_ambiguous_turns_reach_the_judge():
+    """Confident similarities are decided locally; duplicates are embedded and judged once."""
+    asked = []
+
+    async def judge(text, topics):
+        asked.append(text)
+        return True
+
+    texts = ["billing billing billing", "pasta pasta pasta", "billing pasta", "billing pasta", "nothing"]
+    topics = [("billing",)] * len(texts)
+    embeddings = KeywordEmbeddings()
+    on_topic, judged = await classify_turns(texts, topics, judge, embeddings=embeddings, lower=0.3, upper=0.8)
+    assert on_topic.tolist() == [True, False, True, True, False]
+    assert judged.tolist() == [False, False, True, True, False]
+    assert asked == ["billing pasta"]
+    assert len(embeddings.texts) == 5  # 4 distinct turns + 1 topic
+
+    asked.clear()
+    on_topic, judged = await classify_turns(texts, topics, judge)
+    assert judged.all() and len(asked) == 4
+    print("✅ Test passed: Pre-filter")
+
+
+@allure.feature("Core")
+@allure.story("Topic Adherence")
+@pytest.mark.asyncio
+async def test_evaluator_reports_all_modes_in_one_pass():
+    """The corpus pass reports precision, recall and F1 and counts judge calls."""
+    samples = [
+        {
+            "user_input": [
+                {"role": "user", "content": "billing question about billing"},
+                {"role": "assistant", "content": "Here is your billing answer."},
+                {"role": "user", "content": "pasta pasta recipe"},
+                {"role": "assistant", "content": "Boil the pasta."},
+                {"role": "user", "content": "billing invoice pasta"},
+                {"role": "assistant", "content": "Sorry, I can't help with that."},
+            ],
+            "reference_topics": ["billing"],
+        },
+        {"topic": "weather", "response": "weather weather today"},
+    ]
+    evaluator = CountingEvaluator(embeddings=KeywordEmbeddings(), lower=0.3, upper=0.8)
+    result = await evaluator.aevaluate_corpus(samples)
+    assert evaluator.asked == ["billing invoice pasta"]
+    assert result["judged"] == 1 and result["prefiltered"] == 3
+    # Turn 3 is on-topic but refused; turn 2 is answered but off-topic
+    assert result["precision"].tolist() == pytest.approx([0.5, 1.0])
+    assert result["recall"].tolist() == pytest.approx([0.5, 1.0])
+    assert await evaluator.evaluate(samples[1]) == 1.0
+    print("✅ Test passed: Topic adherence evaluator")
+
+
+@allure.feature("Core")
+@allure.story("Topic Adherence")
+@pytest.mark.asyncio
+async def test_off_topic_turn_is_not_scored_without_a_verdict():
+    """An off-topic turn scores 0; a judge without a verdict raises instead of scoring."""
+    from evaluators.incremental import evaluator_fingerprint
+
+    class OffTopicJudge(TopicAdherenceEvaluator):
+        async def _classify_turn(self, text, topics):
+            return False
+
+    sample = {"user_input": "how do I bake bread?", "response": "Knead the dough.", "reference_topics": ["tax law"]}
+    evaluator = OffTopicJudge()
+    fingerprint = evaluator_fingerprint(evaluator)
+    result = await evaluator.aevaluate_corpus([sample])
+    assert result["precision"].tolist() == [0.0] and result["judged"] == 1
+    assert evaluator_fingerprint(evaluator) == fingerprint
+
+    with pytest.raises(ValueError, match="no verdict"):
+        await TopicAdherenceEvaluator().evaluate(sample)
+    print("✅ Test passed: Missing topic verdict")
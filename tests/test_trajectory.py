@@ -0,0 +1,89 @@
+"""
+Test Trajectory - Compaction of Agent Traces for Judge Prompts
+"""
+
+import json
+
+import pytest
+import allure
+
+from evaluators.cache import DiskCache
+from evaluators.agents_and_tools.trajectory import (
+    TrajectoryCompactor, approx_tokens, clean_tool_output, render_trajectory,
+)
+from evaluators.agents_and_tools.agent_goal_accuracy_evaluator import create_agent_goal_accuracy_evaluator
+
+
+def _trace(blob):
+    return [
+        {"role": "user", "content": "Find me a flight to Paris and book the cheapest one"},
+        {"role": "assistant", "content": "", "tool_calls": [{"name": "search", "args": {"to": "CDG"}}]},
+        {"role": "tool", "content": blob},
+        {"role": "assistant", "content": "Let me check again."},
+        {"role": "tool", "content": blob},
+        {"role": "assistant", "content": "Booked flight AF12 for $420."},
+    ]
+
+
+@allure.feature("Core")
+@allure.story("Trajectory Compaction")
+def test_tool_outputs_are_cleaned_deduplicated_and_truncated():
+    """JSON is minified, HTML reduced to text, repeats referenced, long outputs cut in the middle."""
+    assert clean_tool_output('{\n  "a": [1, 2],\n  "b": "x"\n}') == '{"a":[1,2],"b":"x"}'
+    assert clean_tool_output("<html><script>x()</script><p>Hi &amp; bye</p></html>") == "Hi & bye"
+
+    blob = json.dumps({"flights": [{"id": i, "price": 400 + i} for i in range(500)]}, indent=2)
+    compacted = TrajectoryCompactor(max_tokens=None, max_tool_chars=300).compact(_trace(blob))
+    assert [m["role"] for m in compacted] == ["human", "ai", "tool", "ai", "tool", "ai"]
+    assert compacted[1]["content"] == '[call search({"to":"CDG"})]'
+    assert len(compacted[2]["content"]) < 350 and "chars omitted" in compacted[2]["content"]
+    assert compacted[4]["content"] == "[same output as message 3]"
+    print("✅ Test passed: Tool output cleaning")
+
+
+@allure.feature("Core")
+@allure.story("Trajectory Compaction")
+def test_budget_keeps_goal_turns_and_cache_reuses_compactions(tmp_path):
+    """Over budget, tool and intermediate messages go first; the request and final answer stay."""
+    blob = " ".join(f"row{i}" for i in range(5000))
+    compactor = TrajectoryCompactor(max_tokens=40, max_tool_chars=2000, min_tool_chars=100,
+                                    cache=DiskCache(str(tmp_path / "trajectories.sqlite")))
+    compacted = compactor.compact(_trace(blob))
+    text = render_trajectory(compacted)
+    assert text.startswith("Human: Find me a flight") and text.endswith("AI: Booked flight AF12 for $420.")
+    assert "omitted]" in text
+    assert sum(approx_tokens(render_trajectory([m])) for m in compacted) <= 40
+    assert compactor.tokens_out < compactor.tokens_in / 10
+
+    assert compactor.compact(_trace(blob)) == compacted and compactor.hits == 1
+    fresh = TrajectoryCompactor(max_tokens=40, max_tool_chars=2000, min_tool_chars=100, cache=compactor.cache)
+    assert fresh.compact(_trace(blob)) == compacted and fresh.misses == 0
+    print("✅ Test passed: Token budget and cache")
+
+
+@allure.feature("Core")
+@allure.story("Trajectory Compaction")
+def test_evaluator_builds_compacted_trajectory():
+    """Plain goal/response samples and message lists both become transcripts."""
+    evaluator = create_agent_goal_accuracy_evaluator(max_tokens=60, max_tool_chars=200)
+    assert evaluator.trajectory({"goal": "Add 2 + 2", "response": "4"}) == "Human: Add 2 + 2\nAI: 4"
+    transcript = evaluator.trajectory({"user_input": _trace("x" * 10_000)})
+    assert len(transcript) < 600 and transcript.endswith("AI: Booked flight AF12 for $420.")
+    print("✅ Test passed: Goal accuracy trajectory")
+
+
+@allure.feature("Core")
+@allure.story("Trajectory Compaction")
+def test_every_compaction_setting_reaches_the_fingerprint():
+    """Compactors differing in any setting give evaluators different fingerprints."""
+    from evaluators.incremental import evaluator_fingerprint
+
+    def fingerprint(**settings):
+        return evaluator_fingerprint(create_agent_goal_accuracy_evaluator(compactor=TrajectoryCompactor(**settings)))
+
+    base = fingerprint()
+    assert fingerprint() == base
+    assert fingerprint(min_tool_chars=50) != base
+    assert fingerprint(deduplicate=False) != base
+    assert fingerprint(count_tokens=len) != base
+    print("✅ Test passed: Compaction settings fingerprinted")